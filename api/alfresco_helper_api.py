@@ -1,13 +1,17 @@
+from __future__ import annotations
+
 from abc import ABC
+from typing import TYPE_CHECKING
 
-from api.mvc.controller.aspect.aspect_controller import AspectController
-from api.mvc.controller.content_model.content_model_controller import ContentModelController
-from api.mvc.controller.project.project_controller import ProjectController
-from api.mvc.controller.property.property_controller import PropertyController
-from api.mvc.controller.type.type_controller import TypeController
-from api_core.exception.api_exception import ApiException
 from api_core.api import Api
 
+if TYPE_CHECKING:
+    from api.mvc.controller.aspect.aspect_controller import AspectController
+    from api.mvc.controller.content_model.content_model_controller import ContentModelController
+    from api.mvc.controller.project.project_controller import ProjectController
+    from api.mvc.controller.property.property_controller import PropertyController
+    from api.mvc.controller.type.type_controller import TypeController
+
 
 class AlfrescoHelperApi(Api, ABC):
     """
@@ -19,8 +23,22 @@ class AlfrescoHelperApi(Api, ABC):
 
     def init_controllers(self):
         """
-        Initialize the list of controllers
+        Initialize the list of controllers. They are built (and their modules imported) on the first use of one of
+        them, so that a command failing its validation does not pay for them.
+        """
+        for name in ["project", "model", "aspect", "type", "property"]:
+            self.service.register(name, self.__build_controllers)
+
+    def __build_controllers(self):
+        """
+        Builds the controllers, which depend on each other, and adds them to the controller service.
         """
+        from api.mvc.controller.aspect.aspect_controller import AspectController
+        from api.mvc.controller.content_model.content_model_controller import ContentModelController
+        from api.mvc.controller.project.project_controller import ProjectController
+        from api.mvc.controller.property.property_controller import PropertyController
+        from api.mvc.controller.type.type_controller import TypeController
+
         pc: ProjectController = ProjectController()
         cmc: ContentModelController = ContentModelController(pc, self.template_folder)
         ac: AspectController = AspectController(pc, cmc)
@@ -31,6 +49,8 @@ class AlfrescoHelperApi(Api, ABC):
         pc.aspect_controller = ac
 
         cmc.aspect_controller = ac
+        cmc.property_controller = ppc
+        cmc.type_controller = tc
         ac.set_property_controller(ppc)
         tc.set_property_controller(ppc)
 
@@ -40,148 +60,16 @@ class AlfrescoHelperApi(Api, ABC):
         self.service.add(tc)
         self.service.add(ppc)
 
-    def _execute(self, controller: str, command: str, arguments: list[str]):
-        """
-        Execute the command.
-        :param controller: The name of the controller.
-        :param command: The name of the command.
-        :param arguments: The list of arguments.
-        """
-        if controller.__eq__("project"):
-            self.__execute_project_command(command, arguments)
-        elif controller.__eq__("model"):
-            self.__execute_model_command(command, arguments)
-        elif controller.__eq__("aspect"):
-            self.__execute_aspect_command(command, arguments)
-        elif controller.__eq__("type"):
-            self.__execute_type_command(command, arguments)
-        elif controller.__eq__("property"):
-            self.__execute_property_command(command, arguments)
-
-    def __execute_property_command(self, command: str, arguments: list[str]):
-        """
-        Interpret the command for a property.
-        :param command: The name of the command.
-        :param arguments: The list of arguments.
-        """
-        controller: PropertyController = self.service.get("property")
-
-        # Create a new content-model.
-        if command.__eq__("new"):
-            controller.new(arguments[0], arguments[1])
-
-        # Access to the model commands manual.
-        elif command.__eq__("man"):
-            if len(arguments).__eq__(1):
-                controller.man(arguments[0])
-            elif len(arguments).__eq__(0):
-                controller.man()
-        else:
-            raise ApiException("The command '{0}_{1}' has been defined but not implemented.".format(command, "project"))
-
-    def __execute_type_command(self, command: str, arguments: list[str]):
-        """
-        Interpret the command for a type.
-        :param command: The name of the command.
-        :param arguments: The list of arguments.
-        """
-        controller: TypeController = self.service.get("type")
-
-        # Create a new content-model.
-        if command.__eq__("new"):
-            controller.new(arguments[0])
-
-        elif command.__eq__("extend"):
-            controller.extend(arguments[0], arguments[1], arguments[2])
-
-        elif command.__eq__("mandatory"):
-            controller.mandatory(arguments[0], arguments[1], arguments[2])
-
-        # Access to the model commands manual.
-        elif command.__eq__("man"):
-            if len(arguments).__eq__(1):
-                controller.man(arguments[0])
-            elif len(arguments).__eq__(0):
-                controller.man()
-        else:
-            raise ApiException("The command '{0}_{1}' has been defined but not implemented.".format(command, "project"))
-
-    def __execute_aspect_command(self, command: str, arguments: list[str]):
-        """
-        Interpret the command for an aspect.
-        :param command: The name of the command.
-        :param arguments: The list of arguments.
-        """
-        controller: AspectController = self.service.get("aspect")
-
-        # Create a new content-model.
-        if command.__eq__("new"):
-            controller.new(arguments[0])
-
-        elif command.__eq__("extend"):
-            controller.extend(arguments[0], arguments[1], arguments[2])
-
-        elif command.__eq__("mandatory"):
-            controller.mandatory(arguments[0], arguments[1], arguments[2])
-
-        # Access to the model commands manual.
-        elif command.__eq__("man"):
-
-            if len(arguments).__eq__(1):
-                controller.man(arguments[0])
-
-            elif len(arguments).__eq__(0):
-                controller.man()
-
-        else:
-            raise ApiException("The command '{0}_{1}' has been defined but not implemented.".format(command, "project"))
-
-    def __execute_model_command(self, command: str, arguments: list[str]):
+    def _begin_batch(self):
         """
-        Interpret the command for a content-model.
-        :param command: The name of the command.
-        :param arguments: The list of arguments.
+        Defers the generation of the project files to the end of the batch.
         """
-        controller: ContentModelController = self.service.get("model")
-
-        # Create a new content-model.
-        if command.__eq__("new"):
-            controller.new()
-
-        # Access to the model commands manual.
-        elif command.__eq__("man"):
-            if len(arguments).__eq__(1):
-                controller.man(arguments[0])
-            elif len(arguments).__eq__(0):
-                controller.man()
-        else:
-            raise ApiException("The command '{0}_{1}' has been defined but not implemented.".format(command, "project"))
+        controller: ProjectController = self.service.get("project")
+        controller.begin_batch()
 
-    def __execute_project_command(self, command: str, arguments: list[str]):
+    def _end_batch(self):
         """
-        Interpret the command for a project.
-        :param command: The name of the command.
-        :param arguments: The list of arguments.
+        Generates the project files once for all the commands of the batch.
         """
         controller: ProjectController = self.service.get("project")
-
-        # Create a new project.
-        if command.__eq__("new"):
-            controller.new()
-
-        elif command.__eq__("load"):
-            controller.load()
-
-        elif command.__eq__("raz"):
-            controller.raz()
-
-        # Access to the project orders manual.
-        elif command.__eq__("man"):
-
-            if len(arguments).__eq__(1):
-                controller.man(arguments[0])
-
-            elif len(arguments).__eq__(0):
-                controller.man()
-        else:
-            raise ApiException("The command '{0}_{1}' has been defined but not implemented.".format(command, "project"))
+        controller.end_batch()
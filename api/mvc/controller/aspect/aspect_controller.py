@@ -30,11 +30,15 @@ class AspectController(DataController, IAspectController, ABC):
         :param cmc: A content-model controller.
         """
         super().__init__("aspect", AspectService(), AspectView(ConstantHelper.SCREEN_SIZE), pc, cmc)
+        self._register("new", lambda positionals, options: self.new(positionals[0], options))
+        self._register("extend", lambda positionals, options: self.extend(*positionals))
+        self._register("mandatory", lambda positionals, options: self.mandatory(*positionals))
 
-    def new(self, content_model_name: str):
+    def new(self, content_model_name: str, options: Optional[dict[str, str | bool]] = None):
         """
-        Attempts to create a new aspect.
+        Attempts to create new aspects. The aspect data are asked to the user unless they are given by the options.
         :param content_model_name: The full name of the content model.
+        :param options: The options of the command: the aspect fields or a JSON document of aspects.
         """
         view: AspectView = self._view
         service: AspectService = self._service
@@ -42,22 +46,42 @@ class AspectController(DataController, IAspectController, ABC):
         project: ProjectModel = self._pc.get_project()
         content_model: ContentModel = self._cmc.get_content_model(project, content_model_name)
 
-        view.info("Creating a new aspect")
-        (name, title, description) = view.enter_aspect_data()
-
+        entries: Optional[list[dict[str, str | bool]]] = self._read_entries(
+            {} if options is None else options, ["name", "title", "description"])
+
+        # The content model file is written once for all the aspects.
+        with service.session():
+            if entries is None:
+                view.info("Creating a new aspect")
+                (name, title, description) = view.enter_aspect_data()
+                self.__new(service, content_model, name, title, description)
+            else:
+                for entry in entries:
+                    self.__new(service, content_model, entry["name"], entry["title"], entry["description"])
+        self._pc.update(content_model)
+
+    def __new(self, service: AspectService, content_model: ContentModel, name: str, title: str, description: str):
+        """
+        Creates a new aspect.
+        :param service: The aspect service.
+        :param content_model: The content model of the aspect.
+        :param name: The aspect name.
+        :param title: The aspect title.
+        :param description: The aspect description.
+        """
         self.__check_name(name)
 
         if self._cmfs.find_aspect(content_model, name) is not None:
             raise ApiException("There is already an aspect of the name '{0}' in the content model '{1}'."
                                .format(name, content_model.complete_name))
 
-        if self._cmfs.find_aspect(content_model, name) is not None:
+        if self._cmfs.find_type(content_model, name) is not None:
             raise ApiException("There is already a type of the name '{0}' in the content model '{1}'."
                                .format(name, content_model.complete_name))
 
         service.new(content_model, name, title, description)
-        view.success("Aspect '{0}' was successfully created in content model '{1}'.".format(name, content_model_name))
-        self._pc.load()
+        self._view.success("Aspect '{0}' was successfully created in content model '{1}'."
+                           .format(name, content_model.complete_name))
 
     def extend(self, content_model_name: str, aspect_name: str, parent_aspect_name: str):
         """
@@ -67,6 +91,7 @@ class AspectController(DataController, IAspectController, ABC):
         :param parent_aspect_name:The name of the parent type.
         """
         project: ProjectModel = self._pc.get_project()
+        self._cmc.check_data(project, content_model_name, [DataType.ASPECT.value], [aspect_name, parent_aspect_name])
         content_model: ContentModel = self._cmc.get_content_model(project, content_model_name)
         self._view.info("Extended aspect '{0}' to aspect '{1}'.".format(aspect_name, parent_aspect_name))
         self._extend(content_model, DataType.ASPECT.value, aspect_name, parent_aspect_name)
@@ -83,6 +108,7 @@ class AspectController(DataController, IAspectController, ABC):
         self._view.info("Add aspect '{0}' to the list of mandatory aspects of aspect '{1}'."
                         .format(mandatory_aspect_name, aspect_name))
         project: ProjectModel = self._pc.get_project(None, False)
+        self._cmc.check_data(project, content_model_name, [DataType.ASPECT.value], [aspect_name, mandatory_aspect_name])
         content_model: ContentModel = self._cmc.get_content_model(project, content_model_name, False)
         self._add_mandatory(content_model, DataType.ASPECT.value, aspect_name, mandatory_aspect_name)
         self._view.success("Aspect '{0}' was successfully added to the list of required aspects for aspect '{1}'."
@@ -160,73 +186,32 @@ class AspectController(DataController, IAspectController, ABC):
         # Return of the result.
         return result
 
-    def _check_mandatory_aspects(self, content_model: ContentModel, source: str, complete_name: Optional[str],
-                                 ancestors: list[str], mandatory: list[str]) -> list[str]:
-        """
-        Check the mandatory aspects of the agent.
-        :param content_model: The aspect's content-model.
-        :param source: The name of the source aspect.
-        :param complete_name: The full name of the aspect.
-        :param ancestors: The list of ancestors of the source aspect.
-        :param mandatory: The list of current mandatory aspects.
-        :return: The list of mandatory aspects.
-        """
-        if complete_name is None:
-            mandatory.pop(0)
-            return mandatory
-
-        name: str = complete_name.rsplit(":", 1)[1]
-        if self._cmfs.find_aspect(content_model, name) is None:
-            raise ApiException(
-                "Aspect '{0}' has a required aspect '{1}' which does not exist in content model '{2}' "
-                "in file '{3}'.".format(mandatory[len(mandatory) - 1], name, content_model.complete_name,
-                                        FileFolderHelper.extract_filename_from_path(content_model.path)))
-
-        if ancestors.count(name).__gt__(0):
-            raise ApiException(
-                "The aspect '{0}' is declared in the ancestors of the aspect '{0}'. It cannot therefore"
-                " be one of its mandatory aspects (direct or by inheritance)."
-                .format(name, source))
-
-        if mandatory.count(name).__gt__(0):
-            raise ApiException("Aspect '{0}' appears twice in the list of mandatory aspects of aspect '{1}' (by "
-                               "inheritance or directly).".format(name, source))
-
-        mandatory.append(name)
-        if len(ancestors).__gt__(1):
-            mandatory_ancestors: list[str] = self.__check_ancestors(content_model, DataType.ASPECT.name, name,
-                                                                    complete_name, [])
-            for mandatory_ancestor in mandatory_ancestors:
-                if ancestors.count(mandatory_ancestor).__gt__(0) or mandatory.count(mandatory_ancestor).__gt__(0):
-                    raise ApiException(
-                        "Aspect '{0}' appears twice in the list of mandatory aspects of aspect '{1}' "
-                        "(by inheritance or directly) by aspect '{2}'."
-                        .format(mandatory_ancestor, source, name))
-                mandatory.append(mandatory_ancestor)
-
-        for mandatory_aspect in self._cmfs.get_aspect_mandatory_aspects(content_model, name):
-            self._check_mandatory_aspects(content_model, source, mandatory_aspect, ancestors, mandatory)
-
-        return mandatory
-
     def add_aspect_in_share_config_file(self, project: ProjectModel, content_model: ContentModel, aspect: AspectModel):
         service: AspectService = self._service
         self._view.info("Added '{0}' aspect in 'share-config-custom.xml' file.".format(aspect.name), True)
         service.add_aspect_in_share_config_file(project, content_model, aspect)
         self._view.success("Added aspect '{0}' in 'share-config-custom.xml' file successfully.".format(aspect.name))
 
-    def add_aspect_properties_in_share_config_file(self, project: ProjectModel, aspect: AspectModel):
+    def add_aspect_properties_in_share_config_file(self, project: ProjectModel, content_model: ContentModel,
+                                                   aspect: AspectModel):
         service: AspectService = self._service
         self._view.info("Add '{0}' properties aspect in 'share-config-custom.xml' file.".format(aspect.name),
                         len(aspect.properties).__eq__(0))
         if len(aspect.properties).__gt__(0):
-            service.add_properties_aspect_in_share_config_file(self._prc, project, aspect)
+            service.add_properties_aspect_in_share_config_file(self._prc, project, content_model, aspect)
             self._view.success("Added '{0}' properties aspect in 'share-config-custom.xml' file successfully."
                                .format(aspect.complete_name))
         else:
             self._view.warning("No properties of aspect '{0}' have been added to the file 'share-config-custom.xml'"
                                " because the aspect does not have any.".format(aspect.complete_name))
 
+    def check_aspect_name(self, name: str):
+        """
+        Verifies that an aspect name is valid; otherwise it throws an ApiException.
+        :param name: The aspect name.
+        """
+        self.__check_name(name)
+
     @staticmethod
     def __check_name(value: str):
         """
@@ -31,13 +31,22 @@ class IAspectController(ABC):
         """
         pass
 
+    @abstractmethod
+    def check_aspect_name(self, name: str):
+        """
+        Verifies that an aspect name is valid; otherwise it throws an ApiException.
+        :param name: The aspect name.
+        """
+        pass
+
     @abstractmethod
     def add_aspect_in_share_config_file(self, project: ProjectModel, content_model: ContentModel,
                                         aspect: AspectModel):
         pass
 
     @abstractmethod
-    def add_aspect_properties_in_share_config_file(self, project: ProjectModel, aspect: AspectModel):
+    def add_aspect_properties_in_share_config_file(self, project: ProjectModel, content_model: ContentModel,
+                                                   aspect: AspectModel):
         pass
 
     def get_aspect_definition_platform_message_file(self, content_model: ContentModel, aspect: AspectModel):
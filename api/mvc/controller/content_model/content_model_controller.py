@@ -1,23 +1,35 @@
+import csv
 import os
 import re
 from abc import ABC
 from typing import Optional
+from xml.etree.ElementTree import Element
 
 from api.mvc.controller.aspect.i_aspect_controller import IAspectController
 from api.mvc.controller.content_model.i_content_model_controller import IContentModelController
+from api.mvc.controller.property.i_property_controller import IPropertyController
+from api.mvc.controller.type.i_type_controller import ITypeController
 from api.mvc.model.data.aspect_model import AspectModel
+from api.mvc.model.data.content_type_model import ContentTypeModel
+from api.mvc.model.data.data_model import DataModel
+from api.mvc.model.data.folder_type_model import FolderTypeModel
+from api.mvc.model.data.property_model import PropertyModel
+from api.mvc.model.data.type_model import TypeModel
 from api.mvc.model.service.file.bootstrap_service import BootstrapFileService
 from api.mvc.model.service.file.content_model_service import ContentModelFileService
 from api.mvc.model.service.data.content_model_service import ContentModelService
 from api.mvc.controller.project.i_project_controller import IProjectController
 from api.mvc.model.service.file.share_slingshot_app_context import ShareSlingshotApplicationContext
 from api_core.helper.file_folder_helper import FileFolderHelper
+from api_core.helper.stats_helper import StatsHelper
 from api.mvc.view.content_model_view import ContentModelView
 from api_core.helper.constant_helper import ConstantHelper
 from api.mvc.model.data.content_model import ContentModel
+from api.mvc.model.data.data_type import DataType
 from api.mvc.model.data.project_model import ProjectModel
 from api_core.exception.api_exception import ApiException
 from api_core.mvc.controller.controller import Controller
+from api_core.mvc.service.file.xml_file_service import XmlFileService
 from api_core.helper.string_helper import StringHelper
 
 
@@ -36,8 +48,15 @@ class ContentModelController(Controller, IContentModelController, ABC):
                          ContentModelView(ConstantHelper.SCREEN_SIZE))
         self.__pc: IProjectController = pc
         self.__as: Optional[IAspectController] = None
+        self.__prc: Optional[IPropertyController] = None
+        self.__tc: Optional[ITypeController] = None
         self.__bfs: BootstrapFileService = BootstrapFileService()
         self.cmfs: ContentModelFileService = ContentModelFileService()
+        # The content models loaded, by path, with the state of their file (see '__get_file_state').
+        self.__content_models: dict[str, tuple[tuple[int, Optional[tuple[int, int, int]]], ContentModel]] = {}
+
+        self._register("new", lambda positionals, options: self.new(options))
+        self._register("import", lambda positionals, options: self.import_csv(*positionals))
 
     @property
     def aspect_controller(self) -> IAspectController:
@@ -47,18 +66,59 @@ class ContentModelController(Controller, IContentModelController, ABC):
     def aspect_controller(self, value: IAspectController):
         self.__as = value
 
-    def new(self):
+    @property
+    def property_controller(self) -> IPropertyController:
+        return self.__prc
+
+    @property_controller.setter
+    def property_controller(self, value: IPropertyController):
+        self.__prc = value
+
+    @property
+    def type_controller(self) -> ITypeController:
+        return self.__tc
+
+    @type_controller.setter
+    def type_controller(self, value: ITypeController):
+        self.__tc = value
+
+    def new(self, options: Optional[dict[str, str | bool]] = None):
         """
-        Attempts to create a new content model in the project.
+        Attempts to create new content models in the project. The content model data are asked to the user unless
+        they are given by the options.
+        :param options: The options of the command: the content model fields or a JSON document of content models.
         """
         vw: ContentModelView = self._view
-        service: ContentModelService = self._service
 
         # Get and check of the project.
         project: ProjectModel = self.__pc.get_project()
 
-        vw.info("Create of a content model.")
-        (prefix, name, description, last_name, first_name) = vw.enter_content_model_data()
+        entries: Optional[list[dict[str, str | bool]]] = self._read_entries(
+            {} if options is None else options, ["prefix", "name", "description", "last_name", "first_name"])
+
+        if entries is None:
+            vw.info("Create of a content model.")
+            (prefix, name, description, last_name, first_name) = vw.enter_content_model_data()
+            self.__new(project, prefix, name, description, last_name, first_name)
+        else:
+            # Each content model has its own file: they are created one after the other.
+            for entry in entries:
+                self.__new(project, entry["prefix"], entry["name"], entry["description"], entry["last_name"],
+                           entry["first_name"])
+
+    def __new(self, project: ProjectModel, prefix: str, name: str, description: str, last_name: str,
+              first_name: str):
+        """
+        Creates a new content model in the project.
+        :param project: The project data model.
+        :param prefix: The content model prefix.
+        :param name: The content model name.
+        :param description: The content model description.
+        :param last_name: The author's last name.
+        :param first_name: The author's first name.
+        """
+        vw: ContentModelView = self._view
+        service: ContentModelService = self._service
 
         # Verification of the validity of the prefix.
         self.__check_prefix(prefix)
@@ -68,7 +128,7 @@ class ContentModelController(Controller, IContentModelController, ABC):
 
         # Verification of the validity of the name.
         self.__check_name(name)
-        (name_exists, cm_file) = service.is_name_exists(project, prefix)
+        (name_exists, cm_file) = service.is_name_exists(project, name)
         if name_exists:
             raise ApiException("The name is already used in the content model file '{0}'.".format(cm_file))
 
@@ -79,7 +139,329 @@ class ContentModelController(Controller, IContentModelController, ABC):
         vw.success("The content model '{0}' has been created successfully in '{1}'."
                    .format(content_model.complete_name,
                            FileFolderHelper.extract_filename_from_path(content_model.path)))
-        self.__pc.load()
+        self.__pc.update(content_model)
+
+    def import_csv(self, content_model_name: str, csv_file_path: str):
+        """
+        Imports aspects and properties into a content model from a CSV file. The file is read row by row and the
+        content model file is written once, at the end, only if every row is valid; the project files are then
+        generated once.
+        :param content_model_name: The full name of the content model.
+        :param csv_file_path: The path to the CSV file.
+        """
+        service: ContentModelService = self._service
+        project: ProjectModel = self.__pc.get_project()
+        content_model: ContentModel = self.get_content_model(project, content_model_name)
+
+        if not FileFolderHelper.is_file_exists(csv_file_path):
+            raise ApiException("The CSV file '{0}' does not exist.".format(csv_file_path))
+
+        self._view.info("Importing file '{0}' into content model '{1}'."
+                        .format(csv_file_path, content_model.complete_name))
+
+        # The names already used in the content model, completed as the rows are imported.
+        aspects: dict[str, Element] = service.get_data_nodes(content_model, DataType.ASPECT.value)
+        types: set[str] = set(service.get_data_nodes(content_model, DataType.TYPE.value).keys())
+        properties: set[str] = set(service.get_property_names(content_model))
+
+        errors: int = 0
+        (aspect_count, property_count) = (0, 0)
+        with service.session():
+            with open(csv_file_path, "r", encoding="utf-8-sig", newline="") as reader:
+                sample: str = reader.read(4096)
+                reader.seek(0)
+                try:
+                    dialect = csv.Sniffer().sniff(sample, ",;\t")
+                except csv.Error:
+                    dialect = csv.excel
+                rows: csv.DictReader = csv.DictReader(reader, dialect=dialect)
+
+                if rows.fieldnames is None or "aspect" not in rows.fieldnames:
+                    raise ApiException("The CSV file '{0}' must start with a header naming its columns (at least "
+                                       "'aspect').".format(csv_file_path))
+
+                for row in rows:
+                    try:
+                        (new_aspect, new_property) = self.__import_row(service, content_model, row, aspects, types,
+                                                                       properties)
+                        aspect_count += 1 if new_aspect else 0
+                        property_count += 1 if new_property else 0
+                    except ApiException as e:
+                        # Every invalid row is reported, the file is written only if there is none.
+                        errors += 1
+                        self._view.error("Row {0}: {1}".format(rows.line_num, str(e)))
+
+            if errors.__gt__(0):
+                # The session is rolled back: the content model is not modified.
+                raise ApiException("The file '{0}' has {1} invalid row(s): content model '{2}' was not modified."
+                                   .format(csv_file_path, errors, content_model.complete_name))
+
+        self._view.success("{0} aspect(s) and {1} property(ies) were imported into content model '{2}'."
+                           .format(aspect_count, property_count, content_model.complete_name))
+        self.__pc.update(content_model)
+
+    def __import_row(self, service: ContentModelService, content_model: ContentModel, row: dict[str, Optional[str]],
+                     aspects: dict[str, Element], types: set[str], properties: set[str]) -> tuple[bool, bool]:
+        """
+        Imports a row of a CSV file: a row without property declares an aspect, the other rows add a property to their
+        aspect, which is created if it does not exist.
+        :param service: The content model service.
+        :param content_model: The content model to import the row into.
+        :param row: The row, indexed by column.
+        :param aspects: The nodes of the aspects of the content model, indexed by name.
+        :param types: The names of the types of the content model.
+        :param properties: The names of the properties of the content model.
+        :return: A tuple composed of two booleans indicating whether an aspect and a property were added.
+        """
+        aspect: str = (row.get("aspect") or "").strip()
+        name: str = (row.get("property") or "").strip()
+        title: str = (row.get("title") or "").strip()
+        description: str = (row.get("description") or "").strip()
+
+        self.__as.check_aspect_name(aspect)
+        if StringHelper.is_empty(name) and aspect in aspects.keys():
+            raise ApiException("There is already an aspect of the name '{0}' in the content model '{1}'."
+                               .format(aspect, content_model.complete_name))
+        elif aspect in types:
+            raise ApiException("There is already a type of the name '{0}' in the content model '{1}'."
+                               .format(aspect, content_model.complete_name))
+
+        if not StringHelper.is_empty(name):
+            typology: str = (row.get("type") or "").strip()
+            self.__prc.check_property(name, typology)
+            mandatory: bool = self.__prc.to_mandatory(row.get("mandatory") or "")
+            if name in properties:
+                raise ApiException("There is already a property named '{0}' in content model '{1}'."
+                                   .format(name, content_model.complete_name))
+
+        new_aspect: bool = aspect not in aspects.keys()
+        if new_aspect:
+            # The title and the description of a property row belong to the property.
+            aspects[aspect] = service.add_aspect(content_model, aspect, title if StringHelper.is_empty(name) else "",
+                                                 description if StringHelper.is_empty(name) else "")
+        if StringHelper.is_empty(name):
+            return new_aspect, False
+
+        service.add_property(content_model, aspects[aspect], name, title, description, typology, mandatory)
+        properties.add(name)
+        return new_aspect, True
+
+    def apply_spec(self, project: ProjectModel, content_models: list[ContentModel], spec: dict) -> list[ContentModel]:
+        """
+        Adds to the content model files the content models, aspects, types, parents, mandatory aspects and properties
+        declared by a project spec that they lack. Nothing is ever removed, and what the spec declares differently
+        from the files (a title, a property type...) is reported as a conflict: nothing is modified if there is any.
+        The fields omitted by the spec are not compared.
+        :param project: The content-models' project.
+        :param content_models: The data models of the content models of the project.
+        :param spec: The project spec.
+        :return: The content models modified or created.
+        """
+        service: ContentModelService = self._service
+        existing: dict[str, ContentModel] = {}
+        for content_model in content_models:
+            existing[content_model.prefix] = content_model
+
+        # The content models created by the spec, indexed by name: their files are not written yet.
+        created: dict[str, ContentModel] = {}
+        conflicts: list[str] = []
+        result: list[ContentModel] = []
+        for content_model_spec in spec["content_models"]:
+            prefix: str = content_model_spec["prefix"]
+            name: str = content_model_spec["name"]
+            content_model: Optional[ContentModel] = existing.get(prefix)
+            modified: bool = False
+
+            if content_model is None:
+                self.__check_prefix(prefix)
+                self.__check_name(name)
+                (name_exists, cm_file) = service.is_name_exists(project, name)
+                if name_exists:
+                    raise ApiException("The name of content model '{0}:{1}' is already used in the content model "
+                                       "file '{2}'.".format(prefix, name, cm_file))
+                elif name in created.keys():
+                    raise ApiException("The name of content model '{0}:{1}' is already used by content model '{2}' "
+                                       "of the spec.".format(prefix, name, created[name].complete_name))
+                content_model = service.new(project, prefix, name, content_model_spec["description"],
+                                            content_model_spec["author"])
+                existing[prefix] = content_model
+                created[name] = content_model
+                self._view.info("Content model '{0}' will be created.".format(content_model.complete_name))
+                modified = True
+            elif content_model.name.__ne__(name):
+                conflicts.append("Content model '{0}' is named '{1}' in the spec.".format(content_model.complete_name,
+                                                                                         name))
+                continue
+
+            # Names declared by the content model of the spec, used to check the aspect and type names.
+            declared: dict[str, list[str]] = {
+                DataType.ASPECT.value: [data["name"] for data in content_model_spec["aspects"]],
+                DataType.TYPE.value: [data["name"] for data in content_model_spec["types"]]
+            }
+            # The properties of the content model, indexed by name with the data declaring them.
+            properties: dict[str, tuple[DataModel, Optional[PropertyModel]]] = {}
+            for data in content_model.aspects + content_model.types:
+                for property_model in data.properties:
+                    properties[property_model.name] = (data, property_model)
+
+            for typology in [DataType.ASPECT.value, DataType.TYPE.value]:
+                if self.__apply_data_spec(content_model, typology, content_model_spec["{0}s".format(typology)],
+                                          declared, properties, conflicts):
+                    modified = True
+
+            if modified:
+                result.append(content_model)
+
+        if len(conflicts).__gt__(0):
+            raise ApiException("The spec cannot be applied, it conflicts with the content model files:\n{0}"
+                               .format("\n".join(conflicts)))
+        return result
+
+    def __apply_data_spec(self, content_model: ContentModel, typology: str, data_specs: list[dict],
+                          declared: dict[str, list[str]],
+                          properties: dict[str, tuple[DataModel, Optional[PropertyModel]]], conflicts: list[str]) \
+            -> bool:
+        """
+        Adds to a content model file the aspects or the types of the spec that it lacks, with their parent, mandatory
+        aspects and properties.
+        :param content_model: The data model of the content model.
+        :param typology: The data typology.
+        :param data_specs: The aspects or the types declared by the spec of the content model.
+        :param declared: The names of the aspects and of the types declared by the spec of the content model.
+        :param properties: The properties of the content model, indexed by name with the data declaring them.
+        :param conflicts: The list of the conflicts found, completed by the method.
+        :return: True if the content model file was modified otherwise False.
+        """
+        service: ContentModelService = self._service
+        other: str = DataType.TYPE.value if typology.__eq__(DataType.ASPECT.value) else DataType.ASPECT.value
+        nodes: dict[str, Element] = service.get_data_nodes(content_model, typology)
+        modified: bool = False
+
+        for data_spec in data_specs:
+            name: str = data_spec["name"]
+            if typology.__eq__(DataType.ASPECT.value):
+                self.__as.check_aspect_name(name)
+            else:
+                self.__tc.check_type_name(name)
+
+            if content_model.get_data(other, name) is not None or name in declared[other]:
+                conflicts.append("'{0}' is declared both as an aspect and as a type in content model '{1}'."
+                                 .format(name, content_model.complete_name))
+                continue
+
+            data: Optional[DataModel] = content_model.get_data(typology, name)
+            if data is None:
+                nodes[name] = service.add_aspect(content_model, name, data_spec["title"], data_spec["description"]) \
+                    if typology.__eq__(DataType.ASPECT.value) \
+                    else service.add_type(content_model, name, data_spec["title"], data_spec["description"])
+                data = self.__new_data_model(content_model, typology, name, data_spec["title"],
+                                             data_spec["description"])
+                modified = True
+            else:
+                self.__compare(conflicts, "{0} '{1}'".format(typology, data.complete_name), "title", data.title,
+                               data_spec["title"])
+                self.__compare(conflicts, "{0} '{1}'".format(typology, data.complete_name), "description",
+                               data.description, data_spec["description"])
+
+            # The parent is set if the data has none, another parent is a conflict.
+            if not StringHelper.is_empty(data_spec["parent"]):
+                parent: DataModel = self.__new_data_model(content_model, typology, data_spec["parent"])
+                if data.parent is None:
+                    service.extend(content_model, data, parent)
+                    modified = True
+                else:
+                    self.__compare(conflicts, "{0} '{1}'".format(typology, data.complete_name), "parent",
+                                   data.parent.complete_name, parent.complete_name)
+
+            mandatory_aspects: list[str] = [aspect.name for aspect in data.mandatory]
+            for aspect_name in data_spec["mandatory_aspects"]:
+                if aspect_name not in mandatory_aspects:
+                    service.mandatory(content_model, data, AspectModel(content_model, aspect_name, None, None))
+                    mandatory_aspects.append(aspect_name)
+                    modified = True
+
+            for property_spec in data_spec["properties"]:
+                if self.__apply_property_spec(content_model, data, nodes[name], property_spec, properties, conflicts):
+                    modified = True
+
+        return modified
+
+    def __apply_property_spec(self, content_model: ContentModel, data: DataModel, data_node: Element,
+                              property_spec: dict, properties: dict[str, tuple[DataModel, Optional[PropertyModel]]],
+                              conflicts: list[str]) -> bool:
+        """
+        Adds a property of the spec to its aspect or type if the content model file lacks it.
+        :param content_model: The data model of the content model.
+        :param data: The aspect or the type of the property.
+        :param data_node: The node of the aspect or the type.
+        :param property_spec: The property declared by the spec.
+        :param properties: The properties of the content model, indexed by name with the data declaring them.
+        :param conflicts: The list of the conflicts found, completed by the method.
+        :return: True if the property was added otherwise False.
+        """
+        service: ContentModelService = self._service
+        name: str = property_spec["name"]
+        typology: str = property_spec["type"].rsplit(":", 1)[-1]
+        self.__prc.check_property(name, typology)
+        mandatory: Optional[bool] = None if property_spec["mandatory"] is None \
+            else self.__prc.to_mandatory(property_spec["mandatory"])
+
+        if name not in properties.keys():
+            service.add_property(content_model, data_node, name, property_spec["title"], property_spec["description"],
+                                 typology, False if mandatory is None else mandatory)
+            properties[name] = (data, None)
+            return True
+
+        (owner, property_model) = properties[name]
+        label: str = "property '{0}:{1}'".format(content_model.prefix, name)
+        if owner.name.__ne__(data.name) or owner.typology.__ne__(data.typology):
+            conflicts.append("The {0} belongs to {1} '{2}' but to {3} '{4}' in the spec."
+                             .format(label, owner.typology, owner.complete_name, data.typology, data.complete_name))
+        elif property_model is None:
+            conflicts.append("The {0} is declared twice in the spec.".format(label))
+        else:
+            self.__compare(conflicts, label, "title", property_model.title, property_spec["title"])
+            self.__compare(conflicts, label, "description", property_model.description, property_spec["description"])
+            self.__compare(conflicts, label, "type", property_model.typology, typology)
+            if mandatory is not None and property_model.mandatory.__ne__(mandatory):
+                conflicts.append("The {0} is {1} in the content model file but {2} in the spec."
+                                 .format(label, "mandatory" if property_model.mandatory else "optional",
+                                         "mandatory" if mandatory else "optional"))
+        return False
+
+    @staticmethod
+    def __compare(conflicts: list[str], label: str, field: str, value: Optional[str], expected: Optional[str]):
+        """
+        Reports a conflict if a field of a content model file does not have the value declared by the spec.
+        :param conflicts: The list of the conflicts found, completed by the method.
+        :param label: The label of the item (aspect, type or property) in the conflict message.
+        :param field: The name of the field.
+        :param value: The value of the field in the content model file.
+        :param expected: The value of the field in the spec (None if the spec omits it).
+        """
+        if expected is not None and ("" if value is None else value).__ne__(expected):
+            conflicts.append("The {0} of {1} is '{2}' but '{3}' in the spec."
+                             .format(field, label, "" if value is None else value, expected))
+
+    @staticmethod
+    def __new_data_model(content_model: ContentModel, typology: str, name: str, title: Optional[str] = None,
+                         description: Optional[str] = None) -> DataModel:
+        """
+        Builds the data model of an aspect or a type of a content model.
+        :param content_model: The data model of the content model.
+        :param typology: The data typology.
+        :param name: The data name ('content' and 'folder' being the Alfresco types for a type).
+        :param title: The data title.
+        :param description: The data description.
+        :return: The data model.
+        """
+        if typology.__eq__(DataType.ASPECT.value):
+            return AspectModel(content_model, name, title, description)
+        elif name.__eq__("content"):
+            return ContentTypeModel(content_model)
+        elif name.__eq__("folder"):
+            return FolderTypeModel(content_model)
+        return TypeModel(content_model, name, title, description)
 
     def get_content_model(self, project: ProjectModel, content_model: str, verbose: bool = True) -> ContentModel:
         """
@@ -99,10 +481,61 @@ class ContentModelController(Controller, IContentModelController, ABC):
         if not content_model_exists:
             raise ApiException("There is no content-model named '{0}' in the project.".format(content_model))
 
+        # Building of the content model graph (aspects, types, properties and their links), once per command.
+        result: Optional[ContentModel] = self.__get_loaded_content_model(filepath)
+        if result is None:
+            result = ContentModel(project, prefix, name, filepath)
+            self.cmfs.load(result)
+            self.keep_content_model(result)
+
         if verbose:
             self._view.success("Content-model '{0}' was successfully retrieved.".format(content_model))
 
-        return ContentModel(project, prefix, name, filepath)
+        return result
+
+    def check_data(self, project: ProjectModel, content_model: str, typologies: list[str], names: list[str]):
+        """
+        Checks in the index of the project, without reading the content model file, that a content model declares
+        aspects or types. The data of an invalid content model file are not indexed: the errors of the file are
+        reported when it is read.
+        :param project: The content-model's project.
+        :param content_model: The content-model complete name (prefix:name).
+        :param typologies: The typologies allowed for the data.
+        :param names: The data names ('content' and 'folder' being the Alfresco types for a type).
+        """
+        service: ContentModelService = self._service
+        prefix: str = self.__extract_prefix(content_model)
+        (content_model_exists, filepath) = self.__is_content_model_exists(project, prefix,
+                                                                          self.__extract_name(content_model))
+        if not content_model_exists:
+            raise ApiException("There is no content-model named '{0}' in the project.".format(content_model))
+        elif not service.is_data_indexed(project, prefix):
+            return
+
+        for name in names:
+            if DataType.TYPE.value in typologies and name in ["content", "folder"]:
+                continue
+            if all(service.find_data(project, typology, "{0}:{1}".format(prefix, name)) is None
+                   for typology in typologies):
+                raise ApiException("The '{0}' {1} does not exist in the '{2}' content-model of the '{3}' file."
+                                   .format(name, " or ".join(typologies), content_model,
+                                           FileFolderHelper.extract_filename_from_path(filepath)))
+
+    def check_new_property_names(self, project: ProjectModel, content_model: str, names: list[str]):
+        """
+        Checks in the index of the project, without reading the content model file, that a content model does not
+        already define properties.
+        :param project: The content-model's project.
+        :param content_model: The content-model complete name (prefix:name).
+        :param names: The property names.
+        """
+        service: ContentModelService = self._service
+        prefix: str = self.__extract_prefix(content_model)
+        for name in names:
+            found: Optional[tuple[str, str]] = service.find_property(project, "{0}:{1}".format(prefix, name))
+            if found is not None:
+                raise ApiException("There is already a property named '{0}' in content model '{1}' in file '{2}'."
+                                   .format(name, content_model, FileFolderHelper.extract_filename_from_path(found[0])))
 
     def load_content_model(self, project: ProjectModel, content_model_file_path: str) -> ContentModel:
         """
@@ -111,18 +544,101 @@ class ContentModelController(Controller, IContentModelController, ABC):
         :param content_model_file_path: The absolute path to the content model file.
         :return: The data model of an Alfresco AIO project.
         """
-        prefix: str = self.cmfs.extract_content_model_prefix(content_model_file_path)
-        name: str = self.cmfs.extract_content_model_name(content_model_file_path)
+        return self.load_content_models(project, [content_model_file_path])[0]
+
+    def load_content_models(self, project: ProjectModel, content_model_file_paths: list[str], jobs: int = 1) \
+            -> list[ContentModel]:
+        """
+        Loads content models by their files. The files are read by a pool of worker processes when several jobs are
+        allowed, then the content models are checked in the order of the files.
+        :param project: The content-models' project.
+        :param content_model_file_paths: The absolute paths to the content model files.
+        :param jobs: The maximum number of worker processes used to read the files.
+        :return: The data models of the content models, in the order of the files.
+        """
+        service: ContentModelService = self._service
+        with StatsHelper.phase("model loading"):
+            loaded: list[Optional[ContentModel]] = [self.__get_loaded_content_model(filepath)
+                                                    for filepath in content_model_file_paths]
+            filepaths: list[str] = [filepath for (filepath, content_model) in zip(content_model_file_paths, loaded)
+                                    if content_model is None]
+            read: list[ContentModel] = service.read_content_models(project, filepaths, jobs)
+            for content_model in read:
+                self.keep_content_model(content_model)
+            read.reverse()
+            content_models: list[ContentModel] = [read.pop() if content_model is None else content_model
+                                                  for content_model in loaded]
+
+        with StatsHelper.phase("validation"):
+            prefixes: dict[str, ContentModel] = {}
+            for content_model in content_models:
+                self._view.info("Loading content model '{0}'.".format(content_model.complete_name))
+                self.__check_prefix(content_model.prefix)
+                self.__check_name(content_model.name)
+
+                # Verification that the prefix is used by only one content model file.
+                if content_model.prefix in prefixes.keys():
+                    raise ApiException("The prefix '{0}' is used by content model files '{1}' and '{2}'."
+                                       .format(content_model.prefix,
+                                               FileFolderHelper.extract_filename_from_path(
+                                                   prefixes[content_model.prefix].path),
+                                               FileFolderHelper.extract_filename_from_path(content_model.path)))
+                prefixes[content_model.prefix] = content_model
+
+                # Every violation of the inheritance and of the mandatory aspects is reported at once.
+                violations: list[str] = content_model.graph.violations
+                if len(violations).__gt__(0):
+                    raise ApiException("Content model '{0}' of file '{1}' is not valid:\n{2}"
+                                       .format(content_model.complete_name,
+                                               FileFolderHelper.extract_filename_from_path(content_model.path),
+                                               "\n".join(violations)))
+
+                for aspect in content_model.aspects:
+                    self.__as.load_aspect(content_model, aspect.name)
+
+                self._view.success("Content model '{0}' (from '{1}') was loaded successfully."
+                                   .format(content_model.complete_name,
+                                           FileFolderHelper.extract_filename_from_path(content_model.path)))
+        return content_models
+
+    def keep_content_model(self, content_model: ContentModel):
+        """
+        Keeps a content model with the state of its file, so that it is shared by the next uses (in this command and
+        in the next ones of a batch, a shell or a daemon) as long as its file does not change. A content model updated
+        in place along with its file is kept again.
+        :param content_model: The data model of the content model.
+        """
+        self.__content_models[os.path.abspath(content_model.path)] = (self.__get_file_state(content_model.path),
+                                                                       content_model)
 
-        self._view.info("Loading content model '{0}:{1}'.".format(prefix, name))
-        content_model: ContentModel = self.get_content_model(project, "{0}:{1}".format(prefix, name), False)
-        for aspect in self.cmfs.get_aspects_name(content_model):
-            content_model.add_aspect(self.__as.load_aspect(content_model, aspect))
+    def __get_loaded_content_model(self, filepath: str) -> Optional[ContentModel]:
+        """
+        Gets a content model already loaded, so that its data models are built once and shared.
+        :param filepath: The absolute path to the content model file.
+        :return: The data model of the content model or None if it is not loaded or if its file was modified since
+        then (through an XML file service or by another program).
+        """
+        loaded: Optional[tuple[tuple[int, Optional[tuple[int, int, int]]], ContentModel]] = \
+            self.__content_models.get(os.path.abspath(filepath))
+        if loaded is None or loaded[0].__ne__(self.__get_file_state(filepath)):
+            return None
+        return loaded[1]
 
-        self._view.success("Content model '{0}' (from '{1}') was loaded successfully."
-                           .format(content_model.complete_name,
-                                   FileFolderHelper.extract_filename_from_path(content_model.path)))
-        return content_model
+    @staticmethod
+    def __get_file_state(filepath: str) -> tuple[int, Optional[tuple[int, int, int]]]:
+        """
+        Gets the state of a content model file: the version of its document, which changes when it is modified through
+        an XML file service, and the stat data of the file, which change when another program modifies it.
+        :param filepath: The absolute path to the content model file.
+        :return: The version of the document and the modification date, size and inode of the file (None if the file
+        does not exist).
+        """
+        try:
+            stat: os.stat_result = os.stat(filepath)
+            signature: Optional[tuple[int, int, int]] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            signature = None
+        return XmlFileService.get_version(filepath), signature
 
     def generate_platform_message_file(self, content_model: ContentModel):
         # File name retrieval for error message purposes.
@@ -208,18 +724,9 @@ class ContentModelController(Controller, IContentModelController, ABC):
         :return: A tuple consisting of a boolean indicating whether the content model exists, and the name of the file
          defining it or None.
         """
-        contents: list[str] = FileFolderHelper.get_contents(project.content_model_folder)
-        index: int = 0
-        cm_filepath: Optional[str] = None
-        maximum: int = len(contents)
-        while index.__lt__(maximum) and cm_filepath is None:
-            filepath: str = "{0}{1}{2}".format(project.content_model_folder, os.sep, contents[index])
-            if prefix.__eq__(self.cmfs.extract_content_model_prefix(filepath)) and \
-                    name.__eq__(self.cmfs.extract_content_model_name(filepath)):
-                cm_filepath = filepath
-            else:
-                index += 1
-        return index.__lt__(maximum), cm_filepath
+        service: ContentModelService = self._service
+        cm_filepath: Optional[str] = service.find_content_model(project, prefix, name)
+        return cm_filepath is not None, cm_filepath
 
     @staticmethod
     def __check_prefix(value: str):
@@ -20,6 +20,38 @@ class IContentModelController(ABC):
         """
         pass
 
+    @abstractmethod
+    def check_data(self, project: ProjectModel, content_model: str, typologies: list[str], names: list[str]):
+        """
+        Checks in the index of the project, without reading the content model file, that a content model declares
+        aspects or types.
+        :param project: The content-model's project.
+        :param content_model: The content-model complete name (prefix:name).
+        :param typologies: The typologies allowed for the data.
+        :param names: The data names.
+        """
+        pass
+
+    @abstractmethod
+    def check_new_property_names(self, project: ProjectModel, content_model: str, names: list[str]):
+        """
+        Checks in the index of the project, without reading the content model file, that a content model does not
+        already define properties.
+        :param project: The content-model's project.
+        :param content_model: The content-model complete name (prefix:name).
+        :param names: The property names.
+        """
+        pass
+
+    @abstractmethod
+    def keep_content_model(self, content_model: ContentModel):
+        """
+        Keeps a content model with the state of its file, so that it is shared by the next uses as long as its file
+        does not change.
+        :param content_model: The data model of the content model.
+        """
+        pass
+
     @abstractmethod
     def load_content_model(self, project: ProjectModel, content_model_file_path: str) -> ContentModel:
         """
@@ -30,6 +62,30 @@ class IContentModelController(ABC):
         """
         pass
 
+    @abstractmethod
+    def load_content_models(self, project: ProjectModel, content_model_file_paths: list[str], jobs: int = 1) \
+            -> list[ContentModel]:
+        """
+        Loads content models by their files.
+        :param project: The content-models' project.
+        :param content_model_file_paths: The absolute paths to the content model files.
+        :param jobs: The maximum number of worker processes used to read the files.
+        :return: The data models of the content models, in the order of the files.
+        """
+        pass
+
+    @abstractmethod
+    def apply_spec(self, project: ProjectModel, content_models: list[ContentModel], spec: dict) -> list[ContentModel]:
+        """
+        Adds to the content model files the content models, aspects, types, parents, mandatory aspects and properties
+        declared by a project spec that they lack.
+        :param project: The content-models' project.
+        :param content_models: The data models of the content models of the project.
+        :param spec: The project spec.
+        :return: The content models modified or created.
+        """
+        pass
+
     @abstractmethod
     def generate_share_message_file(self, project: ProjectModel, content_model: ContentModel):
         pass
@@ -1,6 +1,7 @@
 from abc import abstractmethod, ABC
 from typing import Optional
 
+from api.mvc.model.data.content_model import ContentModel
 from api.mvc.model.data.project_model import ProjectModel
 
 
@@ -19,8 +20,18 @@ class IProjectController(ABC):
         """
         pass
 
-    def load(self):
+    def load(self, jobs: int = 1, force: bool = False):
         """
         Loads and generates the necessary project files.
+        :param jobs: The maximum number of worker processes used to read the content model files.
+        :param force: Indicates whether the files are generated even if the content models have not changed.
+        """
+        pass
+
+    @abstractmethod
+    def update(self, content_model: ContentModel):
+        """
+        Generates again the project files of a content model after its modification.
+        :param content_model: The modified content model.
         """
         pass
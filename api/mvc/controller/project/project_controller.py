@@ -1,10 +1,12 @@
 import os
 import re
 from typing import Optional
+from xml.etree.ElementTree import Element
 
 from api.mvc.controller.aspect.i_aspect_controller import IAspectController
 from api.mvc.controller.content_model.i_content_model_controller import IContentModelController
 from api.mvc.controller.project.i_project_controller import IProjectController
+from api.mvc.model.data.content_model import ContentModel
 from api.mvc.model.data.project_model import ProjectModel
 from api.mvc.model.service.data.project_service import ProjectService
 from api.mvc.model.service.file.pom_service import PomService
@@ -13,6 +15,7 @@ from api.mvc.view.project_view import ProjectView
 from api_core.exception.api_exception import ApiException
 from api_core.helper.constant_helper import ConstantHelper
 from api_core.helper.file_folder_helper import FileFolderHelper
+from api_core.helper.stats_helper import StatsHelper
 from api_core.helper.string_helper import StringHelper
 from api_core.mvc.controller.controller import Controller
 
@@ -30,6 +33,16 @@ class ProjectController(Controller, IProjectController):
         self.__ps: PomService = PomService()
         self.__cmc: Optional[IContentModelController] = None
         self.__ac: Optional[IAspectController] = None
+        # Indicates whether the generation of the project files is deferred to the end of a batch.
+        self.__deferred: bool = False
+        # Indicates whether content models were modified since the beginning of the batch.
+        self.__pending: bool = False
+
+        self._register("new", lambda positionals, options: self.new(options))
+        self._register("load", self.__load_command)
+        self._register("apply", lambda positionals, options: self.apply(*positionals))
+        self._register("reset", lambda positionals, options: self.reset())
+        self._register("raz", lambda positionals, options: self.raz())
 
     @property
     def aspect_controller(self) -> IAspectController:
@@ -47,9 +60,11 @@ class ProjectController(Controller, IProjectController):
     def content_model_controller(self, value: IContentModelController):
         self.__cmc = value
 
-    def new(self):
+    def new(self, options: Optional[dict[str, str | bool]] = None):
         """
-        Create a new Alfresco AIO project in the current directory.
+        Create a new Alfresco AIO project in the current directory. The project data are asked to the user unless
+        they are given by the options.
+        :param options: The options of the command: the project fields or a JSON document.
         """
         ps: ProjectService = self._service
         pv: ProjectView = self._view
@@ -57,9 +72,16 @@ class ProjectController(Controller, IProjectController):
         self._view.info("Creation of an Alfresco All-In-One project.", True)
 
         # Retrieve and verify the data necessary for the creation of the project.
-        self._view.empty()
-        (sdk, group_id, artifact_id) = pv.enter_project_data()
-        self._view.empty()
+        entries: Optional[list[dict[str, str | bool]]] = self._read_entries(
+            {} if options is None else options, ["sdk", "group_id", "artifact_id"])
+        if entries is None:
+            self._view.empty()
+            (sdk, group_id, artifact_id) = pv.enter_project_data()
+            self._view.empty()
+        elif len(entries).__eq__(1):
+            (sdk, group_id, artifact_id) = (entries[0]["sdk"], entries[0]["group_id"], entries[0]["artifact_id"])
+        else:
+            raise ApiException("Only one project can be created at a time.")
 
         # Check the sdk.
         self.__check_sdk(sdk)
@@ -80,6 +102,18 @@ class ProjectController(Controller, IProjectController):
                            .format(group_id, artifact_id, sdk))
         self.raz(self.get_project(artifact_id, False))
 
+    def __load_command(self, positionals: list[str], options: dict[str, str | bool]):
+        """
+        Runs the 'load' command.
+        :param positionals: The positional arguments of the command (none).
+        :param options: The options of the command.
+        """
+        jobs: str = options.get("--jobs", "1")
+        if not jobs.isdigit() or int(jobs).__eq__(0):
+            raise ApiException("The '--jobs' option of the 'load_project' command expects a positive number of worker "
+                               "processes.", self.get_man("load"))
+        self.load(int(jobs), options.get("--force", False))
+
     def get_project(self, artifact_id: Optional[str] = None, verbose: bool = True) -> ProjectModel:
         """
         Retrieves the data model of an Alfresco AIO project.
@@ -90,19 +124,21 @@ class ProjectController(Controller, IProjectController):
         if verbose:
             self._view.info("Retrieving the project data model.")
 
-        project_path: str = os.getcwd() if artifact_id is None else "{1}{0}{2}".format(os.sep, os.getcwd(), artifact_id)
-        pom_path: str = "{1}{0}pom.xml".format(os.sep, project_path)
+        with StatsHelper.phase("project resolution"):
+            project_path: str = os.getcwd() if artifact_id is None \
+                else "{1}{0}{2}".format(os.sep, os.getcwd(), artifact_id)
+            pom_path: str = "{1}{0}pom.xml".format(os.sep, project_path)
 
-        # Verification that the project folder exists.
-        if not FileFolderHelper.is_folder_exists(project_path):
-            raise ApiException("The AIO project folder does not exist.")
+            # Verification that the project folder exists.
+            if not FileFolderHelper.is_folder_exists(project_path):
+                raise ApiException("The AIO project folder does not exist.")
 
-        # Verification that the folder contains a pom.xml file.
-        elif not FileFolderHelper.is_file_exists(pom_path):
-            raise ApiException("The working directory is not an Alfresco project folder.")
+            # Verification that the folder contains a pom.xml file.
+            elif not FileFolderHelper.is_file_exists(pom_path):
+                raise ApiException("The working directory is not an Alfresco project folder.")
 
-        return ProjectModel(self.__ps.extract_sdk(pom_path), self.__ps.extract_group_id(pom_path),
-                            self.__ps.extract_artifact_id(pom_path), project_path)
+            return ProjectModel(self.__ps.extract_sdk(pom_path), self.__ps.extract_group_id(pom_path),
+                                self.__ps.extract_artifact_id(pom_path), project_path)
 
     @staticmethod
     def __check_sdk(value: str):
@@ -160,42 +196,195 @@ class ProjectController(Controller, IProjectController):
             raise ApiException("The AIO project artifact ID cannot contain special characters or upper case (example "
                                "of a valid artifact id name: 'display-of-acts').")
 
-    def load(self):
+    def load(self, jobs: int = 1, force: bool = False):
         """
         Loads and generates the necessary project files.
+        :param jobs: The maximum number of worker processes used to read the content model files.
+        :param force: Indicates whether the files are generated even if the content models have not changed.
         """
         project: ProjectModel = self.get_project(None, False)
         service: ProjectService = self._service
+        self.__pending = False
         self._view.info("Loading project '{0}'.".format(project.artifact_id))
-        # Verify that the folder exists.
-        if not FileFolderHelper.is_folder_exists(project.content_model_folder):
-            raise ApiException("The folder that contain the content model files does not exist ({0})."
-                               .format(project.content_model_relative_folder_path))
-        # Loading content-models.
-        for content in FileFolderHelper.list_folder(project.content_model_folder):
-            project.add_content_model(self.__cmc.load_content_model(
-                project, "{0}{1}{2}".format(project.content_model_folder, os.sep, content)))
+        filepaths: list[str] = self.__get_content_model_file_paths(project)
+
+        # Only the files of the content models changed since the last load are generated again.
+        inputs: dict[str, str] = service.get_input_hashes(project, filepaths)
+        changed: Optional[list[str]] = None if force else service.get_changed_content_model_files(project, inputs)
+        if changed is not None and len(changed).__eq__(0):
+            self._view.success("The project '{0}' is up to date.".format(project.artifact_id))
+            return
+        elif changed is not None and self.__update(project, inputs, changed, jobs):
+            return
+
+        # Loading content-models (sorted so that the generated files do not depend on the file system).
+        for content_model in self.__cmc.load_content_models(project, filepaths, jobs):
+            project.add_content_model(content_model)
 
         self._view.success("The project '{0}' has been loaded successfully.".format(project.artifact_id))
 
-        # Project reset.
-        self.reset()
+        # Generated XML files are written once, at the end of the generation, and only if their content changed.
+        service.open_session()
+        try:
+            # Reset of the generated files.
+            self._view.info("Resetting project {0}.".format(project.artifact_id), True)
+            with StatsHelper.phase("reset"):
+                service.reset_generated_files(project)
+            self._view.success("Successfully reset project '{0}'.".format(project.artifact_id))
+
+            self.__generate(project, project.content_models)
+        except BaseException:
+            # An interrupted generation does not leave its documents to the next commands.
+            service.rollback_session()
+            raise
+        with StatsHelper.phase("file writing"):
+            service.commit_session()
+
+        service.remove_unused_share_message_files(project)
+        service.save_manifest(project, inputs)
+
+    def update(self, content_model: ContentModel):
+        """
+        Generates again the project files after the modification of a content model: only the files of the content
+        models changed since the last load are generated again, unless the whole project must be loaded.
+        :param content_model: The modified content model.
+        """
+        if not self.__defer():
+            self.load()
+
+    def __update(self, project: ProjectModel, inputs: dict[str, str], filepaths: list[str], jobs: int) -> bool:
+        """
+        Generates again the project files of the content models of some files, each of them in place of its former
+        entries. It is not possible if a content model was renamed or no longer has aspects, the files generated for
+        its former name or aspects remaining otherwise.
+        :param project: The data model of the project (without content models).
+        :param inputs: The hashes of the current inputs indexed by their path relative to the project folder.
+        :param filepaths: The absolute paths to the modified content model files.
+        :param jobs: The maximum number of worker processes used to read the content model files.
+        :return: True if the files were generated again otherwise False (the whole project must be loaded).
+        """
+        service: ProjectService = self._service
+        names: dict[str, str] = service.get_content_model_names(project)
+        content_models: list[ContentModel] = self.__cmc.load_content_models(project, filepaths, jobs)
+        for content_model in content_models:
+            if names.get(os.path.relpath(content_model.path, project.path)) != content_model.complete_name:
+                return False
+            elif len(content_model.aspects).__eq__(0) \
+                    and (FileFolderHelper.is_file_exists(content_model.platform_message_file_path)
+                         or FileFolderHelper.is_file_exists(content_model.share_message_file_path)):
+                return False
+
+        with service.session():
+            for content_model in content_models:
+                self._view.info("Updating project '{0}' for content model '{1}'."
+                                .format(project.artifact_id, content_model.complete_name))
+                project.add_content_model(content_model)
+                # The entries of the content model are generated again where they were.
+                entries: tuple[list[Element], list[Element]] = service.detach_content_model(project, content_model)
+                self.__generate(project, [content_model])
+                service.attach_entries(project, entries)
+
+        service.update_manifest(project, inputs)
+        self._view.success("The project '{0}' has been updated successfully.".format(project.artifact_id))
+        return True
+
+    def apply(self, spec_file_path: str):
+        """
+        Adds to the content model files what a project spec declares and they lack, then generates the project files
+        of the modified content models. Nothing is written if the content model files already match the spec.
+        :param spec_file_path: The path to the spec file.
+        """
+        project: ProjectModel = self.get_project(None, False)
+        service: ProjectService = self._service
+        spec: dict = service.read_spec(spec_file_path)
+        self._view.info("Applying spec '{0}' to project '{1}'.".format(spec_file_path, project.artifact_id))
+        content_models: list[ContentModel] = self.__cmc.load_content_models(
+            project, self.__get_content_model_file_paths(project))
+
+        with service.session():
+            modified: list[ContentModel] = self.__cmc.apply_spec(project, content_models, spec)
+            # The modified content models are read again from the session documents, which checks their links.
+            for content_model in modified:
+                self.__cmc.load_content_model(project, content_model.path)
+
+        if len(modified).__eq__(0):
+            self._view.success("The content models of project '{0}' already match the spec."
+                               .format(project.artifact_id))
+        elif len(modified).__eq__(1):
+            self._view.success("Content model '{0}' was modified to match the spec."
+                               .format(modified[0].complete_name))
+            self.update(modified[0])
+        else:
+            self._view.success("{0} content models were modified to match the spec.".format(len(modified)))
+            if not self.__defer():
+                self.load()
+
+    def begin_batch(self):
+        """
+        Defers the generation of the project files until the end of the batch of commands.
+        """
+        self.__deferred = True
+        self.__pending = False
+
+    def end_batch(self):
+        """
+        Ends a batch of commands: the project is loaded once if content models were modified during the batch.
+        """
+        self.__deferred = False
+        if self.__pending:
+            self.load()
+
+    def __defer(self) -> bool:
+        """
+        Defers the generation of the project files to the end of the batch, if commands are run in a batch.
+        :return: True if the generation is deferred otherwise False.
+        """
+        if self.__deferred:
+            self.__pending = True
+            self._view.info("The project files will be generated at the end of the batch.")
+        return self.__deferred
 
+    def __generate(self, project: ProjectModel, content_models: list[ContentModel]):
+        """
+        Generates the project files of content models.
+        :param project: The data model of the project.
+        :param content_models: The content models to generate.
+        """
         # Display on the output console of the file writing message.
         self._view.info("File generation")
-        for content_model in project.content_models:
-            self.__cmc.generate_platform_message_file(content_model)
-            self.__cmc.add_content_model_in_bootstrap(project, content_model)
+        for content_model in content_models:
+            with StatsHelper.phase("platform message files"):
+                self.__cmc.generate_platform_message_file(content_model)
+            with StatsHelper.phase("bootstrap file"):
+                self.__cmc.add_content_model_in_bootstrap(project, content_model)
+
+            with StatsHelper.phase("share message files"):
+                self.__cmc.generate_share_message_file(project, content_model)
 
-            self.__cmc.generate_share_message_file(project, content_model)
+        with StatsHelper.phase("share config aspects"):
+            for content_model in content_models:
+                for aspect in content_model.aspects:
+                    self.__ac.add_aspect_in_share_config_file(project, content_model, aspect)
 
-        for content_model in project.content_models:
-            for aspect in content_model.aspects:
-                self.__ac.add_aspect_in_share_config_file(project, content_model, aspect)
+        with StatsHelper.phase("share config properties"):
+            for content_model in content_models:
+                for aspect in content_model.aspects:
+                    self.__ac.add_aspect_properties_in_share_config_file(project, content_model, aspect)
 
-        for content_model in project.content_models:
-            for aspect in content_model.aspects:
-                self.__ac.add_aspect_properties_in_share_config_file(project, aspect)
+    @staticmethod
+    def __get_content_model_file_paths(project: ProjectModel) -> list[str]:
+        """
+        Lists the content model files of a project, sorted so that the generated files do not depend on the file
+        system.
+        :param project: The data model of the project.
+        :return: The absolute paths to the content model files.
+        """
+        # Verify that the folder exists.
+        if not FileFolderHelper.is_folder_exists(project.content_model_folder):
+            raise ApiException("The folder that contain the content model files does not exist ({0})."
+                               .format(project.content_model_relative_folder_path))
+        return ["{0}{1}{2}".format(project.content_model_folder, os.sep, content)
+                for content in sorted(FileFolderHelper.list_folder(project.content_model_folder))]
 
     def reset(self):
         project: ProjectModel = self.get_project(None, False)
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 
 from api.mvc.model.data.content_model import ContentModel
@@ -12,13 +14,20 @@ class IPropertyController(ABC):
     """
 
     @abstractmethod
-    def load_property(self, content_model: ContentModel, data: DataModel, property_name: str) -> PropertyModel:
+    def check_property(self, name: str, typology: str):
         """
-        Loads a property from a data model.
-        :param content_model: The data's content-model.
-        :param data: The owner data of the property.
-        :param property_name: The property name.
-        :return: A data model for the property.
+        Verifies that the name and the type of a property are valid; otherwise it throws an ApiException.
+        :param name: The property name.
+        :param typology: The property type.
+        """
+        pass
+
+    @abstractmethod
+    def to_mandatory(self, value: str | bool) -> bool:
+        """
+        Converts the 'mandatory' field of a property given as text.
+        :param value: The value of the field.
+        :return: The boolean value of the field.
         """
         pass
 
@@ -35,3 +44,8 @@ class IPropertyController(ABC):
     @abstractmethod
     def add_property_in_share_config_file(self, project: ProjectModel, data: DataModel, property_model: PropertyModel):
         pass
+
+    @abstractmethod
+    def add_properties_in_share_config_file(self, project: ProjectModel, data: DataModel,
+                                            properties: list[PropertyModel]):
+        pass
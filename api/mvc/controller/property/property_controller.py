@@ -11,10 +11,10 @@ from api.mvc.controller.property.i_property_controller import IPropertyControlle
 from api.mvc.controller.type.i_type_controller import ITypeController
 from api.mvc.model.data.content_model import ContentModel
 from api.mvc.model.data.data_model import DataModel
+from api.mvc.model.data.data_type import DataType
 from api.mvc.model.data.project_model import ProjectModel
 from api.mvc.model.data.property_model import PropertyModel
 from api.mvc.model.service.data.property_service import PropertyService
-from api.mvc.model.service.file.content_model_service import ContentModelFileService
 from api.mvc.model.service.file.share_config_service import ShareConfigFileService
 from api.mvc.view.property_view import PropertyView
 from api_core.exception.api_exception import ApiException
@@ -29,7 +29,6 @@ class PropertyController(Controller, IPropertyController, ABC):
     def __init__(self, pc: IProjectController, cmc: IContentModelController, ac: IAspectController,
                  tc: ITypeController):
         super().__init__("property", PropertyService(), PropertyView(ConstantHelper.SCREEN_SIZE))
-        self.__cmfs: ContentModelFileService = ContentModelFileService()
         self.__scfs: ShareConfigFileService = ShareConfigFileService()
 
         self.__cmc: IContentModelController = cmc
@@ -37,12 +36,27 @@ class PropertyController(Controller, IPropertyController, ABC):
         self.__ac: IAspectController = ac
         self.__tc: ITypeController = tc
 
-    def new(self, content_model_name: str, data_name: str):
+        self._register("new", lambda positionals, options: self.new(positionals[0], positionals[1], options))
+
+    def new(self, content_model_name: str, data_name: str, options: Optional[dict[str, str | bool]] = None):
+        """
+        Attempts to create new properties in an aspect or a type. The property data are asked to the user unless they
+        are given by the options.
+        :param content_model_name: The full name of the content model.
+        :param data_name: The name of the aspect or the type.
+        :param options: The options of the command: the property fields or a JSON document of properties.
+        """
         service: PropertyService = self._service
         view: PropertyView = self._view
 
         self._view.info("Creating a new property")
         project: ProjectModel = self.__pc.get_project()
+        entries: Optional[list[dict[str, str | bool]]] = self._read_entries(
+            {} if options is None else options, ["name", "title", "description", "type", "mandatory"])
+        # The names are resolved by the index of the project before the content model file is read.
+        self.__cmc.check_data(project, content_model_name, [DataType.ASPECT.value, DataType.TYPE.value], [data_name])
+        if entries is not None:
+            self.__cmc.check_new_property_names(project, content_model_name, [entry["name"] for entry in entries])
         content_model: ContentModel = self.__cmc.get_content_model(project, content_model_name)
         data: Optional[DataModel] = self.__ac.get_aspect(content_model, data_name)
         data = self.__tc.get_type(content_model, data_name) if data is None else data
@@ -51,36 +65,65 @@ class PropertyController(Controller, IPropertyController, ABC):
             raise ApiException("There is no aspect or type named '{0}' in content-model '{1}' in file '{2}"
                                .format(data_name, content_model.complete_name,
                                        FileFolderHelper.extract_filename_from_path(content_model.path)))
-        (name, title, description, typology, mandatory) = view.enter_property_data()
 
-        self.__check_name(name)
-        self.__check_property_type(typology)
+        # The content model file is written once for all the properties.
+        with service.session():
+            if entries is None:
+                (name, title, description, typology, mandatory) = view.enter_property_data()
+                self.__new(service, content_model, data, name, title, description, typology, mandatory)
+            else:
+                for entry in entries:
+                    self.__new(service, content_model, data, entry["name"], entry["title"], entry["description"],
+                               entry["type"], self.to_mandatory(entry["mandatory"]))
+        self.__pc.update(content_model)
+
+    def __new(self, service: PropertyService, content_model: ContentModel, data: DataModel, name: str, title: str,
+              description: str, typology: str, mandatory: bool):
+        """
+        Creates a new property.
+        :param service: The property service.
+        :param content_model: The content model of the property.
+        :param data: The aspect or the type of the property.
+        :param name: The property name.
+        :param title: The property title.
+        :param description: The property description.
+        :param typology: The property type.
+        :param mandatory: Indicates whether the property is mandatory.
+        """
+        self.check_property(name, typology)
 
-        if self.__cmfs.get_properties(content_model).count(name).__gt__(0):
+        if content_model.property_index.is_defined(name):
             raise ApiException("There is already a property named '{0}' in content model '{1}' in file '{2}'."
                                .format(name, content_model.complete_name,
                                        FileFolderHelper.extract_filename_from_path(content_model.path)))
 
         service.new(content_model, data, name, title, description, typology, mandatory)
-        self._view.success("Property '{0}' was successfully created.".format(data_name))
-        self.__pc.load()
+        content_model.property_index.add(data, PropertyModel(data, name, title, description, mandatory, typology))
+        self._view.success("Property '{0}' was successfully created.".format(name))
+
+    def check_property(self, name: str, typology: str):
+        """
+        Verifies that the name and the type of a property are valid; otherwise it throws an ApiException.
+        :param name: The property name.
+        :param typology: The property type.
+        """
+        self.__check_name(name)
+        self.__check_property_type(typology)
 
-    def load_property(self, content_model: ContentModel, data: DataModel, property_name: str) -> PropertyModel:
+    def to_mandatory(self, value: str | bool) -> bool:
         """
-        Loads a property from a data model.
-        :param content_model: The data's content-model.
-        :param data: The owner data of the property.
-        :param property_name: The property name.
-        :return: A data model for the property.
+        Converts the 'mandatory' field of a property given as an option, in a JSON document or in a CSV file.
+        :param value: The value of the field.
+        :return: The boolean value of the field.
         """
-        filename: str = FileFolderHelper.extract_filename_from_path(content_model.path)
-        self._view.info("Loading the property '{0}' from {1} {2} of content-model {3} ({4} file)"
-                        .format(property_name, data.typology, data.name, content_model.complete_name, filename), True)
-        (name, title, description, typology, mandatory) = self.__cmfs.get_property(content_model, data, property_name)
-        prop: PropertyModel = PropertyModel(data, name, title, description, mandatory, typology)
-        self._view.success("The property {0} from {1} {2} of content-model {3} ({4} file) was successfully loaded."
-                           .format(property_name, data.typology, data.name, content_model.complete_name, filename))
-        return prop
+        if isinstance(value, bool):
+            return value
+        elif value.strip().lower() in ["", "n", "no", "false"]:
+            return False
+        elif value.strip().lower() in ["y", "yes", "true"]:
+            return True
+        raise ApiException("The value '{0}' of the 'mandatory' field is invalid. It can be empty (False), equal to 'n' "
+                           "(False) or 'y' (True).".format(value))
 
     def add_property_in_share_config_file(self, project: ProjectModel, data: DataModel, property_model: PropertyModel):
         service: PropertyService = self._service
@@ -90,6 +133,22 @@ class PropertyController(Controller, IPropertyController, ABC):
         self._view.success("Added property '{0}' (of {1} '{2}') in 'share-config-custom.xml' file was successful."
                            .format(property_model.complete_name, data.typology, data.complete_name))
 
+    def add_properties_in_share_config_file(self, project: ProjectModel, data: DataModel,
+                                            properties: list[PropertyModel]):
+        """
+        Adds properties to the form of a data in the 'share-config-custom.xml' file, in a single pass.
+        :param project: The project data model.
+        :param data: The data model.
+        :param properties: The property models, in the order of the form.
+        """
+        service: PropertyService = self._service
+        service.add_properties_in_share_config_file(project, data, properties)
+        for property_model in properties:
+            self._view.info("Add property '{0}' (of {1} '{2}') in file 'share-config-custom.xml'."
+                            .format(property_model.complete_name, data.typology, data.complete_name), True)
+            self._view.success("Added property '{0}' (of {1} '{2}') in 'share-config-custom.xml' file was "
+                               "successful.".format(property_model.complete_name, data.typology, data.complete_name))
+
     def get_property_definition_platform_message_file(self, content_model: ContentModel,
                                                       property_model: PropertyModel) -> str:
         result: str = ""
@@ -19,3 +19,11 @@ class ITypeController(ABC):
         :return: The data model of a type.
         """
         pass
+
+    @abstractmethod
+    def check_type_name(self, name: str):
+        """
+        Verifies that a type name is valid; otherwise it throws an ApiException.
+        :param name: The type name.
+        """
+        pass
@@ -1,3 +1,4 @@
+import re
 from abc import ABC
 from typing import Optional
 
@@ -13,7 +14,7 @@ from api.mvc.model.service.data.type_service import TypeService
 from api.mvc.view.type_view import TypeView
 from api_core.exception.api_exception import ApiException
 from api_core.helper.constant_helper import ConstantHelper
-from api_core.helper.file_folder_helper import FileFolderHelper
+from api_core.helper.string_helper import StringHelper
 
 
 class TypeController(DataController, ITypeController, ABC):
@@ -28,14 +29,18 @@ class TypeController(DataController, ITypeController, ABC):
         :param cmc: A content-model controller.
         """
         super().__init__("type", TypeService(), TypeView(ConstantHelper.SCREEN_SIZE), pc, cmc)
+        self._register("new", lambda positionals, options: self.new(positionals[0], options))
+        self._register("extend", lambda positionals, options: self.extend(*positionals))
+        self._register("mandatory", lambda positionals, options: self.mandatory(*positionals))
         # self.__pc: IProjectController = pc
         # self.__cmc: IContentModelController = cmc
         # self.__cmfs: ContentModelFileService = ContentModelFileService()
 
-    def new(self, content_model_name: str):
+    def new(self, content_model_name: str, options: Optional[dict[str, str | bool]] = None):
         """
-        Attempts to create a new type.
+        Attempts to create new types. The type data are asked to the user unless they are given by the options.
         :param content_model_name: The full name of the content model.
+        :param options: The options of the command: the type fields or a JSON document of types.
         """
         view: TypeView = self._view
         service: TypeService = self._service
@@ -43,8 +48,34 @@ class TypeController(DataController, ITypeController, ABC):
         project: ProjectModel = self._pc.get_project(None, False)
         content_model: ContentModel = self._cmc.get_content_model(project, content_model_name, False)
 
-        view.info("Creating a new type in content-model '{0}'".format(content_model.complete_name))
-        (name, title, description, parent) = view.enter_aspect_data()
+        entries: Optional[list[dict[str, str | bool]]] = self._read_entries(
+            {} if options is None else options, ["name", "title", "description", "parent"])
+
+        # The content model file is written once for all the types.
+        with service.session():
+            if entries is None:
+                view.info("Creating a new type in content-model '{0}'".format(content_model.complete_name))
+                (name, title, description, parent) = view.enter_aspect_data()
+                self.__new(service, content_model, name, title, description, parent)
+            else:
+                # A type given without parent extends the 'content' type.
+                for entry in entries:
+                    self.__new(service, content_model, entry["name"], entry["title"], entry["description"],
+                               "content" if entry["parent"].__eq__("") else entry["parent"])
+        self._pc.update(content_model)
+
+    def __new(self, service: TypeService, content_model: ContentModel, name: str, title: str, description: str,
+              parent: str):
+        """
+        Creates a new type.
+        :param service: The type service.
+        :param content_model: The content model of the type.
+        :param name: The type name.
+        :param title: The type title.
+        :param description: The type description.
+        :param parent: The name of the parent type ('content', 'folder' or a type of the content model).
+        """
+        self.__check_name(name)
 
         if self._cmfs.find_aspect(content_model, name) is not None:
             raise ApiException("There is already an aspect of the name '{0}' in the content model '{1}'."
@@ -55,15 +86,14 @@ class TypeController(DataController, ITypeController, ABC):
                                .format(name, content_model.complete_name))
 
         if parent.__ne__(DataType.TYPE.value) and parent.__ne__("folder") and parent.__ne__("content"):
-            if self._cmfs.find_type(content_model, name) is None:
+            if self._cmfs.find_type(content_model, parent) is None:
                 raise ApiException("There is no type named '{0}' in content model '{1}'."
                                    .format(parent, content_model.complete_name))
 
         service.new(content_model, name, title, description)
-        view.success("Type '{0}' was successfully created in content model '{1}'."
-                     .format(name, content_model.complete_name))
-        self.extend(content_model_name, name, parent)
-        self._pc.load()
+        self._view.success("Type '{0}' was successfully created in content model '{1}'."
+                           .format(name, content_model.complete_name))
+        self.extend(content_model.complete_name, name, parent)
 
     def extend(self, content_model_name: str, type_name: str, parent_type_name: str):
         """
@@ -73,6 +103,7 @@ class TypeController(DataController, ITypeController, ABC):
         :param parent_type_name:The name of the parent type.
         """
         project: ProjectModel = self._pc.get_project(None, False)
+        self._cmc.check_data(project, content_model_name, [DataType.TYPE.value], [type_name, parent_type_name])
         content_model: ContentModel = self._cmc.get_content_model(project, content_model_name, False)
         self._view.info("Extended type '{0}' to type '{1}'.".format(type_name, parent_type_name))
         self._extend(content_model, DataType.TYPE.value, type_name, parent_type_name)
@@ -83,8 +114,10 @@ class TypeController(DataController, ITypeController, ABC):
         self._view.info("Add aspect '{0}' to the list of mandatory aspects of type '{1}'."
                         .format(mandatory_aspect_name, type_name))
         project: ProjectModel = self._pc.get_project()
+        self._cmc.check_data(project, content_model_name, [DataType.TYPE.value], [type_name])
+        self._cmc.check_data(project, content_model_name, [DataType.ASPECT.value], [mandatory_aspect_name])
         content_model: ContentModel = self._cmc.get_content_model(project, content_model_name)
-        self._add_mandatory(content_model, DataType.ASPECT.value, type_name, mandatory_aspect_name)
+        self._add_mandatory(content_model, DataType.TYPE.value, type_name, mandatory_aspect_name)
         self._view.success("Aspect '{0}' was successfully added to the list of required aspects for type '{1}'."
                            .format(mandatory_aspect_name, type_name))
 
@@ -98,47 +131,28 @@ class TypeController(DataController, ITypeController, ABC):
         self._view.info("Retrieving the type data model.")
         return self._get(content_model, DataType.TYPE.value, name)
 
-    def _check_mandatory_aspects(self, content_model: ContentModel, source: str, complete_name: Optional[str],
-                                 ancestors: list[str], mandatory: list[str]) -> list[str]:
-        if complete_name is None:
-            mandatory.pop(0)
-            return mandatory
-
-        name: str = complete_name.rsplit(":", 1)[1]
-        if source.__ne__(name) and self._cmfs.find_aspect(content_model, name) is None:
-            raise ApiException(
-                "Aspect '{0}' has a required aspect '{1}' which does not exist in content model '{2}' "
-                "in file '{3}'.".format(mandatory[len(mandatory) - 1], name, content_model.complete_name,
-                                        FileFolderHelper.extract_filename_from_path(content_model.path)))
-
-        if ancestors.count(name).__gt__(0):
-            raise ApiException(
-                "The aspect '{0}' is declared in the ancestors of the aspect '{0}'. It cannot therefore"
-                " be one of its mandatory aspects (direct or by inheritance)."
-                .format(name, source))
-
-        if mandatory.count(name).__gt__(0):
-            raise ApiException("Aspect '{0}' appears twice in the list of mandatory aspects of aspect '{1}' (by "
-                               "inheritance or directly).".format(name, source))
-
-        mandatory.append(name)
-        if len(ancestors).__gt__(1):
-            mandatory_ancestors: list[str] = self.__check_ancestors(content_model, DataType.ASPECT.name, name,
-                                                                    complete_name, [])
-            for mandatory_ancestor in mandatory_ancestors:
-                if ancestors.count(mandatory_ancestor).__gt__(0) or mandatory.count(mandatory_ancestor).__gt__(0):
-                    raise ApiException(
-                        "Aspect '{0}' appears twice in the list of mandatory aspects of aspect '{1}' "
-                        "(by inheritance or directly) by aspect '{2}'."
-                        .format(mandatory_ancestor, source, name))
-                mandatory.append(mandatory_ancestor)
-
-        if name.__eq__(source):
-            for mandatory_aspect in self._cmfs.get_type_mandatory_aspects(content_model, name):
-                self._check_mandatory_aspects(content_model, source, mandatory_aspect, ancestors, mandatory)
-
-        else:
-            for mandatory_aspect in self._cmfs.get_aspect_mandatory_aspects(content_model, name):
-                self._check_mandatory_aspects(content_model, source, mandatory_aspect, ancestors, mandatory)
-
-        return mandatory
+    def check_type_name(self, name: str):
+        """
+        Verifies that a type name is valid; otherwise it throws an ApiException.
+        :param name: The type name.
+        """
+        self.__check_name(name)
+
+    @staticmethod
+    def __check_name(value: str):
+        """
+        Verifies that the name put in parameter is valid; otherwise it throws an ApiException.
+        :param value: The name to test.
+        """
+        # Verification that it is not empty or null.
+        if StringHelper.is_empty(value):
+            raise ApiException("The type name cannot be null or empty.")
+
+        # Check that there are no spaces.
+        elif StringHelper.has_space(value):
+            raise ApiException("The type name cannot contain spaces.")
+
+        # Check that there are no special characters.
+        elif re.match("[a-zA-Z0-9]+$", value) is None:
+            raise ApiException("The type name cannot contain any special"
+                               " (example of a valid type name: 'invoice').")
@@ -20,6 +20,3 @@ class AspectModel(DataModel):
         :param description: The aspect description.
         """
         super().__init__(icm, name, title, description, DataType.ASPECT)
-
-    def add_mandatory_aspect(self, mandatory_aspect: DataModel):
-        self._mandatory.append(mandatory_aspect)
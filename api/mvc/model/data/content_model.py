@@ -1,8 +1,16 @@
+from __future__ import annotations
+
 import os
+from typing import Optional
 
 from api.mvc.model.data.aspect_model import AspectModel
+from api.mvc.model.data.data_graph import DataGraph
+from api.mvc.model.data.data_model import DataModel
+from api.mvc.model.data.data_type import DataType
 from api.mvc.model.data.i_content_model import IContentModel
 from api.mvc.model.data.i_project_model import IProjectModel
+from api.mvc.model.data.property_index import PropertyIndex
+from api.mvc.model.data.type_model import TypeModel
 from api_core.helper.string_helper import StringHelper
 
 
@@ -22,7 +30,11 @@ class ContentModel(IContentModel):
         self.name: str = name
         self.path: str = path
         self.aspects: list[AspectModel] = []
-        # self.types: dict[str, TypeModel] = {}
+        self.types: list[TypeModel] = []
+        self.__aspects_index: dict[str, AspectModel] = {}
+        self.__types_index: dict[str, TypeModel] = {}
+        self.__graph: Optional[DataGraph] = None
+        self.__property_index: Optional[PropertyIndex] = None
         self.complete_name: str = "{0}:{1}".format(prefix, name)
         self.platform_message_file_path: str = "{1}{0}{2}".format(os.sep,
                                                                   project.content_model_message_absolute_folder_path,
@@ -51,6 +63,73 @@ class ContentModel(IContentModel):
         :param aspect: The aspect to add to the model.
         """
         self.aspects.append(aspect)
+        self.__aspects_index[aspect.name] = aspect
+        self.__graph = None
+        self.__property_index = None
+
+    def add_type(self, type_model: TypeModel):
+        """
+        Add a type in the model.
+        :param type_model: The type to add to the model.
+        """
+        self.types.append(type_model)
+        self.__types_index[type_model.name] = type_model
+        self.__graph = None
+        self.__property_index = None
+
+    @property
+    def graph(self) -> DataGraph:
+        """
+        Gets the graph of the links between the aspects and types of the model, built (and checked) on first use.
+        The links added afterwards must be added through the graph.
+        :return: The graph of the model.
+        """
+        if self.__graph is None:
+            self.__graph = DataGraph(self, self.__forget_effective_properties)
+        return self.__graph
+
+    def __forget_effective_properties(self):
+        """
+        Forgets the effective properties and sets of the data, which depend on the links changed in the graph.
+        """
+        if self.__property_index is not None:
+            self.__property_index.forget()
+
+    @property
+    def property_index(self) -> PropertyIndex:
+        """
+        Gets the index of the properties of the model, built on first use. The properties added afterwards must be
+        added through the index.
+        :return: The index of the properties of the model.
+        """
+        if self.__property_index is None:
+            self.__property_index = PropertyIndex(self)
+        return self.__property_index
+
+    def get_aspect(self, name: str) -> Optional[AspectModel]:
+        """
+        Get an aspect of the model by its name.
+        :param name: The aspect name.
+        :return: The aspect data model, otherwise None.
+        """
+        return self.__aspects_index.get(name)
+
+    def get_type(self, name: str) -> Optional[TypeModel]:
+        """
+        Get a type of the model by its name.
+        :param name: The type name.
+        :return: The type data model, otherwise None.
+        """
+        return self.__types_index.get(name)
+
+    def get_data(self, typology: str, name: str) -> Optional[DataModel]:
+        """
+        Get an aspect or a type of the model by its name.
+        :param typology: The data typology.
+        :param name: The data name.
+        :return: The data model, otherwise None.
+        """
+        return self.get_aspect(name) if typology.__eq__(DataType.ASPECT.value) else self.get_type(name)
 
     # def has_aspect(self, name: str) -> bool:
     #     """
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+from typing import Callable, Optional, TYPE_CHECKING
+
+from api.mvc.model.data.content_type_model import ContentTypeModel
+from api.mvc.model.data.data_model import DataModel
+from api.mvc.model.data.folder_type_model import FolderTypeModel
+
+if TYPE_CHECKING:
+    from api.mvc.model.data.content_model import ContentModel
+
+
+class DataGraph:
+    """
+    Graph of the links between the data (aspects and types) of a content model: the parent of each data and its
+    mandatory aspects. The graph is checked when it is built, in a single pass over the data and the links: the
+    ancestors of each data and the aspects brought by each mandatory aspect (the aspect itself, its ancestors and,
+    recursively, the aspects brought by its own mandatory aspects) are computed once, as bitsets indexed by data. Every
+    violation is recorded: a cycle in the inheritance or in the mandatory aspects, a mandatory aspect declared in the
+    ancestors of the data or brought twice to the data.
+    The aspects brought to each data by its mandatory aspects are kept too, so that the links are queried in constant
+    time. A link added afterwards (see 'DataGraph.set_parent' and 'DataGraph.add_mandatory') only updates the data
+    depending on it.
+    """
+
+    def __init__(self, content_model: ContentModel, on_change: Optional[Callable[[], None]] = None):
+        """
+        Initialize a new instance of 'DataGraph' class.
+        :param content_model: The content model, whose data are linked to their parent and mandatory aspects.
+        :param on_change: The function called when a link is added afterwards, or None.
+        """
+        self.__on_change: Optional[Callable[[], None]] = on_change
+        self.__data: list[DataModel] = content_model.aspects + content_model.types
+        self.__indexes: dict[tuple[str, str], int] = {}
+        for (index, data) in enumerate(self.__data):
+            self.__indexes[(data.typology, data.name)] = index
+        self.__parents: list[Optional[int]] = [self.__get_index(data.parent) for data in self.__data]
+        self.__mandatory: list[list[int]] = [[self.__get_index(aspect) for aspect in data.mandatory]
+                                             for data in self.__data]
+        self.__children: list[list[int]] = [[] for data in self.__data]
+        self.__dependents: list[list[int]] = [[] for data in self.__data]
+        for index in range(len(self.__data)):
+            if self.__parents[index] is not None:
+                self.__children[self.__parents[index]].append(index)
+            for mandatory in self.__mandatory[index]:
+                self.__dependents[mandatory].append(index)
+        self.__violations: list[str] = []
+        self.__data_violations: list[set[int]] = [set() for data in self.__data]
+
+        # The ancestors (or the aspects brought as mandatory aspect) are None when a cycle makes them infinite.
+        self.__ancestors: list[Optional[int]] = [None] * len(self.__data)
+        self.__closures: list[Optional[int]] = [None] * len(self.__data)
+        self.__brought: list[Optional[int]] = [None] * len(self.__data)
+        indexes: set[int] = set(range(len(self.__data)))
+        self.__compute_ancestors(indexes)
+        self.__compute_closures(indexes)
+        self.__check_mandatory_aspects(indexes)
+
+    @property
+    def violations(self) -> list[str]:
+        """
+        Gets the violations found in the graph.
+        :return: The messages of the violations.
+        """
+        return list(self.__violations)
+
+    def get_violations(self, data: DataModel) -> list[str]:
+        """
+        Gets the violations found in the links of a data.
+        :param data: The data model.
+        :return: The messages of the violations, empty if the data is not in the graph.
+        """
+        index: Optional[int] = self.__get_index(data)
+        if index is None:
+            return []
+        return [self.__violations[violation] for violation in sorted(self.__data_violations[index])]
+
+    def is_ancestor(self, data: DataModel, ancestor: DataModel) -> bool:
+        """
+        Indicates whether a data is an ancestor of another one.
+        :param data: The data model.
+        :param ancestor: The data model of the possible ancestor.
+        :return: True if the ancestor is the parent of the data or one of its ancestors otherwise False.
+        """
+        (index, other) = (self.__get_index(data), self.__get_index(ancestor))
+        if index is None or other is None or self.__ancestors[index] is None:
+            return False
+        return (self.__ancestors[index] >> other & 1).__eq__(1)
+
+    def is_mandatory(self, data: DataModel, aspect: DataModel) -> bool:
+        """
+        Indicates whether an aspect is brought to a data by its mandatory aspects (directly or by inheritance).
+        :param data: The data model.
+        :param aspect: The data model of the aspect.
+        :return: True if the aspect is a mandatory aspect of the data, one of their ancestors or one of the aspects
+        they bring otherwise False.
+        """
+        (index, other) = (self.__get_index(data), self.__get_index(aspect))
+        if index is None or other is None or self.__brought[index] is None:
+            return False
+        return (self.__brought[index] >> other & 1).__eq__(1)
+
+    def set_parent(self, data: DataModel, parent: DataModel):
+        """
+        Sets the parent of a data, in its data model and in the graph. Only the ancestors of the data and of its
+        descendants, and the aspects brought by the data depending on them, are computed and checked again, so that the
+        violations the link brings are recorded as if the graph was built again.
+        :param data: The data model.
+        :param parent: The data model of the parent.
+        """
+        data.parent = parent
+        self.__changed()
+        index: Optional[int] = self.__get_index(data)
+        if index is None:
+            return
+        if self.__parents[index] is not None:
+            self.__children[self.__parents[index]].remove(index)
+        self.__parents[index] = self.__get_index(parent)
+        if self.__parents[index] is not None:
+            self.__children[self.__parents[index]].append(index)
+
+        descendants: set[int] = self.__get_reachable(index, self.__children)
+        self.__compute_ancestors(descendants)
+        dependents: set[int] = set().union(*[self.__get_reachable(item, self.__dependents) for item in descendants])
+        self.__compute_closures(dependents)
+        self.__check_mandatory_aspects(dependents)
+
+    def add_mandatory(self, data: DataModel, aspect: DataModel):
+        """
+        Adds a mandatory aspect to a data, in its data model and in the graph. Only the aspects brought by the data
+        and by the data depending on it are computed and checked again, so that the violations the link brings are
+        recorded as if the graph was built again.
+        :param data: The data model.
+        :param aspect: The data model of the mandatory aspect.
+        """
+        data.add_mandatory_aspect(aspect)
+        self.__changed()
+        (index, mandatory) = (self.__get_index(data), self.__get_index(aspect))
+        if index is None or mandatory is None:
+            return
+        self.__mandatory[index].append(mandatory)
+        self.__dependents[mandatory].append(index)
+        dependents: set[int] = self.__get_reachable(index, self.__dependents)
+        self.__compute_closures(dependents)
+        self.__check_mandatory_aspects(dependents)
+
+    def __changed(self):
+        """
+        Notifies that a link was added to the data of the graph.
+        """
+        if self.__on_change is not None:
+            self.__on_change()
+
+    def __get_index(self, data: Optional[DataModel]) -> Optional[int]:
+        """
+        Gets the index of a data in the graph.
+        :param data: The data model.
+        :return: The index of the data or None if the data is not one of the content model (the 'cm:folder' and
+        'cm:content' types end the hierarchies).
+        """
+        if data is None or isinstance(data, (FolderTypeModel, ContentTypeModel)):
+            return None
+        return self.__indexes.get((data.typology, data.name))
+
+    def __add_violation(self, message: str, indexes: list[int]):
+        """
+        Records a violation, unless it is already recorded for the data it concerns (a link added afterwards checks
+        the data depending on it again).
+        :param message: The message of the violation.
+        :param indexes: The indexes of the data concerned by the violation.
+        """
+        if len(indexes).__gt__(0) and all(message in [self.__violations[violation]
+                                                      for violation in self.__data_violations[index]]
+                                          for index in indexes):
+            return
+        self.__violations.append(message)
+        for index in indexes:
+            self.__data_violations[index].add(len(self.__violations) - 1)
+
+    @staticmethod
+    def __get_reachable(start: int, links: list[list[int]]) -> set[int]:
+        """
+        Gets the data reachable from a data by following links.
+        :param start: The index of the data.
+        :param links: The indexes of the data linked to each data.
+        :return: The indexes of the data reachable, the data included.
+        """
+        reachable: set[int] = {start}
+        stack: list[int] = [start]
+        while len(stack).__gt__(0):
+            for item in links[stack.pop()]:
+                if item not in reachable:
+                    reachable.add(item)
+                    stack.append(item)
+        return reachable
+
+    def __compute_ancestors(self, indexes: set[int]):
+        """
+        Computes the ancestors of some data, each chain of parents being browsed once. The bitset of the ancestors of
+        a data is None if the data or one of its ancestors is in a cycle.
+        :param indexes: The indexes of the data, whose ancestors are not computed yet. The ancestors of the other data
+        must be computed.
+        """
+        ancestors: list[Optional[int]] = self.__ancestors
+        # 0: not browsed, 1: in the chain being browsed, 2: done.
+        states: dict[int, int] = dict.fromkeys(indexes, 0)
+        for start in indexes:
+            chain: list[int] = []
+            index: Optional[int] = start
+            while index is not None and states.get(index, 2).__eq__(0):
+                states[index] = 1
+                chain.append(index)
+                index = self.__parents[index]
+
+            violations: set[int] = set()
+            ancestor: Optional[int] = 0
+            if index is not None and states.get(index, 2).__eq__(1):
+                cycle: list[int] = chain[chain.index(index):]
+                data: DataModel = self.__data[index]
+                self.__add_violation("There is an inheritance problem. {0} '{1}' appears twice in its ancestors.\n{2}"
+                                     .format(data.typology.title(), data.name,
+                                             " -> ".join(self.__data[item].name for item in cycle + [index])), [])
+                violations = {len(self.__violations) - 1}
+                ancestor = None
+            elif index is not None:
+                violations = self.__data_violations[index]
+                ancestor = None if ancestors[index] is None else ancestors[index] | 1 << index
+
+            for item in reversed(chain):
+                ancestors[item] = ancestor
+                states[item] = 2
+                self.__data_violations[item] |= violations
+                if ancestor is not None:
+                    ancestor |= 1 << item
+
+    def __compute_closures(self, indexes: set[int]):
+        """
+        Computes the aspects brought by some data used as mandatory aspect: the data itself, its ancestors and the
+        aspects brought by its mandatory aspects. Each data and each link is browsed once (depth-first search). The
+        aspects brought to the data by their mandatory aspects are computed too. The bitsets are None if they are
+        infinite (cycle).
+        :param indexes: The indexes of the data, whose closures are not computed yet. The closures of the other data
+        must be computed, as well as the ancestors of every data.
+        """
+        closures: list[Optional[int]] = self.__closures
+        # 0: not browsed, 1: being browsed, 2: done.
+        states: dict[int, int] = dict.fromkeys(indexes, 0)
+        # A data browsed again in a cycle must not give its former closure.
+        for index in indexes:
+            closures[index] = None
+        for start in indexes:
+            if states[start].__ne__(0):
+                continue
+            states[start] = 1
+            stack: list[list[int]] = [[start, 0]]
+            while len(stack).__gt__(0):
+                (index, position) = stack[-1]
+                if position.__lt__(len(self.__mandatory[index])):
+                    stack[-1][1] += 1
+                    mandatory: int = self.__mandatory[index][position]
+                    if states.get(mandatory, 2).__eq__(0):
+                        states[mandatory] = 1
+                        stack.append([mandatory, 0])
+                    elif states.get(mandatory, 2).__eq__(1):
+                        cycle: list[int] = [item[0] for item in stack]
+                        cycle = cycle[cycle.index(mandatory):]
+                        data: DataModel = self.__data[mandatory]
+                        self.__add_violation("Aspect '{0}' appears twice in the list of mandatory aspects of aspect "
+                                             "'{0}' (by inheritance or directly).\n{1}"
+                                             .format(data.name, " -> ".join(self.__data[item].name
+                                                                            for item in cycle + [mandatory])), cycle)
+                    continue
+
+                stack.pop()
+                states[index] = 2
+                brought: Optional[int] = 0
+                for mandatory in self.__mandatory[index]:
+                    brought = None if brought is None or closures[mandatory] is None else brought | closures[mandatory]
+                self.__brought[index] = brought
+                closures[index] = None if brought is None or self.__ancestors[index] is None \
+                    else brought | self.__ancestors[index] | 1 << index
+
+    def __check_mandatory_aspects(self, indexes: set[int]):
+        """
+        Checks the mandatory aspects of some data: the aspects they bring must be neither the data, nor one of its
+        ancestors and each of them must be brought once.
+        :param indexes: The indexes of the data.
+        """
+        for index in sorted(indexes):
+            data: DataModel = self.__data[index]
+            ancestors: Optional[int] = self.__ancestors[index]
+            if ancestors is None:
+                continue
+            brought: int = 1 << index
+            for mandatory in self.__mandatory[index]:
+                closure: Optional[int] = self.__closures[mandatory]
+                if closure is None:
+                    continue
+                for item in self.__get_indexes(closure & ancestors):
+                    self.__add_violation("The aspect '{0}' is declared in the ancestors of the {2} '{1}'. It cannot "
+                                         "therefore be one of its mandatory aspects (direct or by inheritance)."
+                                         .format(self.__data[item].name, data.name, data.typology), [index])
+                for item in self.__get_indexes(closure & brought):
+                    self.__add_violation("Aspect '{0}' appears twice in the list of mandatory aspects of {2} '{1}' "
+                                         "(by inheritance or directly)."
+                                         .format(self.__data[item].name, data.name, data.typology), [index])
+                brought |= closure
+
+    @staticmethod
+    def __get_indexes(bitset: int) -> list[int]:
+        """
+        Gets the indexes of the data of a bitset.
+        :param bitset: The bitset.
+        :return: The indexes of the bits set, in ascending order.
+        """
+        indexes: list[int] = []
+        while bitset.__ne__(0):
+            lowest: int = bitset & -bitset
+            indexes.append(lowest.bit_length() - 1)
+            bitset ^= lowest
+        return indexes
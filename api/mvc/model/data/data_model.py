@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Optional
 
 from api.mvc.model.data.data_type import DataType
@@ -97,5 +99,12 @@ class DataModel(IDataModel):
         """
         self.__properties.append(property_model)
 
+    def add_mandatory_aspect(self, mandatory_aspect: DataModel):
+        """
+        Add a mandatory aspect to the data model.
+        :param mandatory_aspect: The mandatory aspect to add.
+        """
+        self._mandatory.append(mandatory_aspect)
+
     def to_str(self) -> str:
         return "NAME: {0}\nTITLE: {1}\nTYPE: {2}".format(self.name, self.title, self.typology)
@@ -64,6 +64,12 @@ class ProjectModel(IProjectModel):
                                                   "{2}-platform{0}context{0}webscript-context.xml"\
             .format(os.sep, path, artifact_id)
 
+        self.__helper_folder: str = "{1}{0}.alfresco_helper".format(os.sep, path)
+
+        self.__manifest_filepath: str = "{1}{0}manifest.json".format(os.sep, self.__helper_folder)
+
+        self.__index_filepath: str = "{1}{0}index.sqlite".format(os.sep, self.__helper_folder)
+
         self.__share_slingshot_application_context_filepath: str = "{1}{0}{2}-share{0}src{0}main{0}resources{0}" \
                                                                    "alfresco{0}web-extension{0}{2}-share-slingshot-" \
                                                                    "application-context.xml".format(os.sep, path,
@@ -73,6 +79,26 @@ class ProjectModel(IProjectModel):
     def platform_unit_test_folder(self) -> str:
         return "{1}{0}{2}-platform{0}src{0}test{0}java".format(os.sep, self.__path, self._artifact_id)
 
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def helper_folder(self) -> str:
+        return self.__helper_folder
+
+    @property
+    def manifest_filepath(self) -> str:
+        return self.__manifest_filepath
+
+    @property
+    def index_filepath(self) -> str:
+        return self.__index_filepath
+
+    @property
+    def pom_filepath(self) -> str:
+        return self.__pom_path
+
     @property
     def group_id(self) -> str:
         return self.__group_id
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
+
+from api.mvc.model.data.data_model import DataModel
+from api.mvc.model.data.property_model import PropertyModel
+
+if TYPE_CHECKING:
+    from api.mvc.model.data.content_model import ContentModel
+
+
+class PropertyIndex:
+    """
+    Index of the properties of a content model: the data (aspects and types) defining each property name, so that a
+    property name is looked for in constant time, and the effective properties of each data: its own properties then
+    the properties it inherits from its ancestors and brings with its mandatory aspects. A property name is defined
+    once in a content model; a property defined twice in the effective properties of a data is a violation.
+    The effective properties and the effective sets (the data whose set of properties is shown in the form of a data)
+    are memoized, so that the data sharing ancestors or mandatory aspects browse them once.
+    """
+
+    def __init__(self, content_model: ContentModel):
+        """
+        Initialize a new instance of 'PropertyIndex' class.
+        :param content_model: The content model, whose data hold their properties.
+        """
+        self.__content_model: ContentModel = content_model
+        self.__owners: dict[str, list[DataModel]] = {}
+        for data in content_model.aspects + content_model.types:
+            for property_model in data.properties:
+                self.__owners.setdefault(property_model.name, []).append(data)
+        # The data whose properties a data has, memoized by typology and name (see 'PropertyIndex.__get_linked_data').
+        self.__linked_data: dict[tuple[str, str], Optional[list[DataModel]]] = {}
+        # The data whose sets a data shows, memoized by typology and name (see 'PropertyIndex.__get_linked_sets').
+        self.__linked_sets: dict[tuple[str, str], Optional[list[DataModel]]] = {}
+
+    def is_defined(self, name: str) -> bool:
+        """
+        Indicates whether a property name is defined in the content model.
+        :param name: The property name.
+        :return: True if an aspect or a type of the content model defines the property otherwise False.
+        """
+        return name in self.__owners.keys()
+
+    def get_owners(self, name: str) -> list[DataModel]:
+        """
+        Gets the data defining a property name.
+        :param name: The property name.
+        :return: The aspects and types defining the property, once per definition.
+        """
+        return list(self.__owners.get(name, []))
+
+    def add(self, data: DataModel, property_model: PropertyModel):
+        """
+        Adds a property to a data, in its data model and in the index.
+        :param data: The data model.
+        :param property_model: The property model.
+        """
+        data.add_property(property_model)
+        self.__owners.setdefault(property_model.name, []).append(data)
+        self.forget()
+
+    def forget(self):
+        """
+        Forgets the effective properties and sets memoized so far, after a change of the properties or of the links
+        between the data. They are computed again on their next use.
+        """
+        self.__linked_data.clear()
+        self.__linked_sets.clear()
+
+    def get_duplicated_property(self, data: DataModel) -> Optional[PropertyModel]:
+        """
+        Gets the first property of a data defined twice in its effective properties: twice in the data, in one of its
+        ancestors or in one of the aspects brought by its mandatory aspects (directly or by inheritance).
+        :param data: The data model.
+        :return: The property defined twice or None.
+        """
+        for property_model in data.properties:
+            definitions: int = 0
+            for owner in self.__owners.get(property_model.name, []):
+                if owner is data:
+                    definitions += 1
+                elif self.__content_model.graph.is_ancestor(data, owner) \
+                        or self.__content_model.graph.is_mandatory(data, owner):
+                    return property_model
+            if definitions.__gt__(1):
+                return property_model
+        return None
+
+    def get_effective_properties(self, data: DataModel) -> list[PropertyModel]:
+        """
+        Gets the effective properties of a data: its own properties, then the properties of its ancestors and of the
+        aspects brought by its mandatory aspects, each data being browsed once (the ancestors of a data before the
+        data, its mandatory aspects after it).
+        :param data: The data model.
+        :return: The property models.
+        """
+        result: list[PropertyModel] = list(data.properties)
+        for linked in self.__get_linked_data(data):
+            if linked is not data:
+                result.extend(linked.properties)
+        return result
+
+    def get_effective_sets(self, data: DataModel) -> list[DataModel]:
+        """
+        Gets the effective sets of a data: the data whose set of properties is shown in the form of the data besides
+        its own set. They are its ancestors (the farthest first), each followed by its mandatory aspects, then the
+        mandatory aspects of the data.
+        :param data: The data model.
+        :return: The data models, each of them once.
+        """
+        result: list[DataModel] = []
+        browsed: set[int] = {id(data)}
+        for linked in self.__get_linked_sets(data.parent) + data.mandatory:
+            if id(linked) not in browsed:
+                browsed.add(id(linked))
+                result.append(linked)
+        return result
+
+    def __get_linked_sets(self, data: Optional[DataModel]) -> list[DataModel]:
+        """
+        Gets the data whose set is shown in the form of the descendants of a data: the data linked to its parent, then
+        the data itself and its mandatory aspects. The result is memoized.
+        :param data: The data model.
+        :return: The data models, empty in a cycle (an invalid content model).
+        """
+        if data is None:
+            return []
+        key: tuple[str, str] = (data.typology, data.name)
+        if key in self.__linked_sets.keys():
+            return self.__linked_sets[key] or []
+
+        # The data is being browsed: a link back to it is a cycle.
+        self.__linked_sets[key] = None
+        result: list[DataModel] = self.__get_linked_sets(data.parent) + [data] + data.mandatory
+        self.__linked_sets[key] = result
+        return result
+
+    def __get_linked_data(self, data: Optional[DataModel]) -> list[DataModel]:
+        """
+        Gets a data, its ancestors and the aspects brought by its mandatory aspects, each of them once: the data linked
+        to its parent, then the data itself, then the data linked to each of its mandatory aspects. The result is
+        memoized, the data shared by several data being browsed once.
+        :param data: The data model.
+        :return: The data models, empty in a cycle (an invalid content model).
+        """
+        if data is None:
+            return []
+        key: tuple[str, str] = (data.typology, data.name)
+        if key in self.__linked_data.keys():
+            return self.__linked_data[key] or []
+
+        # The data is being browsed: a link back to it is a cycle.
+        self.__linked_data[key] = None
+        result: list[DataModel] = []
+        browsed: set[int] = set()
+        for linked in [self.__get_linked_data(data.parent), [data]] \
+                + [self.__get_linked_data(aspect) for aspect in data.mandatory]:
+            for item in linked:
+                if id(item) not in browsed:
+                    browsed.add(id(item))
+                    result.append(item)
+        self.__linked_data[key] = result
+        return result
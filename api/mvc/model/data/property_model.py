@@ -35,6 +35,14 @@ class PropertyModel:
     def title(self) -> str:
         return self.__title
 
+    @property
+    def description(self) -> str:
+        return self.__description
+
+    @property
+    def mandatory(self) -> bool:
+        return self.__mandatory
+
     @property
     def typology(self) -> str:
         return self.__typology
@@ -37,41 +37,13 @@ class AspectService(Service, ABC):
         self.__scfs.add_aspect_document_library(project, content_model, aspect)
         self.__scfs.add_aspect_evaluator(project, aspect)
         self.__scfs.add_aspect_set(project, aspect)
-        self.__add_linked_aspect(project, aspect, aspect)
+        self.__scfs.add_parent_mandatory_sets(project, aspect, content_model.property_index.get_effective_sets(aspect))
 
     def add_properties_aspect_in_share_config_file(self, property_controller: IPropertyController,
-                                                   project: ProjectModel, aspect: AspectModel):
-        for property_model in aspect.properties:
-            property_controller.add_property_in_share_config_file(project, aspect, property_model)
-
-        self.__add_linked_aspect_properties(property_controller, project, aspect, aspect)
-
-    def __add_linked_aspect_properties(self, property_controller: IPropertyController, project: ProjectModel, aspect_source: AspectModel, aspect_linked: AspectModel):
-        if aspect_linked is None:
-            return
-
-        if aspect_linked.parent is not None:
-            self.__add_linked_aspect_properties(property_controller, project, aspect_source, aspect_linked)
-
-        if aspect_source.complete_name.__ne__(aspect_linked.complete_name):
-            for property_model in aspect_linked.properties:
-                property_controller.add_property_in_share_config_file(project, aspect_source, property_model)
-
-        for mandatory in aspect_linked.mandatory:
-            self.__add_linked_aspect_properties(property_controller, project, aspect_source, mandatory)
-
-    def __add_linked_aspect(self, project: ProjectModel, aspect_source: AspectModel, aspect_linked: AspectModel):
-        if aspect_linked is None:
-            return
-
-        if aspect_linked.parent is not None:
-            self.__add_linked_aspect(project, aspect_source, aspect_linked.parent)
-
-        if aspect_source.complete_name.__ne__(aspect_linked.complete_name):
-            self.__scfs.add_parent_mandatory_data(project, aspect_source, aspect_linked)
-
-        for mandatory in aspect_linked.mandatory:
-            self.__scfs.add_parent_mandatory_data(project, aspect_source, mandatory)
+                                                   project: ProjectModel, content_model: ContentModel,
+                                                   aspect: AspectModel):
+        property_controller.add_properties_in_share_config_file(
+            project, aspect, content_model.property_index.get_effective_properties(aspect))
 
     def init_manual(self):
         """
@@ -88,6 +60,11 @@ class AspectService(Service, ABC):
         self._ms.new_manual("new", "Create a new aspect in a content-model.")
         self._ms.add_call()
         self._ms.add_argument("cm_prefix:cm_name", "The complete content-model name", "str")
+        self._ms.add_argument("--name", "Option to give the aspect name instead of entering it.", "str")
+        self._ms.add_argument("--title", "Option to give the aspect title instead of entering it.", "str")
+        self._ms.add_argument("--description", "Option to give the aspect description instead of entering it.", "str")
+        self._ms.add_argument("--json", "Option to read the aspects from a JSON file (or from the standard input with "
+                                        "'-'), containing an object or an array of objects.", "str")
         self._ms.save()
 
     def __extend_manual(self):
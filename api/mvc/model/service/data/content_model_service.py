@@ -1,10 +1,13 @@
 import os
 from abc import ABC
 from typing import Optional
+from xml.etree.ElementTree import Element
 
 from api.mvc.model.data.content_model import ContentModel
+from api.mvc.model.data.data_model import DataModel
 from api.mvc.model.data.project_model import ProjectModel
 from api.mvc.model.service.file.content_model_service import ContentModelFileService
+from api.mvc.model.service.file.model_index_service import ModelIndexFileService
 from api.mvc.model.service.file.share_slingshot_app_context import ShareSlingshotApplicationContext
 from api_core.helper.file_folder_helper import FileFolderHelper
 from api_core.helper.string_helper import StringHelper
@@ -23,6 +26,7 @@ class ContentModelService(Service, ABC):
         super().__init__("model")
         self.__cmfs: ContentModelFileService = ContentModelFileService()
         self.__ssac: ShareSlingshotApplicationContext = ShareSlingshotApplicationContext()
+        self.__mifs: ModelIndexFileService = ModelIndexFileService()
         self.__content_model_template_filepath: str = "{0}{1}content_model_template".format(api_template_folder, os.sep)
 
     def new(self, project: ProjectModel, prefix: str, name: str, description: Optional[str], author: Optional[str]) \
@@ -35,6 +39,78 @@ class ContentModelService(Service, ABC):
         self.__cmfs.create_content_model(filepath, prefix, name, description, author)
         return ContentModel(project, prefix, name, filepath)
 
+    @staticmethod
+    def read_content_model(project: ProjectModel, filepath: str) -> ContentModel:
+        """
+        Reads a content model file and builds its data model graph. The method only depends on its arguments so that
+        it can be run in a worker process.
+        :param project: A data model for the project.
+        :param filepath: The absolute path to the content model file.
+        :return: The data model of the content model with its aspects, types and properties.
+        """
+        cmfs: ContentModelFileService = ContentModelFileService()
+        content_model: ContentModel = ContentModel(project, cmfs.extract_content_model_prefix(filepath),
+                                                   cmfs.extract_content_model_name(filepath), filepath)
+        cmfs.load(content_model)
+        return content_model
+
+    def read_content_models(self, project: ProjectModel, filepaths: list[str], jobs: int) -> list[ContentModel]:
+        """
+        Reads content model files, in a pool of worker processes if several jobs are allowed.
+        :param project: A data model for the project.
+        :param filepaths: The absolute paths to the content model files.
+        :param jobs: The maximum number of worker processes.
+        :return: The data models of the content models, in the order of the files.
+        """
+        workers: int = min(jobs, len(filepaths))
+        if workers.__le__(1):
+            return [self.read_content_model(project, filepath) for filepath in filepaths]
+
+        # Imported here since the process pool is slow to load and rarely used.
+        from concurrent.futures import ProcessPoolExecutor
+        # The results are returned in the order of the files whatever the order in which the workers finish.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(ContentModelService.read_content_model, [project] * len(filepaths), filepaths))
+
+    def find_content_model(self, project: ProjectModel, prefix: str, name: str) -> Optional[str]:
+        """
+        Finds the file of a content model in the index of the project.
+        :param project: A data model for the project.
+        :param prefix: The content model prefix.
+        :param name: The content model name.
+        :return: The absolute path to the content model file or None if the project has no such content model.
+        """
+        return self.__mifs.find_content_model(project, prefix, name)
+
+    def is_data_indexed(self, project: ProjectModel, prefix: str) -> bool:
+        """
+        Indicates whether the aspects, types and properties of a content model are in the index of the project.
+        :param project: A data model for the project.
+        :param prefix: The content model prefix.
+        :return: True if the data of the content model are indexed otherwise False (its file is invalid).
+        """
+        return self.__mifs.is_data_indexed(project, prefix)
+
+    def find_data(self, project: ProjectModel, typology: str, complete_name: str) -> Optional[str]:
+        """
+        Finds the file declaring an aspect or a type in the index of the project.
+        :param project: A data model for the project.
+        :param typology: The data typology.
+        :param complete_name: The complete name (prefix:name) of the aspect or the type.
+        :return: The absolute path to the content model file or None if no file declares it.
+        """
+        return self.__mifs.find_data(project, typology, complete_name)
+
+    def find_property(self, project: ProjectModel, complete_name: str) -> Optional[tuple[str, str]]:
+        """
+        Finds the file and the aspect or type declaring a property in the index of the project.
+        :param project: A data model for the project.
+        :param complete_name: The complete name (prefix:name) of the property.
+        :return: A tuple composed of the absolute path to the content model file and the complete name of the aspect or
+        type declaring the property, or None if no file declares it.
+        """
+        return self.__mifs.find_property(project, complete_name)
+
     def is_prefix_exists(self, project: ProjectModel, prefix: str) -> tuple[bool, Optional[str]]:
         """
         Checks if the prefix is already present in a content model definition file. It returns a tuple composed of a
@@ -44,50 +120,98 @@ class ContentModelService(Service, ABC):
         :return: A tuple composed of a boolean of true and the name of the file if the file exists, otherwise false
         and None.
         """
-        contents: list[str] = FileFolderHelper.get_contents(project.content_model_folder)
-
-        index: int = 0
-        cm_name: Optional[str] = None
-        maximum: int = len(contents)
-
-        while index.__lt__(maximum) and cm_name is None:
-            if self.__cmfs.extract_content_model_prefix("{1}{0}{2}".format(os.sep, project.content_model_folder, contents[index])) \
-                    .__eq__(prefix):
-                cm_name = contents[index]
-            else:
-                index += 1
-
-        return index.__lt__(maximum), cm_name
+        filepath: Optional[str] = self.__mifs.find_content_model(project, prefix=prefix)
+        return filepath is not None, None if filepath is None else FileFolderHelper.extract_filename_from_path(filepath)
 
     def is_name_exists(self, project: ProjectModel, name: str) -> tuple[bool, Optional[str]]:
         """
-        Checks if the prefix is already present in a content model definition file. It returns a tuple composed of a
+        Checks if the name is already present in a content model definition file. It returns a tuple composed of a
         boolean of true and the name of the file if the file exists, otherwise false and None.
         :param project: A data model for the project.
         :param name: The content model name.
         :return: A tuple composed of a boolean of true and the name of the file if the file exists, otherwise false
         and None.
         """
-        contents: list[str] = FileFolderHelper.get_contents(project.content_model_folder)
+        filepath: Optional[str] = self.__mifs.find_content_model(project, name=name)
+        return filepath is not None, None if filepath is None else FileFolderHelper.extract_filename_from_path(filepath)
+
+    def get_data_nodes(self, content_model: ContentModel, typology: str) -> dict[str, Element]:
+        """
+        Finds all the aspects or types nodes of a content model.
+        :param content_model: A data model of a content-model.
+        :param typology: The data typology.
+        :return: The data nodes indexed by data name.
+        """
+        return self.__cmfs.get_data_nodes(content_model, typology)
 
-        index: int = 0
-        cm_name: Optional[str] = None
-        maximum: int = len(contents)
+    def get_property_names(self, content_model: ContentModel) -> list[str]:
+        """
+        Retrieves the names of all the properties of a content model.
+        :param content_model: A data model of a content-model.
+        :return: The list of property names.
+        """
+        return self.__cmfs.get_properties(content_model)
 
-        while index.__lt__(maximum) and cm_name is None:
-            if self.__cmfs.extract_content_model_name("{1}{0}{2}".format(os.sep, project.content_model_folder,
-                                                                         contents[index])).__eq__(name):
-                cm_name = contents[index]
-            else:
-                index += 1
+    def add_aspect(self, content_model: ContentModel, name: str, title: str, description: str) -> Element:
+        """
+        Adds an aspect to a content model.
+        :param content_model: A data model of a content-model.
+        :param name: The aspect name.
+        :param title: The aspect title.
+        :param description: The aspect description.
+        :return: The node of the aspect.
+        """
+        return self.__cmfs.add_aspect(content_model, name, title, description)
 
-        return index.__lt__(maximum), cm_name
+    def add_type(self, content_model: ContentModel, name: str, title: str, description: str) -> Element:
+        """
+        Adds a type to a content model.
+        :param content_model: A data model of a content-model.
+        :param name: The type name.
+        :param title: The type title.
+        :param description: The type description.
+        :return: The node of the type.
+        """
+        return self.__cmfs.add_type(content_model, name, title, description)
+
+    def extend(self, content_model: ContentModel, source: DataModel, parent: DataModel):
+        """
+        Sets the parent of an aspect or a type.
+        :param content_model: A data model of a content-model.
+        :param source: The aspect or the type.
+        :param parent: The parent.
+        """
+        self.__cmfs.add_extension(content_model, source, parent)
+
+    def mandatory(self, content_model: ContentModel, source: DataModel, mandatory: DataModel):
+        """
+        Adds a mandatory aspect to an aspect or a type.
+        :param content_model: A data model of a content-model.
+        :param source: The aspect or the type.
+        :param mandatory: The mandatory aspect.
+        """
+        self.__cmfs.add_mandatory(content_model, source, mandatory)
+
+    def add_property(self, content_model: ContentModel, data_node: Element, name: str, title: str, description: str,
+                     typology: str, mandatory: bool):
+        """
+        Adds a property to the node of an aspect or a type.
+        :param content_model: A data model of a content-model.
+        :param data_node: The node of the aspect or the type.
+        :param name: The property name.
+        :param title: The property title.
+        :param description: The property description.
+        :param typology: The property type.
+        :param mandatory: Indicates whether the property is mandatory.
+        """
+        self.__cmfs.add_property_node(content_model, data_node, name, title, description, typology, mandatory)
 
     def init_manual(self):
         """
         Initializes the service manual.
         """
         self.__new_manual()
+        self.__import_manual()
 
     def __new_manual(self):
         """
@@ -95,6 +219,27 @@ class ContentModelService(Service, ABC):
         """
         self._ms.new_manual("new", "Create a new content model.")
         self._ms.add_call()
+        self._ms.add_argument("--prefix", "Option to give the content model prefix instead of entering it.", "str")
+        self._ms.add_argument("--name", "Option to give the content model name instead of entering it.", "str")
+        self._ms.add_argument("--description", "Option to give the content model description instead of entering it.",
+                              "str")
+        self._ms.add_argument("--last-name", "Option to give the author's last name instead of entering it.", "str")
+        self._ms.add_argument("--first-name", "Option to give the author's first name instead of entering it.", "str")
+        self._ms.add_argument("--json", "Option to read the content models from a JSON file (or from the standard "
+                                        "input with '-'), containing an object or an array of objects.", "str")
+        self._ms.save()
+
+    def __import_manual(self):
+        """
+        Add the import content-model command in manual.
+        """
+        self._ms.new_manual("import", "Import aspects and properties into a content model from a CSV file.")
+        self._ms.add_call()
+        self._ms.add_argument("cm_prefix:cm_name", "The complete content-model name", "str")
+        self._ms.add_argument("csv_file", "The CSV file, whose header names the columns 'aspect', 'property', 'type', "
+                                          "'title', 'description' and 'mandatory'. A row without property declares "
+                                          "an aspect, the other rows add a property to their aspect (created if "
+                                          "needed).", "str")
         self._ms.save()
 
     def add_share_file_message_labels(self, project: ProjectModel, content_model: ContentModel):
@@ -1,11 +1,17 @@
-import subprocess
+import os
 from abc import ABC
+from typing import Optional
 
+from xml.etree.ElementTree import Element
+
+from api.mvc.model.data.content_model import ContentModel
 from api.mvc.model.data.project_model import ProjectModel
 from api.mvc.model.service.file.bootstrap_service import BootstrapFileService
+from api.mvc.model.service.file.manifest_service import ManifestFileService
 from api.mvc.model.service.file.service_context_service import ServiceContextFileService
 from api.mvc.model.service.file.share_config_service import ShareConfigFileService
 from api.mvc.model.service.file.share_slingshot_app_context import ShareSlingshotApplicationContext
+from api.mvc.model.service.file.spec_service import SpecFileService
 from api.mvc.model.service.file.webscript_service import WebScriptFileService
 from api_core.helper.file_folder_helper import FileFolderHelper
 from api_core.mvc.service.model.service import Service
@@ -23,6 +29,8 @@ class ProjectService(Service, ABC):
         self.__scfs: ShareConfigFileService = ShareConfigFileService()
         self.__sctxtfs: ServiceContextFileService = ServiceContextFileService()
         self.__ssac: ShareSlingshotApplicationContext = ShareSlingshotApplicationContext()
+        self.__mfs: ManifestFileService = ManifestFileService()
+        self.__sfs: SpecFileService = SpecFileService()
 
     @staticmethod
     def new(sdk: str, group_id: str, artifact_id: str) -> tuple[int, str, str]:
@@ -33,6 +41,7 @@ class ProjectService(Service, ABC):
         :param artifact_id: The value of the Alfresco All-in-One project artifact id to create.
         :return: The execution status of the creation command.
         """
+        import subprocess
         # Create the maven project
         child_process: subprocess.Popen = subprocess.Popen(
             "mvn archetype:generate -D\"archetypeGroupId=org.alfresco.maven.archetype\" "
@@ -45,13 +54,160 @@ class ProjectService(Service, ABC):
         return child_process.returncode, out, err
 
     def reset(self, project: ProjectModel):
-        self.__bfs.reset(project)
-        self.__scfs.reset(project)
-        self.__wsfs.reset(project)
-        self.__ssac.reset(project)
-        self.__sctxtfs.reset(project)
-
+        self.reset_generated_files(project)
         FileFolderHelper.remove_content(project.share_message_folder)
+        self.__mfs.remove(project)
+
+    def reset_generated_files(self, project: ProjectModel):
+        """
+        Resets the XML files generated from the content models.
+        :param project: The data model of the project.
+        """
+        with self.session():
+            self.__bfs.reset(project)
+            self.__scfs.reset(project)
+            self.__wsfs.reset(project)
+            self.__ssac.reset(project)
+            self.__sctxtfs.reset(project)
+
+    @staticmethod
+    def remove_unused_share_message_files(project: ProjectModel):
+        """
+        Removes the share message files which do not belong to any content model of the project anymore.
+        :param project: The data model of the project (with its content models loaded).
+        """
+        used: list[str] = [content_model.share_message_file_path for content_model in project.content_models
+                           if len(content_model.aspects).__gt__(0)]
+        for content in FileFolderHelper.get_contents(project.share_message_folder):
+            path: str = "{1}{0}{2}".format(os.sep, project.share_message_folder, content)
+            if path not in used:
+                FileFolderHelper.remove_file(path)
+
+    @staticmethod
+    def get_input_hashes(project: ProjectModel, content_model_file_paths: list[str]) -> dict[str, str]:
+        """
+        Computes the hash of the files from which the project files are generated.
+        :param project: The data model of the project.
+        :param content_model_file_paths: The absolute paths to the content model files.
+        :return: The hashes of the files indexed by their path relative to the project folder.
+        """
+        result: dict[str, str] = {}
+        for path in [project.pom_filepath] + content_model_file_paths:
+            result[os.path.relpath(path, project.path)] = FileFolderHelper.get_file_hash(path)
+        return result
+
+    @staticmethod
+    def get_output_hashes(project: ProjectModel) -> dict[str, str]:
+        """
+        Computes the hash of the files generated from the content models.
+        :param project: The data model of the project (with its content models loaded).
+        :return: The hashes of the existing files indexed by their path relative to the project folder.
+        """
+        paths: list[str] = [project.bootstrap_filepath, project.share_config_filepath,
+                            project.platform_webscript_filepath, project.share_slingshot_application_context_filepath,
+                            project.service_context_filepath]
+        for content_model in project.content_models:
+            paths.append(content_model.platform_message_file_path)
+            paths.append(content_model.share_message_file_path)
+
+        result: dict[str, str] = {}
+        for path in paths:
+            file_hash: Optional[str] = FileFolderHelper.get_file_hash(path)
+            if file_hash is not None:
+                result[os.path.relpath(path, project.path)] = file_hash
+        return result
+
+    def get_changed_content_model_files(self, project: ProjectModel, inputs: dict[str, str]) -> Optional[list[str]]:
+        """
+        Lists the content model files modified since the last load of the project, whose files may be generated again
+        one content model at a time.
+        :param project: The data model of the project.
+        :param inputs: The hashes of the current inputs indexed by their path relative to the project folder.
+        :return: The absolute paths to the modified content model files (empty if the project files are up to date),
+        or None if every file must be generated again: there is no manifest, the POM file changed, a content model
+        file was added or removed, or a generated file was modified since then.
+        """
+        manifest: Optional[tuple[dict[str, str], dict[str, str], dict[str, str]]] = self.__mfs.read(project)
+        if manifest is None or set(manifest[0].keys()).__ne__(set(inputs.keys())):
+            return None
+
+        pom: str = os.path.relpath(project.pom_filepath, project.path)
+        if manifest[0][pom] != inputs[pom]:
+            return None
+
+        for path in manifest[2].keys():
+            if manifest[2][path].__ne__(FileFolderHelper.get_file_hash("{1}{0}{2}".format(os.sep, project.path, path))):
+                return None
+        return ["{1}{0}{2}".format(os.sep, project.path, path) for path in sorted(inputs.keys())
+                if manifest[0][path] != inputs[path]]
+
+    def get_content_model_names(self, project: ProjectModel) -> dict[str, str]:
+        """
+        Gets the complete names of the content models recorded by the last load of the project.
+        :param project: The data model of the project.
+        :return: The complete names indexed by the path to the content model files relative to the project folder,
+        empty if there is no manifest.
+        """
+        manifest: Optional[tuple[dict[str, str], dict[str, str], dict[str, str]]] = self.__mfs.read(project)
+        return {} if manifest is None else manifest[1]
+
+    def save_manifest(self, project: ProjectModel, inputs: dict[str, str]):
+        """
+        Records the inputs of the last load of the project and the files it generated.
+        :param project: The data model of the project (with its content models loaded).
+        :param inputs: The hashes of the inputs indexed by their path relative to the project folder.
+        """
+        self.__mfs.write(project, inputs, self.__get_names(project), self.get_output_hashes(project))
+
+    def update_manifest(self, project: ProjectModel, inputs: dict[str, str]):
+        """
+        Records the inputs of the project after the files of some of its content models were generated again.
+        :param project: The data model of the project (with the content models whose files were generated again).
+        :param inputs: The hashes of the inputs indexed by their path relative to the project folder.
+        """
+        manifest: Optional[tuple[dict[str, str], dict[str, str], dict[str, str]]] = self.__mfs.read(project)
+        names: dict[str, str] = {} if manifest is None else manifest[1]
+        names.update(self.__get_names(project))
+        paths: set[str] = set() if manifest is None else set(manifest[2].keys())
+        paths.update(self.get_output_hashes(project).keys())
+        for content_model in project.content_models:
+            paths.add(os.path.relpath(content_model.platform_message_file_path, project.path))
+            paths.add(os.path.relpath(content_model.share_message_file_path, project.path))
+
+        outputs: dict[str, str] = {}
+        for path in paths:
+            file_hash: Optional[str] = FileFolderHelper.get_file_hash("{1}{0}{2}".format(os.sep, project.path, path))
+            if file_hash is not None:
+                outputs[path] = file_hash
+        self.__mfs.write(project, inputs, names, outputs)
+
+    @staticmethod
+    def __get_names(project: ProjectModel) -> dict[str, str]:
+        """
+        Gets the complete names of the content models of a project.
+        :param project: The data model of the project (with its content models loaded).
+        :return: The complete names indexed by the path to the content model files relative to the project folder.
+        """
+        return {os.path.relpath(content_model.path, project.path): content_model.complete_name
+                for content_model in project.content_models}
+
+    def detach_content_model(self, project: ProjectModel, content_model: ContentModel) \
+            -> tuple[list[Element], list[Element]]:
+        """
+        Removes the share configuration entries of a content model, and returns the entries following them.
+        :param project: The data model of the project.
+        :param content_model: The content model whose entries are removed.
+        :return: The entries following the ones of the content model.
+        """
+        return self.__scfs.detach_content_model(project, content_model)
+
+    def attach_entries(self, project: ProjectModel, entries: tuple[list[Element], list[Element]]):
+        """
+        Restores the share configuration entries returned by 'detach_content_model'.
+        :param project: The data model of the project.
+        :param entries: The entries to restore.
+        """
+        self.__scfs.attach_entries(project, entries)
 
     def raz(self, project: ProjectModel):
         self.reset(project)
@@ -67,12 +223,21 @@ class ProjectService(Service, ABC):
         FileFolderHelper.remove_content(project.workflow_process_folder)
         FileFolderHelper.remove_content(project.content_model_message_absolute_folder_path)
 
+    def read_spec(self, spec_file_path: str) -> dict:
+        """
+        Reads a project spec.
+        :param spec_file_path: The path to the spec file.
+        :return: The project spec.
+        """
+        return self.__sfs.read(spec_file_path)
+
     def init_manual(self):
         """
         Initializes the service manual.
         """
         self.__new_manual()
         self.__load_manual()
+        self.__apply_manual()
         self.__raz_manual()
         self.__reset_manual()
 
@@ -82,6 +247,11 @@ class ProjectService(Service, ABC):
         """
         self._ms.new_manual("new", "Creates a new Alfresco All-In-One project.")
         self._ms.add_call()
+        self._ms.add_argument("--sdk", "Option to give the Alfresco SDK version instead of entering it.", "str")
+        self._ms.add_argument("--group-id", "Option to give the project group id instead of entering it.", "str")
+        self._ms.add_argument("--artifact-id", "Option to give the project artifact id instead of entering it.", "str")
+        self._ms.add_argument("--json", "Option to read the project from a JSON file (or from the standard input with "
+                                        "'-'), containing an object.", "str")
         self._ms.save()
 
     def __load_manual(self):
@@ -90,6 +260,26 @@ class ProjectService(Service, ABC):
         """
         self._ms.new_manual("load", "Load an Alfresco All-In-One project.")
         self._ms.add_call()
+        self._ms.add_argument("--jobs", "Option to read the content model files in parallel with the given maximum "
+                                        "number of worker processes.", "int")
+        self._ms.add_argument("--force", "Option to generate every file even if the content models have not changed "
+                                         "since the last load (only the files of the changed ones are generated "
+                                         "again otherwise).", "flag")
+        self._ms.save()
+
+    def __apply_manual(self):
+        """
+        Add the apply project command in manual.
+        """
+        self._ms.new_manual("apply", "Adds to the content model files what a project spec declares and they lack, "
+                                     "then generates the project files. Nothing is written if the files already match "
+                                     "the spec.")
+        self._ms.add_call()
+        self._ms.add_argument("spec_file", "The spec file (JSON, or YAML if its extension is '.yaml' or '.yml'). Its "
+                                           "'content_models' field lists content models (prefix, name, description, "
+                                           "author, aspects, types), their aspects and types (name, title, "
+                                           "description, parent, mandatory_aspects, properties) and their properties "
+                                           "(name, title, description, type, mandatory).", "str")
         self._ms.save()
 
     def __reset_manual(self):
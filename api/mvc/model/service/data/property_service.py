@@ -35,6 +35,10 @@ class PropertyService(Service, ABC):
         self.__scfs.add_property(project, data, property_model)
         pass
 
+    def add_properties_in_share_config_file(self, project: ProjectModel, data: DataModel,
+                                            properties: list[PropertyModel]):
+        self.__scfs.add_properties(project, data, properties)
+
     def __new_manual(self):
         """
         Add the new property model command in manual.
@@ -43,5 +47,13 @@ class PropertyService(Service, ABC):
         self._ms.add_call()
         self._ms.add_argument("cm_prefix:cm_name", "The complete content-model name", "str")
         self._ms.add_argument("data_name", "The name of the data (aspect or type) to add the property to", "str")
+        self._ms.add_argument("--name", "Option to give the property name instead of entering it.", "str")
+        self._ms.add_argument("--title", "Option to give the property title instead of entering it.", "str")
+        self._ms.add_argument("--description", "Option to give the property description instead of entering it.",
+                              "str")
+        self._ms.add_argument("--type", "Option to give the property type instead of entering it.", "str")
+        self._ms.add_argument("--mandatory", "Option to indicate whether the property is mandatory (y/n).", "bool")
+        self._ms.add_argument("--json", "Option to read the properties from a JSON file (or from the standard input "
+                                        "with '-'), containing an object or an array of objects.", "str")
 
         self._ms.save()
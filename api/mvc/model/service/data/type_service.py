@@ -42,6 +42,12 @@ class TypeService(Service, ABC):
         self._ms.new_manual("new", "Create a type in a content-model.")
         self._ms.add_call()
         self._ms.add_argument("cm_prefix:cm_name", "The complete content-model name", "str")
+        self._ms.add_argument("--name", "Option to give the type name instead of entering it.", "str")
+        self._ms.add_argument("--title", "Option to give the type title instead of entering it.", "str")
+        self._ms.add_argument("--description", "Option to give the type description instead of entering it.", "str")
+        self._ms.add_argument("--parent", "Option to give the name of the parent type instead of entering it.", "str")
+        self._ms.add_argument("--json", "Option to read the types from a JSON file (or from the standard input with "
+                                        "'-'), containing an object or an array of objects.", "str")
         self._ms.save()
 
     def __extend_manual(self):
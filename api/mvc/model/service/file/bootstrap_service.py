@@ -23,12 +23,9 @@ class BootstrapFileService(XmlFileService):
         Reset the 'bootstrap-context.xml' file of the platform project of the alfresco project.
         :param project: The project data model.
         """
-        # Delete file.
-        FileFolderHelper.remove_file(project.bootstrap_filepath)
         # File rewritten.
         # Creating the 'beans' node.
-        beans: Element = Element("beans")
-        beans.set("xmlns", "http://www.springframework.org/schema/beans")
+        beans: Element = self._new_element("beans")
         beans.set("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
         beans.set("xsi:schemaLocation", "http://www.springframework.org/schema/beans "
                                         "http://www.springframework.org/schema/beans/spring-beans-3.0.xsd")
@@ -51,7 +48,7 @@ class BootstrapFileService(XmlFileService):
         filename: str = self.__get_value_filename(content_model, "models")
 
         # Creation of the value to be created.
-        value: Element = Element("value")
+        value: Element = self._new_element("value")
         value.text = "alfresco/module/${project.artifactId}/model/" + filename
 
         # Checking that the parent node of 'value' exists.
@@ -107,8 +104,8 @@ class BootstrapFileService(XmlFileService):
             return
 
         filename: str = self.__get_value_filename(content_model, "labels")
-        value = Element("value")
-        value.text = "alfresco/module/${project.artifactId}/messages/" + filename[:filename.rfind(".properties")]
+        value = self._new_element("value")
+        value.text = "alfresco/module/${project.artifactId}/messages/" + filename
 
         # Checking that the parent node of 'value' exists.
         (is_created, list_node) = self.__get_create_list_node(root, project, "labels")
@@ -163,7 +160,7 @@ class BootstrapFileService(XmlFileService):
         namespace: str = self.get_namespace("xmlns")
         node: Optional[Element] = root.find(".//{0}bean[@id='{1}-platform.dictionaryBootstrap']/{0}property[@name="
                                             "'{2}']/{0}list".format(namespace, project.artifact_id, property_type))
-        return (True, Element("list")) if node is None else (False, node)
+        return (True, self._new_element("list")) if node is None else (False, node)
 
     def __get_create_property_node(self, root: Element, project: ProjectModel, property_type: str) \
             -> tuple[bool, Element]:
@@ -177,7 +174,7 @@ class BootstrapFileService(XmlFileService):
         node: Optional[Element] = root.find(".//{0}bean[@id='{1}-platform.dictionaryBootstrap']/{0}property"
                                             "[@name='{2}']".format(namespace, project.artifact_id, property_type))
         if node is None:
-            node = Element("property")
+            node = self._new_element("property")
             node.set("name", property_type)
             return True, node
 
@@ -194,7 +191,7 @@ class BootstrapFileService(XmlFileService):
         node: Optional[Element] = root.find(".//{0}bean[@id='{1}-platform.dictionaryBootstrap']"
                                             .format(namespace, project.artifact_id))
         if node is None:
-            node = Element("bean")
+            node = self._new_element("bean")
             node.set("id", "{0}-platform.dictionaryBootstrap".format(project.artifact_id))
             node.set("parent", "dictionaryModelBootstrap")
             node.set("depends-on", "dictionaryBootstrap")
@@ -247,7 +244,7 @@ class BootstrapFileService(XmlFileService):
 
     @staticmethod
     def __get_value_filename(content_model: ContentModel, property_type: str) -> str:
-        filename: str = FileFolderHelper.extract_filename_from_path(content_model.path)
         if property_type.__eq__("labels"):
-            filename = filename[:filename.rfind(".properties")-2]
-        return filename
+            filename: str = FileFolderHelper.extract_filename_from_path(content_model.platform_message_file_path)
+            return filename[:filename.rfind(".properties")]
+        return FileFolderHelper.extract_filename_from_path(content_model.path)
@@ -1,9 +1,14 @@
 from typing import Optional
 from xml.etree.ElementTree import Element, Comment
 
+from api.mvc.model.data.aspect_model import AspectModel
 from api.mvc.model.data.content_model import ContentModel
+from api.mvc.model.data.content_type_model import ContentTypeModel
 from api.mvc.model.data.data_model import DataModel
 from api.mvc.model.data.data_type import DataType
+from api.mvc.model.data.folder_type_model import FolderTypeModel
+from api.mvc.model.data.property_model import PropertyModel
+from api.mvc.model.data.type_model import TypeModel
 from api_core.exception.api_exception import ApiException
 from api_core.helper.file_folder_helper import FileFolderHelper
 from api_core.helper.string_helper import StringHelper
@@ -71,50 +76,46 @@ class ContentModelFileService(XmlFileService):
 
     def create_content_model(self, content_model_file_path: str, prefix: str, name: str, description: Optional[str],
                              author: Optional[str]):
-        model: Element = Element("model")
+        # The xml namespace is declared by the node itself.
+        model: Element = self._new_element("model")
         model.set("name", "{0}:{1}".format(prefix, name))
 
-        # Set xml namespace.
-        if self.namespaces is not None:
-            for item in self.namespaces:
-                model.set(item[0], item[1])
-
         model.append(Comment(" Optional meta-data about the model "))
 
         # Set the description
-        description_node: Element = Element("description")
+        description_node: Element = self._new_element("description")
         description_node.text = description if description is not None else "SET THE PROJECT DESCRIPTION"
         model.append(description_node)
 
         # Set the author
-        author_node: Element = Element("author")
+        author_node: Element = self._new_element("author")
         author_node.text = author if author is not None else "Alfresco Helper Script 1.0.0"
         model.append(author_node)
 
         # Set the version
-        version_node: Element = Element("version")
+        version_node: Element = self._new_element("version")
         version_node.text = "1.0.0"
         model.append(version_node)
 
         # Set the imports
-        imports_node: Element = Element("imports")
+        imports_node: Element = self._new_element("imports")
         imports_node.append(Comment(" Import Alfresco Dictionary Definitions "))
         # First import
-        import1: Element = Element("import")
+        import1: Element = self._new_element("import")
         import1.set("uri", "http://www.alfresco.org/model/dictionary/1.0")
         import1.set("prefix", "d")
         imports_node.append(import1)
 
         # Second import
-        import2: Element = Element("import")
+        import2: Element = self._new_element("import")
         import2.set("uri", "http://www.alfresco.org/model/content/1.0")
         import2.set("prefix", "cm")
         imports_node.append(import2)
 
         # Set the namespaces.
-        namespaces_node: Element = Element("namespaces")
+        namespaces_node: Element = self._new_element("namespaces")
         # Set a namespace
-        namespace_node: Element = Element("namespace")
+        namespace_node: Element = self._new_element("namespace")
         namespace_node.set("uri", "http://www.{0}.org/model/content/1.0".format(name.lower()))
         namespace_node.set("prefix", prefix)
         namespaces_node.append(namespace_node)
@@ -125,8 +126,8 @@ class ContentModelFileService(XmlFileService):
         model.append(Comment(" Custom namespace for the '{0}:{1}' model ".format(prefix, name)))
         model.append(namespaces_node)
 
-        types: Element = Element("types")
-        aspects: Element = Element("aspects")
+        types: Element = self._new_element("types")
+        aspects: Element = self._new_element("aspects")
 
         model.append(types)
         model.append(aspects)
@@ -182,33 +183,47 @@ class ContentModelFileService(XmlFileService):
             data_names.append(self.__extract_data_name(data, typology, filename))
         return data_names
 
+    def get_data_nodes(self, content_model: ContentModel, typology: str) -> dict[str, Element]:
+        """
+        Finds all the aspects or types nodes of a content model.
+        :param content_model: A data model of a content-model.
+        :param typology: The type of the data to get.
+        :return: The data nodes indexed by data name.
+        """
+        result: dict[str, Element] = {}
+        filename: str = FileFolderHelper.extract_filename_from_path(content_model.path)
+        for data in self._get_root(content_model.path).findall(".//{0}{1}s/{0}{1}".format(
+                self.get_namespace("xmlns"), typology)):
+            result[self.__extract_data_name(data, typology, filename)] = data
+        return result
+
     def find_type(self, content_model: ContentModel, type_name: str) -> Optional[Element]:
         return self._get_root(content_model.path).find(".//{0}types/{0}type[@name='{1}:{2}']".format(
             self.get_namespace("xmlns"), content_model.prefix, type_name))
 
-    def add_aspect(self, content_model: ContentModel, name: str, title: str, description: str):
+    def add_aspect(self, content_model: ContentModel, name: str, title: str, description: str) -> Element:
         root: Element = self._get_root(content_model.path)
 
-        aspect: Element = Element("aspect")
+        aspect: Element = self._new_element("aspect")
         aspect.set("name", "{0}:{1}".format(content_model.prefix, name))
 
         if not StringHelper.is_empty(title):
-            title_node: Element = Element("title")
+            title_node: Element = self._new_element("title")
             title_node.text = title
             aspect.append(title_node)
 
         if not StringHelper.is_empty(description):
-            description_node: Element = Element("description")
+            description_node: Element = self._new_element("description")
             description_node.text = description
             aspect.append(description_node)
 
-        properties: Element = Element("properties")
+        properties: Element = self._new_element("properties")
         aspect.append(properties)
 
         add_to_root: bool = False
         aspects: Element = root.find(".//{0}aspects".format(self.get_namespace("xmlns"), content_model.prefix, aspect))
         if aspects is None:
-            aspects = Element("aspects")
+            aspects = self._new_element("aspects")
             add_to_root = True
 
         aspects.append(Comment(" Definition of aspect '{0}'. ".format(name)))
@@ -218,74 +233,96 @@ class ContentModelFileService(XmlFileService):
             root.append(aspects)
 
         self._write(root, content_model.path)
+        return aspect
 
-    def add_type(self, content_model: ContentModel, name: str, title: str, description: str):
+    def add_type(self, content_model: ContentModel, name: str, title: str, description: str) -> Element:
         root: Element = self._get_root(content_model.path)
 
-        type_node: Element = Element("type")
+        type_node: Element = self._new_element("type")
         type_node.set("name", "{0}:{1}".format(content_model.prefix, name))
 
         if not StringHelper.is_empty(title):
-            title_node: Element = Element("title")
+            title_node: Element = self._new_element("title")
             title_node.text = title
             type_node.append(title_node)
 
         if not StringHelper.is_empty(description):
-            description_node: Element = Element("description")
+            description_node: Element = self._new_element("description")
             description_node.text = description
             type_node.append(description_node)
 
-        properties: Element = Element("properties")
+        properties: Element = self._new_element("properties")
         type_node.append(properties)
 
         add_to_root: bool = False
         types: Element = root.find(".//{0}types".format(self.get_namespace("xmlns"), content_model.prefix, type_node))
         if types is None:
-            types = Element("types")
+            types = self._new_element("types")
             add_to_root = True
 
         types.append(Comment(" Definition of type '{0}'. ".format(name)))
         types.append(type_node)
 
+        if add_to_root:
+            # The types of a content model are defined before its aspects.
+            aspects: Optional[Element] = root.find("./{0}aspects".format(self.get_namespace("xmlns")))
+            if aspects is None:
+                root.append(types)
+            else:
+                root.insert(list(root).index(aspects), types)
+
         self._write(root, content_model.path)
+        return type_node
 
     def add_property(self, content_model: ContentModel, data: DataModel, name: str, title: Optional[str],
                      description: Optional[str], typology: str, mandatory: bool):
+        data_node: Element = self.__get_data_node(content_model, data)
+        self.add_property_node(content_model, data_node, name, title, description, typology, mandatory)
+
+    def add_property_node(self, content_model: ContentModel, data_node: Element, name: str, title: Optional[str],
+                          description: Optional[str], typology: str, mandatory: bool):
+        """
+        Adds a property to the node of an aspect or a type, without looking for the node in the content model.
+        :param content_model: A data model of a content-model.
+        :param data_node: The node of the aspect or the type.
+        :param name: The property name.
+        :param title: The property title.
+        :param description: The property description.
+        :param typology: The property type.
+        :param mandatory: Indicates whether the property is mandatory.
+        """
         root: Element = self._get_root(content_model.path)
         # Create the property
-        prop: Element = Element("property")
+        prop: Element = self._new_element("property")
         prop.set("name", "{0}:{1}".format(content_model.prefix, name))
 
         # Set the property's title.
         if not StringHelper.is_empty(title):
-            title_node: Element = Element("title")
+            title_node: Element = self._new_element("title")
             title_node.text = title
             prop.append(title_node)
 
         # Set the property's description.
         if not StringHelper.is_empty(description):
-            description_node: Element = Element("description")
+            description_node: Element = self._new_element("description")
             description_node.text = description
             prop.append(description_node)
 
         # Set the property's type.
-        type_node: Element = Element("type")
+        type_node: Element = self._new_element("type")
         type_node.text = "d:{0}".format(typology)
         prop.append(type_node)
 
         # Set the property's mandatory.
-        mandatory_node: Element = Element("mandatory")
+        mandatory_node: Element = self._new_element("mandatory")
         mandatory_node.text = "true" if mandatory else "false"
         prop.append(mandatory_node)
 
-        data_node: Optional[Element] = root.find(".//{0}{3}s/{0}{3}[@name='{1}:{2}']"
-                                                 .format(self.get_namespace("xmlns"), content_model.prefix, data.name,
-                                                         data.typology))
-
+        # The properties node is a child of the data node: its descendants (the properties) are not searched.
         add_to_data: bool = False
-        properties_node: Element = data_node.find(".//{0}properties".format(self.get_namespace("xmlns")))
+        properties_node: Element = data_node.find("./{0}properties".format(self.get_namespace("xmlns")))
         if properties_node is None:
-            properties_node = Element("properties")
+            properties_node = self._new_element("properties")
             add_to_data = True
 
         properties_node.append(prop)
@@ -298,13 +335,12 @@ class ContentModelFileService(XmlFileService):
         namespace: str = self.get_namespace("xmlns")
         root: Element = self._get_root(content_model.path)
 
-        source_node: Element = root.find(".//{0}{1}s/{0}{1}[@name='{2}:{3}']"
-                                         .format(namespace, source.typology, content_model.prefix, source.name))
+        source_node: Element = self.__get_data_node(content_model, source)
         parent_node: Optional[Element] = source_node.find("./{0}parent".format(namespace))
 
         add_parent: bool = True if parent_node is None else False
         if add_parent:
-            parent_node = Element("parent")
+            parent_node = self._new_element("parent")
 
         parent_node.text = "{0}".format(parent.complete_name)
 
@@ -317,16 +353,15 @@ class ContentModelFileService(XmlFileService):
         namespace: str = self.get_namespace("xmlns")
         root: Element = self._get_root(content_model.path)
 
-        source_node: Element = root.find(".//{0}{1}s/{0}{1}[@name='{2}:{3}']"
-                                         .format(namespace, source.typology, content_model.prefix, source.name))
+        source_node: Element = self.__get_data_node(content_model, source)
         mandatory_node: Optional[Element] = source_node.find("./{0}mandatory-aspects".format(namespace))
 
-        aspect: Element = Element("aspect")
+        aspect: Element = self._new_element("aspect")
         aspect.text = "{0}:{1}".format(content_model.prefix, mandatory.name)
 
         add_mandatory_node: bool = True if mandatory_node is None else False
         if add_mandatory_node:
-            mandatory_node = Element("mandatory-aspects")
+            mandatory_node = self._new_element("mandatory-aspects")
         mandatory_node.append(aspect)
         if add_mandatory_node:
             source_node.append(mandatory_node)
@@ -513,6 +548,20 @@ class ContentModelFileService(XmlFileService):
 
         return result
 
+    def __get_data_node(self, content_model: ContentModel, data: DataModel) -> Element:
+        """
+        Retrieve the node of a data (aspect or type) in a content model file.
+        :param content_model: A data model of a content-model.
+        :param data: The data model.
+        :return: The data node.
+        """
+        data_node: Optional[Element] = self.find_data(content_model, data.typology, data.name)
+        if data_node is None:
+            raise ApiException("The '{0}' {1} does not exist in the '{2}' content-model of the '{3}' file."
+                               .format(data.name, data.typology, content_model.complete_name,
+                                       FileFolderHelper.extract_filename_from_path(content_model.path)))
+        return data_node
+
     def __get_properties_node_index(self, data_node: Element) -> int:
         namespace: str = self.get_namespace("xmlns")
         children: list[Element] = data_node.findall(".//{0}*".format(namespace))
@@ -524,6 +573,122 @@ class ContentModelFileService(XmlFileService):
 
         return index if index.__lt__(maximum) else (index - 1)
 
+    def load(self, content_model: ContentModel):
+        """
+        Reads the content model file in a single pass and builds its data models: the aspects and types with their
+        properties, then the links to their parent and to their mandatory aspects.
+        :param content_model: A data model of a content-model.
+        """
+        namespace: str = self.get_namespace("xmlns")
+        root: Element = self._get_root(content_model.path)
+        filename: str = FileFolderHelper.extract_filename_from_path(content_model.path)
+        # The parent and mandatory aspects declared by each data, resolved once all the data is known.
+        links: list[tuple[DataModel, Optional[str], list[str]]] = []
+
+        for typology in [DataType.ASPECT.value, DataType.TYPE.value]:
+            for node in root.findall(".//{0}{1}s/{0}{1}".format(namespace, typology)):
+                name: str = self.__extract_data_name(node, typology, filename)
+                if content_model.get_data(typology, name) is not None:
+                    raise ApiException("{3} '{0}' was declared more than once in content model '{1}' in file '{2}'."
+                                       .format(name, content_model.complete_name, filename, typology.title()))
+
+                title_node: Optional[Element] = node.find("./{0}title".format(namespace))
+                description_node: Optional[Element] = node.find("./{0}description".format(namespace))
+                title: Optional[str] = None if title_node is None else title_node.text
+                description: Optional[str] = None if description_node is None else description_node.text
+
+                data: DataModel
+                if typology.__eq__(DataType.ASPECT.value):
+                    data = AspectModel(content_model, name, title, description)
+                    content_model.add_aspect(data)
+                else:
+                    data = TypeModel(content_model, name, title, description)
+                    content_model.add_type(data)
+
+                for prop in node.findall("./{0}properties/{0}property".format(namespace)):
+                    (property_name, property_title, property_description, property_typology, mandatory) = \
+                        self.__read_property(content_model, data, self.__extract_property_name(prop, filename), prop)
+                    data.add_property(PropertyModel(data, property_name, property_title, property_description,
+                                                    mandatory, property_typology))
+
+                parent_node: Optional[Element] = node.find("./{0}parent".format(namespace))
+                links.append((data, None if parent_node is None else parent_node.text,
+                              [aspect.text for aspect in node.findall("./{0}mandatory-aspects/{0}aspect"
+                                                                      .format(namespace))]))
+
+        # Every link is resolved so that all the missing data are reported at once.
+        errors: list[str] = []
+        for (data, parent, mandatory_aspects) in links:
+            try:
+                data.parent = self.__resolve_parent(content_model, data, parent, filename)
+            except ApiException as e:
+                errors.append(str(e).rstrip("\n"))
+            for mandatory_aspect in mandatory_aspects:
+                try:
+                    data.add_mandatory_aspect(self.__resolve_mandatory_aspect(content_model, data, mandatory_aspect,
+                                                                              filename))
+                except ApiException as e:
+                    errors.append(str(e))
+        if len(errors).__gt__(0):
+            raise ApiException("\n".join(errors))
+
+    @staticmethod
+    def __resolve_parent(content_model: ContentModel, data: DataModel, parent: Optional[str], filename: str) \
+            -> Optional[DataModel]:
+        """
+        Finds the data model of the parent of a data.
+        :param content_model: A data model of a content-model.
+        :param data: The data whose parent is resolved.
+        :param parent: The complete name of the parent (prefix:name).
+        :param filename: The name of the content model file.
+        :return: The data model of the parent, otherwise None.
+        """
+        if StringHelper.is_empty(parent):
+            return None
+        elif data.typology.__eq__(DataType.TYPE.value) and parent.__eq__("cm:folder"):
+            return FolderTypeModel(content_model)
+        elif data.typology.__eq__(DataType.TYPE.value) and parent.__eq__("cm:content"):
+            return ContentTypeModel(content_model)
+
+        parent_decomposed: list[str] = parent.rsplit(":", 1)
+        parent_model: Optional[DataModel] = None
+        if len(parent_decomposed).__eq__(2) and parent_decomposed[0].__eq__(content_model.prefix):
+            parent_model = content_model.get_data(data.typology, parent_decomposed[1])
+
+        if parent_model is None:
+            raise ApiException("There is an inheritance problem. {4} '{0}' inherits {5} '{1}' which does not "
+                               "exist in content model '{2}' of file '{3}'.\n"
+                               .format(data.name, parent, content_model.complete_name, filename,
+                                       data.typology.title(), data.typology))
+        return parent_model
+
+    @staticmethod
+    def __resolve_mandatory_aspect(content_model: ContentModel, data: DataModel, mandatory_aspect: Optional[str],
+                                   filename: str) -> AspectModel:
+        """
+        Finds the data model of a mandatory aspect of a data.
+        :param content_model: A data model of a content-model.
+        :param data: The data whose mandatory aspect is resolved.
+        :param mandatory_aspect: The complete name of the mandatory aspect (prefix:name).
+        :param filename: The name of the content model file.
+        :return: The data model of the mandatory aspect.
+        """
+        mandatory_decomposed: list[str] = [] if mandatory_aspect is None else mandatory_aspect.rsplit(":", 1)
+        if len(mandatory_decomposed).__ne__(2):
+            raise ApiException("A mandatory aspect value of {0} '{1}' of content model '{2}' in file '{3}' is not "
+                               "valid. Its be formed this way: prefix:name."
+                               .format(data.typology, data.name, content_model.complete_name, filename))
+
+        aspect: Optional[AspectModel] = None
+        if mandatory_decomposed[0].__eq__(content_model.prefix):
+            aspect = content_model.get_aspect(mandatory_decomposed[1])
+
+        if aspect is None:
+            raise ApiException("{4} '{0}' has a required aspect '{1}' which does not exist in content model '{2}' "
+                               "in file '{3}'.".format(data.name, mandatory_aspect, content_model.complete_name,
+                                                       filename, data.typology.title()))
+        return aspect
+
     def get_property(self, content_model: ContentModel, data: DataModel, property_name: str) \
             -> tuple[str, str, str, str, bool]:
         namespace: str = self.get_namespace("xmlns")
@@ -533,8 +698,24 @@ class ContentModelFileService(XmlFileService):
         node: Element = root.find(".//{0}{1}s/{0}{1}[@name='{2}:{3}']/{0}properties/{0}property[@name='{2}:{4}']"
                                   .format(namespace, data.typology, content_model.prefix, data.name, property_name))
         if node is None:
-            ApiException("There is no property named '{0}' in {1} '{2}' in content model '{3}' in file '{4}'."
-                         .format(property_name, data.typology, data.name, content_model.complete_name, filename))
+            raise ApiException("There is no property named '{0}' in {1} '{2}' in content model '{3}' in file '{4}'."
+                               .format(property_name, data.typology, data.name, content_model.complete_name,
+                                       filename))
+
+        return self.__read_property(content_model, data, property_name, node)
+
+    def __read_property(self, content_model: ContentModel, data: DataModel, property_name: str, node: Element) \
+            -> tuple[str, str, str, str, bool]:
+        """
+        Reads and checks the values of a property node.
+        :param content_model: A data model of a content-model.
+        :param data: The owner data of the property.
+        :param property_name: The property name.
+        :param node: The property node.
+        :return: A tuple composed of the name, the title, the description, the type and the mandatory value.
+        """
+        namespace: str = self.get_namespace("xmlns")
+        filename: str = FileFolderHelper.extract_filename_from_path(content_model.path)
 
         title_node: Element = node.find("./{0}title".format(namespace))
         title: Optional[str] = None if title_node is None else title_node.text
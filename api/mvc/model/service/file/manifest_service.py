@@ -0,0 +1,63 @@
+import json
+from typing import Optional
+
+from api.mvc.model.data.project_model import ProjectModel
+from api_core.helper.constant_helper import ConstantHelper
+from api_core.helper.file_folder_helper import FileFolderHelper
+
+
+class ManifestFileService:
+    """
+    Service class for managing the load manifest of a project. The manifest records the hash of the files read by the
+    last load of the project (its inputs), the complete name of the content model of each content model file and the
+    hash of the files it generated (its outputs).
+    """
+
+    @staticmethod
+    def read(project: ProjectModel) -> Optional[tuple[dict[str, str], dict[str, str], dict[str, str]]]:
+        """
+        Reads the manifest of the project.
+        :param project: The data model of the project.
+        :return: A tuple composed of the hashes of the inputs, of the complete names of the content models and of the
+        hashes of the outputs, indexed by their path relative to the project folder, or None if there is no valid
+        manifest.
+        """
+        content: Optional[str] = FileFolderHelper.read_file(project.manifest_filepath)
+        if content is None:
+            return None
+
+        try:
+            manifest: dict = json.loads(content)
+        except ValueError:
+            return None
+
+        # A manifest written by another version of the generation is obsolete.
+        if not isinstance(manifest, dict) or manifest.get("version") != ConstantHelper.MANIFEST_VERSION:
+            return None
+        return manifest.get("inputs", {}), manifest.get("content_models", {}), manifest.get("outputs", {})
+
+    @staticmethod
+    def write(project: ProjectModel, inputs: dict[str, str], names: dict[str, str], outputs: dict[str, str]):
+        """
+        Writes the manifest of the project.
+        :param project: The data model of the project.
+        :param inputs: The hashes of the inputs indexed by their path relative to the project folder.
+        :param names: The complete names of the content models indexed by the path to their file relative to the
+        project folder.
+        :param outputs: The hashes of the outputs indexed by their path relative to the project folder.
+        """
+        FileFolderHelper.create_folder(project.helper_folder)
+        FileFolderHelper.write_file(project.manifest_filepath, json.dumps({
+            "version": ConstantHelper.MANIFEST_VERSION,
+            "inputs": inputs,
+            "content_models": names,
+            "outputs": outputs
+        }, indent=3, sort_keys=True))
+
+    @staticmethod
+    def remove(project: ProjectModel):
+        """
+        Removes the manifest of the project so that its next load generates every file.
+        :param project: The data model of the project.
+        """
+        FileFolderHelper.remove_file(project.manifest_filepath)
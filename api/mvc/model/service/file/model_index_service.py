@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import os
+from typing import Optional, TYPE_CHECKING
+
+from api.mvc.model.data.content_model import ContentModel
+from api.mvc.model.data.data_model import DataModel
+from api.mvc.model.data.project_model import ProjectModel
+from api.mvc.model.service.file.content_model_service import ContentModelFileService
+from api_core.exception.api_exception import ApiException
+from api_core.helper.constant_helper import ConstantHelper
+from api_core.helper.file_folder_helper import FileFolderHelper
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+class ModelIndexFileService:
+    """
+    Service class for managing the content model index of a project. The index is a SQLite database which maps the
+    content models (prefix and name), their aspects, types and properties to the file declaring them. Each entry keeps
+    the stat data (modification date and size) of its file so that only the files modified since their indexing are
+    parsed again.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of 'ModelIndexFileService' class.
+        """
+        self.__cmfs: ContentModelFileService = ContentModelFileService()
+
+    def refresh(self, project: ProjectModel):
+        """
+        Brings the index up to date with the content model files of the project.
+        :param project: The data model of the project.
+        """
+        connection: sqlite3.Connection = self.__connect(project)
+        try:
+            with connection:
+                self.__refresh(connection, project)
+        finally:
+            connection.close()
+
+    def find_content_model(self, project: ProjectModel, prefix: Optional[str] = None, name: Optional[str] = None) \
+            -> Optional[str]:
+        """
+        Finds the file of the content model identified by its prefix and/or its name.
+        :param project: The data model of the project.
+        :param prefix: The content model prefix (or None to ignore it).
+        :param name: The content model name (or None to ignore it).
+        :return: The absolute path to the content model file or None if there is no such content model.
+        """
+        clauses: list[str] = []
+        parameters: list[str] = []
+        if prefix is not None:
+            clauses.append("prefix = ?")
+            parameters.append(prefix)
+        if name is not None:
+            clauses.append("name = ?")
+            parameters.append(name)
+
+        request: str = "SELECT path FROM content_model"
+        if len(clauses).__gt__(0):
+            request += " WHERE {0}".format(" AND ".join(clauses))
+        return self.__find_path(project, "{0} ORDER BY path".format(request), parameters)
+
+    def is_data_indexed(self, project: ProjectModel, prefix: str) -> bool:
+        """
+        Indicates whether the aspects, types and properties of a content model are indexed. They are not if its file is
+        invalid, the errors being reported when the file is read.
+        :param project: The data model of the project.
+        :param prefix: The content model prefix.
+        :return: True if the data of the content model are indexed otherwise False.
+        """
+        row: Optional[tuple] = self.__query(project, "SELECT data_indexed FROM content_model WHERE prefix = ? "
+                                                     "ORDER BY path", [prefix])
+        return row is not None and row[0].__eq__(1)
+
+    def find_data(self, project: ProjectModel, typology: str, complete_name: str) -> Optional[str]:
+        """
+        Finds the file declaring an aspect or a type.
+        :param project: The data model of the project.
+        :param typology: The data typology (aspect or type).
+        :param complete_name: The complete name (prefix:name) of the aspect or the type.
+        :return: The absolute path to the content model file or None if no file declares it.
+        """
+        return self.__find_path(project, "SELECT path FROM data WHERE typology = ? AND name = ? ORDER BY path",
+                                [typology, complete_name])
+
+    def find_property(self, project: ProjectModel, complete_name: str) -> Optional[tuple[str, str]]:
+        """
+        Finds the file and the aspect or type declaring a property.
+        :param project: The data model of the project.
+        :param complete_name: The complete name (prefix:name) of the property.
+        :return: A tuple composed of the absolute path to the content model file and the complete name of the aspect or
+        type declaring the property, or None if no file declares it.
+        """
+        row: Optional[tuple] = self.__query(project, "SELECT path, data FROM property WHERE name = ? ORDER BY path",
+                                            [complete_name])
+        return None if row is None else (self.__get_absolute_path(project, row[0]), row[1])
+
+    def __find_path(self, project: ProjectModel, request: str, parameters: list[str]) -> Optional[str]:
+        """
+        Runs a request selecting a file.
+        :param project: The data model of the project.
+        :param request: The SQL request whose first column is the file name.
+        :param parameters: The parameters of the request.
+        :return: The absolute path to the first file selected or None if no file is selected.
+        """
+        row: Optional[tuple] = self.__query(project, request, parameters)
+        return None if row is None else self.__get_absolute_path(project, row[0])
+
+    def __query(self, project: ProjectModel, request: str, parameters: list[str]) -> Optional[tuple]:
+        """
+        Brings the index up to date then runs a request on it.
+        :param project: The data model of the project.
+        :param request: The SQL request.
+        :param parameters: The parameters of the request.
+        :return: The first row selected or None if no row is selected.
+        """
+        connection: sqlite3.Connection = self.__connect(project)
+        try:
+            with connection:
+                self.__refresh(connection, project)
+                return connection.execute(request, parameters).fetchone()
+        finally:
+            connection.close()
+
+    @staticmethod
+    def __get_absolute_path(project: ProjectModel, filename: str) -> str:
+        """
+        Gets the absolute path to a content model file from its name.
+        :param project: The data model of the project.
+        :param filename: The name of the content model file.
+        :return: The absolute path to the content model file.
+        """
+        return "{1}{0}{2}".format(os.sep, project.content_model_folder, filename)
+
+    @staticmethod
+    def __connect(project: ProjectModel) -> sqlite3.Connection:
+        """
+        Opens the index of the project, creating or rebuilding it if it does not have the expected schema.
+        :param project: The data model of the project.
+        :return: The connection to the index.
+        """
+        # Only the commands looking for a content model load the SQLite module.
+        import sqlite3
+        FileFolderHelper.create_folder(project.helper_folder)
+        try:
+            connection: sqlite3.Connection = sqlite3.connect(project.index_filepath)
+            version: int = connection.execute("PRAGMA user_version").fetchone()[0]
+        except sqlite3.DatabaseError:
+            # The file is not a database: the index is built again.
+            FileFolderHelper.remove_file(project.index_filepath)
+            connection = sqlite3.connect(project.index_filepath)
+            version = 0
+
+        if version.__ne__(ConstantHelper.INDEX_VERSION):
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS content_model")
+                connection.execute("DROP TABLE IF EXISTS data")
+                connection.execute("DROP TABLE IF EXISTS property")
+                connection.execute("CREATE TABLE content_model (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+                                   "size INTEGER NOT NULL, prefix TEXT NOT NULL, name TEXT NOT NULL, "
+                                   "data_indexed INTEGER NOT NULL)")
+                connection.execute("CREATE TABLE data (path TEXT NOT NULL, typology TEXT NOT NULL, name TEXT NOT NULL, "
+                                   "parent TEXT, PRIMARY KEY (path, typology, name))")
+                connection.execute("CREATE TABLE property (path TEXT NOT NULL, data TEXT NOT NULL, "
+                                   "name TEXT NOT NULL, title TEXT, typology TEXT, PRIMARY KEY (path, data, name))")
+                connection.execute("CREATE INDEX data_name ON data (name)")
+                connection.execute("CREATE INDEX property_name ON property (name)")
+                connection.execute("PRAGMA user_version = {0}".format(ConstantHelper.INDEX_VERSION))
+        return connection
+
+    def __refresh(self, connection: sqlite3.Connection, project: ProjectModel):
+        """
+        Indexes again the content model files modified since their indexing and forgets the removed ones.
+        :param connection: The connection to the index.
+        :param project: The data model of the project.
+        """
+        indexed: dict[str, tuple[int, int]] = {}
+        for row in connection.execute("SELECT path, mtime_ns, size FROM content_model"):
+            indexed[row[0]] = (row[1], row[2])
+
+        filenames: list[str] = FileFolderHelper.get_contents(project.content_model_folder)
+        for filename in filenames:
+            stat: os.stat_result = os.stat(self.__get_absolute_path(project, filename))
+            if indexed.get(filename) != (stat.st_mtime_ns, stat.st_size):
+                self.__index_file(connection, project, filename, stat)
+
+        for filename in indexed.keys():
+            if filename not in filenames:
+                self.__remove_file(connection, filename)
+
+    def __index_file(self, connection: sqlite3.Connection, project: ProjectModel, filename: str,
+                     stat: os.stat_result):
+        """
+        Indexes a content model file.
+        :param connection: The connection to the index.
+        :param project: The data model of the project.
+        :param filename: The name of the content model file.
+        :param stat: The stat data of the file.
+        """
+        filepath: str = self.__get_absolute_path(project, filename)
+        self.__remove_file(connection, filename)
+
+        prefix: str = self.__cmfs.extract_content_model_prefix(filepath)
+        name: str = self.__cmfs.extract_content_model_name(filepath)
+
+        # The errors of an invalid content model are reported when it is used, not when another one is looked for:
+        # its data and properties are not indexed.
+        content_model: ContentModel = ContentModel(project, prefix, name, filepath)
+        try:
+            self.__cmfs.load(content_model)
+            data_indexed: bool = True
+        except ApiException:
+            data_indexed = False
+        connection.execute("INSERT INTO content_model (path, mtime_ns, size, prefix, name, data_indexed) "
+                           "VALUES (?, ?, ?, ?, ?, ?)",
+                           [filename, stat.st_mtime_ns, stat.st_size, prefix, name, 1 if data_indexed else 0])
+        if not data_indexed:
+            return
+
+        data: DataModel
+        for data in content_model.aspects + content_model.types:
+            connection.execute("INSERT INTO data (path, typology, name, parent) VALUES (?, ?, ?, ?)",
+                               [filename, data.typology, data.complete_name,
+                                None if data.parent is None else data.parent.complete_name])
+            for property_model in data.properties:
+                # A property declared twice by a data (an invalid content model) is indexed once.
+                connection.execute("INSERT OR REPLACE INTO property (path, data, name, title, typology) "
+                                   "VALUES (?, ?, ?, ?, ?)",
+                                   [filename, data.complete_name, property_model.complete_name, property_model.title,
+                                    property_model.typology])
+
+    @staticmethod
+    def __remove_file(connection: sqlite3.Connection, filename: str):
+        """
+        Removes the entries of a content model file from the index.
+        :param connection: The connection to the index.
+        :param filename: The name of the content model file.
+        """
+        connection.execute("DELETE FROM content_model WHERE path = ?", [filename])
+        connection.execute("DELETE FROM data WHERE path = ?", [filename])
+        connection.execute("DELETE FROM property WHERE path = ?", [filename])
@@ -6,13 +6,13 @@ from api.mvc.model.data.content_model import ContentModel
 from api.mvc.model.data.data_model import DataModel
 from api.mvc.model.data.project_model import ProjectModel
 from api.mvc.model.data.property_model import PropertyModel
-from api_core.helper.file_folder_helper import FileFolderHelper
 from api_core.mvc.service.file.xml_file_service import XmlFileService
 
 
 class ShareConfigFileService(XmlFileService):
     """
-
+    Service class for managing the 'share-config-custom.xml' file of the share project. Its 'config' nodes are
+    children of the root node: they are looked for among them rather than in the whole document.
     """
 
     def __init__(self):
@@ -26,8 +26,6 @@ class ShareConfigFileService(XmlFileService):
         Reset the 'share-config-custom.xml' file of the share project of the alfresco project.
         :param project: The project data model.
         """
-        # Delete file.
-        FileFolderHelper.remove_file(project.share_config_filepath)
         # File rewritten.
         # Creating the 'alfresco-config' node.
         root: Element = Element("alfresco-config")
@@ -88,6 +86,59 @@ class ShareConfigFileService(XmlFileService):
 
         self._write(root, project.share_config_filepath)
 
+    def detach_content_model(self, project: ProjectModel, content_model: ContentModel) \
+            -> tuple[list[Element], list[Element]]:
+        """
+        Removes the entries of a content model (visible aspects and evaluators) from the 'share-config-custom.xml'
+        file. The entries following them are removed too and returned, so that the entries of the content model can be
+        generated again at the same place before restoring them with 'attach_entries'.
+        :param project: The project data model.
+        :param content_model: The content model's data model.
+        :return: A tuple composed of the visible aspects and of the evaluators following the content model entries.
+        """
+        root: Element = self._get_root(project.share_config_filepath)
+        visible: Optional[Element] = root.find("config[@condition='DocumentLibrary']/aspects/visible")
+        prefix: str = "{0}:".format(content_model.prefix)
+
+        result: tuple[list[Element], list[Element]] = (
+            [] if visible is None else self.__detach_nodes(visible, "name", prefix),
+            self.__detach_nodes(root, "condition", prefix))
+        self._write(root, project.share_config_filepath)
+        return result
+
+    def attach_entries(self, project: ProjectModel, entries: tuple[list[Element], list[Element]]):
+        """
+        Restores at the end of their lists the entries returned by 'detach_content_model'.
+        :param project: The project data model.
+        :param entries: The visible aspects and the evaluators to restore.
+        """
+        root: Element = self._get_root(project.share_config_filepath)
+        visible: Optional[Element] = root.find("config[@condition='DocumentLibrary']/aspects/visible")
+        if visible is not None:
+            visible.extend(entries[0])
+        root.extend(entries[1])
+        self._write(root, project.share_config_filepath)
+
+    @staticmethod
+    def __detach_nodes(parent: Element, attribute: str, prefix: str) -> list[Element]:
+        """
+        Removes the children whose attribute starts with the prefix, and the children following the first of them.
+        :param parent: The parent node.
+        :param attribute: The name of the attribute holding the complete name of the data.
+        :param prefix: The prefix of the content model followed by ':'.
+        :return: The removed children which do not start with the prefix, in their order.
+        """
+        result: list[Element] = []
+        found: bool = False
+        for child in list(parent):
+            matches: bool = child.get(attribute, "").startswith(prefix)
+            found = found or matches
+            if found:
+                parent.remove(child)
+                if not matches:
+                    result.append(child)
+        return result
+
     def add_aspect_evaluator(self, project: ProjectModel, aspect: AspectModel):
         self.__add_data_evaluator(project, aspect)
 
@@ -167,6 +218,76 @@ class ShareConfigFileService(XmlFileService):
 
     def add_property(self, project, data: DataModel, property_model: PropertyModel):
         root: Element = self._get_root(project.share_config_filepath)
+        if self.__add_property_nodes(data, property_model, root):
+            self._write(root, project.share_config_filepath)
+
+    def add_properties(self, project: ProjectModel, data: DataModel, properties: list[PropertyModel]):
+        """
+        Adds properties to the form of a data (in its field visibility and in its appearance), in a single pass: the
+        nodes of the form are looked for once and the file is written once.
+        :param project: The project data model.
+        :param data: The data model.
+        :param properties: The property models, in the order of the form.
+        """
+        root: Element = self._get_root(project.share_config_filepath)
+        modified: bool = False
+        (visibility, appearance) = self.__get_form_nodes(data, root)
+        shows: set[str] = set() if visibility is None else {node.get("id") for node in visibility.findall("show")}
+        fields: set[str] = set() if appearance is None else {node.get("id") for node in appearance.findall("field")}
+        for property_model in properties:
+            if visibility is None or appearance is None:
+                # The missing nodes of the form are created with the property.
+                modified = self.__add_property_nodes(data, property_model, root) or modified
+                (visibility, appearance) = self.__get_form_nodes(data, root)
+                shows.add(property_model.complete_name)
+                fields.add(property_model.complete_name)
+                continue
+
+            if property_model.complete_name not in shows:
+                visibility.append(self.__new_show_field(property_model))
+                shows.add(property_model.complete_name)
+                modified = True
+            if property_model.complete_name not in fields:
+                appearance.append(self.__new_field(data, property_model))
+                fields.add(property_model.complete_name)
+                modified = True
+
+        if modified:
+            self._write(root, project.share_config_filepath)
+
+    def add_parent_mandatory_sets(self, project: ProjectModel, data: DataModel, linked: list[DataModel]):
+        """
+        Adds the sets of the ancestors and of the mandatory aspects of a data to its form, in a single pass.
+        :param project: The project data model.
+        :param data: The data model.
+        :param linked: The data models whose sets are added, in the order of the form.
+        """
+        root: Element = self._get_root(project.share_config_filepath)
+        appearance: Optional[Element] = self.__get_form_nodes(data, root)[1]
+        if appearance is None:
+            # The missing nodes of the form are created with the first set.
+            for data_linked in linked:
+                self.add_parent_mandatory_data(project, data, data_linked)
+            return
+
+        sets: set[str] = {node.get("id") for node in appearance.findall("set")}
+        modified: bool = False
+        for data_linked in linked:
+            if data_linked.share_set_id not in sets:
+                appearance.append(self.__new_set(data_linked))
+                sets.add(data_linked.share_set_id)
+                modified = True
+        if modified:
+            self._write(root, project.share_config_filepath)
+
+    def __add_property_nodes(self, data: DataModel, property_model: PropertyModel, root: Element) -> bool:
+        """
+        Adds a property to the form of a data, creating the missing nodes of the form.
+        :param data: The data model.
+        :param property_model: The property model.
+        :param root: The root node of the file.
+        :return: True if a node was added otherwise False.
+        """
         (show_in_creation, show) = self.__get_create_show_field(data, property_model, root)
         if show_in_creation:
             (in_creation, field_visibility) = self.__get_create_field_visibility(data, root)
@@ -207,66 +328,60 @@ class ShareConfigFileService(XmlFileService):
                         if in_creation:
                             root.append(config)
 
-        if show_in_creation or field_in_creation:
-            self._write(root, project.share_config_filepath)
+        return show_in_creation or field_in_creation
 
     @staticmethod
     def __get_create_field(data: DataModel, property_model: PropertyModel, root: Element) -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='{0}']/forms/form/appearance/field[@id='{1}']"
+        node: Element = root.find("config[@condition='{0}']/forms/form/appearance/field[@id='{1}']"
                                   .format(data.complete_name, property_model.complete_name))
-        if node is None:
-            node = Element("field")
-            node.set("id", property_model.complete_name)
-            node.set("label-id", property_model.label_id)
-            node.set("set", data.share_set_id)
-            return True, node
+        return (True, ShareConfigFileService.__new_field(data, property_model)) if node is None else (False, node)
 
-        return False, node
+    @staticmethod
+    def __new_field(data: DataModel, property_model: PropertyModel) -> Element:
+        node: Element = Element("field")
+        node.set("id", property_model.complete_name)
+        node.set("label-id", property_model.label_id)
+        node.set("set", data.share_set_id)
+        return node
 
     @staticmethod
     def __get_create_parent_mandatory_set(data: DataModel, data_set: DataModel, root: Element) -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='{0}']/forms/form/appearance/set[@id='{1}']"
+        node: Element = root.find("config[@condition='{0}']/forms/form/appearance/set[@id='{1}']"
                                   .format(data.complete_name, data_set.share_set_id))
-        if node is None:
-            node = Element("set")
-            node.set("id", data_set.share_set_id)
-            node.set("appearance", "bordered-panel")
-            node.set("label-id", data_set.share_label_id)
-            return True, node
-
-        return False, node
+        return (True, ShareConfigFileService.__new_set(data_set)) if node is None else (False, node)
 
     @staticmethod
     def __get_create_appearance(data: DataModel, root: Element) -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='{0}']/forms/form/appearance".format(data.complete_name))
+        node: Element = root.find("config[@condition='{0}']/forms/form/appearance".format(data.complete_name))
         return (True, Element("appearance")) if node is None else (False, node)
 
     @staticmethod
     def __get_create_set(data: DataModel, root: Element) -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='{0}']/forms/form/appearance/set[@id='{1}']"
+        node: Element = root.find("config[@condition='{0}']/forms/form/appearance/set[@id='{1}']"
                                   .format(data.complete_name, data.share_set_id))
-        if node is None:
-            node = Element("set")
-            node.set("id", data.share_set_id)
-            node.set("appearance", "bordered-panel")
-            node.set("label-id", data.share_label_id)
-            return True, node
+        return (True, ShareConfigFileService.__new_set(data)) if node is None else (False, node)
 
-        return False, node
+    @staticmethod
+    def __new_set(data_set: DataModel) -> Element:
+        node: Element = Element("set")
+        node.set("id", data_set.share_set_id)
+        node.set("appearance", "bordered-panel")
+        node.set("label-id", data_set.share_label_id)
+        return node
 
     @staticmethod
     def __get_create_forms(data: DataModel, root: Element) -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='{0}']/forms".format(data.complete_name))
+        node: Element = root.find("config[@condition='{0}']/forms".format(data.complete_name))
         return (True, Element("forms")) if node is None else (False, node)
 
     @staticmethod
     def __get_create_form(data: DataModel, root: Element) -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='{0}']/forms/form".format(data.complete_name))
+        node: Element = root.find("config[@condition='{0}']/forms/form".format(data.complete_name))
         return (True, Element("form")) if node is None else (False, node)
 
     @staticmethod
     def __get_create_field_visibility(data: DataModel, root: Element) -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='{0}']/forms/form/field-visibility"
+        node: Element = root.find("config[@condition='{0}']/forms/form/field-visibility"
                                   .format(data.complete_name))
         if node is None:
             node = Element("field-visibility")
@@ -309,14 +424,28 @@ class ShareConfigFileService(XmlFileService):
     @staticmethod
     def __get_create_show_field(data: DataModel, property_model: PropertyModel,
                                 root: Element) -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='{0}']/forms/form/field-visibility/"
+        node: Element = root.find("config[@condition='{0}']/forms/form/field-visibility/"
                                   "show[@id='{1}']".format(data.complete_name, property_model.complete_name))
-        if node is None:
-            node = Element("show")
-            node.set("id", "{0}".format(property_model.complete_name))
-            return True, node
+        return (True, ShareConfigFileService.__new_show_field(property_model)) if node is None else (False, node)
 
-        return False, node
+    @staticmethod
+    def __new_show_field(property_model: PropertyModel) -> Element:
+        node: Element = Element("show")
+        node.set("id", "{0}".format(property_model.complete_name))
+        return node
+
+    @staticmethod
+    def __get_form_nodes(data: DataModel, root: Element) -> tuple[Optional[Element], Optional[Element]]:
+        """
+        Gets the field visibility and the appearance of the form of a data.
+        :param data: The data model.
+        :param root: The root node of the file.
+        :return: The 'field-visibility' and 'appearance' nodes, None if they do not exist.
+        """
+        form: Optional[Element] = root.find("config[@condition='{0}']/forms/form".format(data.complete_name))
+        if form is None:
+            return None, None
+        return form.find("field-visibility"), form.find("appearance")
 
     def __add_data_evaluator(self, project: ProjectModel, data: DataModel):
         root: Element = self._get_root(project.share_config_filepath)
@@ -342,7 +471,7 @@ class ShareConfigFileService(XmlFileService):
 
     @staticmethod
     def __get_create_data_evaluator(data: DataModel, root: Element) -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='{0}']".format(data.complete_name))
+        node: Element = root.find("config[@condition='{0}']".format(data.complete_name))
         if node is None:
             node = Element("config")
 
@@ -358,7 +487,7 @@ class ShareConfigFileService(XmlFileService):
 
     @staticmethod
     def __get_create_config_document_library(root):
-        node: Element = root.find(".//config[@condition='DocumentLibrary']")
+        node: Element = root.find("config[@condition='DocumentLibrary']")
         if node is None:
             node = Element("config")
             node.set("evaluator", "string-compare")
@@ -368,18 +497,18 @@ class ShareConfigFileService(XmlFileService):
 
     @staticmethod
     def __get_create_aspects_document_library(root):
-        node: Element = root.find(".//config[@condition='DocumentLibrary']/aspects")
+        node: Element = root.find("config[@condition='DocumentLibrary']/aspects")
         return (True, Element("visible")) if node is None else (False, node)
 
     @staticmethod
     def __get_create_visible_document_library(root):
-        node: Element = root.find(".//config[@condition='DocumentLibrary']/aspects/visible")
+        node: Element = root.find("config[@condition='DocumentLibrary']/aspects/visible")
         return (True, Element("visible")) if node is None else (False, node)
 
     @staticmethod
     def __get_create_aspect_document_library(aspect: AspectModel, root: Element) \
             -> tuple[bool, Element]:
-        node: Element = root.find(".//config[@condition='DocumentLibrary']/aspects/visible/aspect[@name='{0}']"
+        node: Element = root.find("config[@condition='DocumentLibrary']/aspects/visible/aspect[@name='{0}']"
                                   .format(aspect.complete_name))
         if node is None:
             node = Element("aspect")
@@ -23,13 +23,9 @@ class ShareSlingshotApplicationContext(XmlFileService):
         Reset the 'webscript-context.xml' file of the platform project of the alfresco project.
         :param project: The project data model.
         """
-        # Delete file.
-        FileFolderHelper.remove_file(project.share_slingshot_application_context_filepath)
-
         # File rewritten.
         # Creating the 'alfresco-config' node.
-        root: Element = Element("beans")
-        root.set("xmlns", "http://www.springframework.org/schema/beans")
+        root: Element = self._new_element("beans")
         root.set("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
         root.set("xsi:schemaLocation", "http://www.springframework.org/schema/beans "
                                        "http://www.springframework.org/schema/beans/spring-beans-3.0.xsd")
@@ -64,13 +60,14 @@ class ShareSlingshotApplicationContext(XmlFileService):
         if list_node is None:
             return
         list_node.remove(value)
+        self._write(root, project.share_slingshot_application_context_filepath)
 
     def __get_create_message_bean(self, project: ProjectModel, root: Element) -> tuple[bool, Element]:
         namespace: str = self.get_namespace("xmlns")
         node: Element = root.find(".//{0}bean[@class='org.springframework.extensions.surf.util."
                                   "ResourceBundleBootstrapComponent']".format(namespace))
         if node is None:
-            node = Element("bean")
+            node = self._new_element("bean")
             node.set("id", "{0}.{1}-share.resources".format(project.group_id, project.artifact_id))
             node.set("class", "org.springframework.extensions.surf.util.ResourceBundleBootstrapComponent")
             return True, node
@@ -83,7 +80,7 @@ class ShareSlingshotApplicationContext(XmlFileService):
                                   "ResourceBundleBootstrapComponent']/{0}property[@name='resourceBundles']"
                                   .format(namespace))
         if node is None:
-            node = Element("property")
+            node = self._new_element("property")
             node.set("name", "resourceBundles")
             return True, node
 
@@ -91,14 +88,14 @@ class ShareSlingshotApplicationContext(XmlFileService):
 
     def __get_create_message_list(self, root: Element) -> tuple[bool, Element]:
         node: Element = self.__get_message_list(root)
-        return (True, Element("list")) if node is None else (False, node)
+        return (True, self._new_element("list")) if node is None else (False, node)
 
     def __get_create_message_value(self, content_model: ContentModel, root: Element) \
             -> tuple[bool, Element]:
         node: Element = self.__get_message_value(content_model, root)
         if node is not None:
             return False, node
-        node = Element("value")
+        node = self._new_element("value")
         node.text = self.__get_value(content_model)
 
         return True, node
@@ -0,0 +1,123 @@
+import json
+from typing import Optional
+
+from api_core.exception.api_exception import ApiException
+from api_core.helper.file_folder_helper import FileFolderHelper
+
+
+class SpecFileService:
+    """
+    Service class for reading the spec of a project: a JSON (or YAML) document describing the content models of the
+    project with their aspects, types, parents, mandatory aspects and properties.
+    """
+
+    __CONTENT_MODEL_FIELDS: dict[str, type] = {"prefix": str, "name": str, "description": str, "author": str,
+                                               "aspects": list, "types": list}
+    """
+    The fields of a content model, with their type.
+    """
+
+    __DATA_FIELDS: dict[str, type] = {"name": str, "title": str, "description": str, "parent": str,
+                                      "mandatory_aspects": list, "properties": list}
+    """
+    The fields of an aspect or a type, with their type.
+    """
+
+    __PROPERTY_FIELDS: dict[str, type] = {"name": str, "title": str, "description": str, "type": str,
+                                          "mandatory": (bool, str)}
+    """
+    The fields of a property, with their type.
+    """
+
+    @staticmethod
+    def read(spec_file_path: str) -> dict:
+        """
+        Reads and checks the structure of a project spec. The fields omitted by the spec are set to None (or to an
+        empty list), the others are kept as they are.
+        :param spec_file_path: The path to the spec file (a YAML file if its extension is '.yaml' or '.yml').
+        :return: The spec, whose 'content_models' field lists the content models.
+        """
+        content: Optional[str] = FileFolderHelper.read_file(spec_file_path)
+        if content is None:
+            raise ApiException("The spec file '{0}' does not exist.".format(spec_file_path))
+
+        try:
+            if spec_file_path.lower().endswith((".yaml", ".yml")):
+                document = SpecFileService.__load_yaml(content)
+            else:
+                document = json.loads(content)
+        except ValueError as e:
+            raise ApiException("The spec file '{0}' is invalid: {1}".format(spec_file_path, e))
+
+        if not isinstance(document, dict) or not isinstance(document.get("content_models"), list) \
+                or len(document.keys()).__ne__(1):
+            raise ApiException("The spec must be an object whose only field 'content_models' lists the content models.")
+
+        content_models: list[dict] = []
+        for content_model in document["content_models"]:
+            item: dict = SpecFileService.__read_item(content_model, "content model",
+                                                     SpecFileService.__CONTENT_MODEL_FIELDS, ["prefix", "name"])
+            for typology in ["aspects", "types"]:
+                data_list: list[dict] = []
+                for data in item[typology]:
+                    data_item: dict = SpecFileService.__read_item(data, typology[:-1], SpecFileService.__DATA_FIELDS,
+                                                                  ["name"])
+                    for aspect in data_item["mandatory_aspects"]:
+                        if not isinstance(aspect, str):
+                            raise ApiException("The mandatory aspects of {0} '{1}' must be aspect names."
+                                               .format(typology[:-1], data_item["name"]))
+                    data_item["properties"] = [SpecFileService.__read_item(prop, "property",
+                                                                           SpecFileService.__PROPERTY_FIELDS,
+                                                                           ["name", "type"])
+                                               for prop in data_item["properties"]]
+                    data_list.append(data_item)
+                item[typology] = data_list
+            content_models.append(item)
+        return {"content_models": content_models}
+
+    @staticmethod
+    def __read_item(item, label: str, fields: dict[str, type], required: list[str]) -> dict:
+        """
+        Checks an item of the spec and sets its omitted fields.
+        :param item: The item read from the spec.
+        :param label: The label of the item in the error messages.
+        :param fields: The fields of the item, with their type.
+        :param required: The fields that cannot be omitted.
+        :return: The item with every field.
+        """
+        if not isinstance(item, dict):
+            raise ApiException("Each {0} of the spec must be an object.".format(label))
+
+        for key in item.keys():
+            if key not in fields.keys():
+                raise ApiException("Unknown field '{0}' in a {1} of the spec (expected fields: {2})."
+                                   .format(key, label, ", ".join(fields.keys())))
+            elif item[key] is not None and not isinstance(item[key], fields[key]):
+                raise ApiException("The field '{0}' of {1} '{2}' of the spec has an invalid value."
+                                   .format(key, label, item.get("name")))
+
+        for key in required:
+            if item.get(key) is None:
+                raise ApiException("The field '{0}' of each {1} of the spec is mandatory.".format(key, label))
+
+        result: dict = {}
+        for key in fields.keys():
+            result[key] = ([] if item.get(key) is None else item[key]) if fields[key] is list else item.get(key)
+        return result
+
+    @staticmethod
+    def __load_yaml(content: str):
+        """
+        Parses a YAML document.
+        :param content: The YAML document.
+        :return: The document parsed.
+        """
+        try:
+            import yaml
+        except ImportError:
+            raise ApiException("The PyYAML package is needed to read a YAML spec: install it or write the spec in "
+                               "JSON.")
+        try:
+            return yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise ValueError(str(e))
@@ -1,10 +1,20 @@
 import os
+import shlex
+import sys
 from abc import ABC, abstractmethod
+from typing import Callable, Optional, TextIO
 
+from api_core.batch_reader import BatchReader
 from api_core.exception.api_exception import ApiException
 from api_core.helper.constant_helper import ConstantHelper
+from api_core.helper.file_folder_helper import FileFolderHelper
+from api_core.helper.stats_helper import StatsHelper
+from api_core.helper.string_helper import StringHelper
 from api_core.mvc.controller.controller import Controller
+from api_core.mvc.service.data.manual_model import ManualModel
+from api_core.mvc.service.file.xml_file_service import XmlFileService
 from api_core.mvc.service.model.controller_service import ControllerService
+from api_core.mvc.view.output_mode import OutputMode
 from api_core.mvc.view.view import View
 
 
@@ -77,26 +87,314 @@ class Api(ABC):
 
     def interpret(self, tokens: list[str]):
         """
-        Interprets a list of tokens.
+        Interprets a list of tokens. The tokens may start with the global options: the option selecting the output
+        mode ('--buffered', '--quiet' or '--json'), the option printing the statistics of the command ('--stats') and
+        the option profiling the command ('--profile', see 'Api.__profile').
         :param tokens: The list of tokens to interpret.
         """
+        mode: OutputMode = OutputMode.PLAIN
+        stats: bool = False
+        modes: list[str] = [m.value for m in OutputMode]
+        while len(tokens).__gt__(0) and tokens[0].startswith("--") \
+                and (tokens[0][2:] in modes or tokens[0].__eq__("--stats")):
+            if tokens[0].__eq__("--stats"):
+                stats = True
+            else:
+                mode = OutputMode(tokens[0][2:])
+            tokens = tokens[1:]
+        (profile_path, tokens) = Api.__extract_profile_path(tokens)
+        View.set_output_mode(mode)
+        StatsHelper.enable(stats)
+        try:
+            self.__interpret(tokens, profile_path)
+        finally:
+            View.flush()
+
+    def __interpret(self, tokens: list[str], profile_path: Optional[str]):
+        """
+        Interprets a list of tokens, between the main title and the end title.
+        :param tokens: The list of tokens to interpret.
+        :param profile_path: The path to the profile of the command or None if the command is not profiled.
+        """
         self.__view.main_title(self._NAME)
         try:
-            (controller, command, arguments) = self.__extract_token_datas(tokens)
-            self._execute(controller, command, arguments)
+            self.__profile(profile_path, lambda: self.__interpret_tokens(tokens))
         except ApiException as e1:
             self.__view.exception(e1)
+        except EOFError:
+            self.__view.error("The command was waiting for an answer but the standard input is closed: give its data "
+                              "as options or on the standard input.")
+        if StatsHelper.is_enabled():
+            self.__print_stats()
         self.__view.end_title(self._NAME)
 
-    @abstractmethod
+    def __print_stats(self):
+        """
+        Prints the statistics recorded during the command: the counters by category then the time spent in each phase.
+        """
+        self.__view.info("Statistics:")
+        counters: dict[str, dict[str, int]] = StatsHelper.get_counters()
+        for category in sorted(counters.keys()):
+            for name in sorted(counters[category].keys()):
+                self.__view.info("  {0} / {1}: {2}".format(category, name, counters[category][name]))
+        times: dict[str, float] = StatsHelper.get_times()
+        for name in sorted(times.keys()):
+            self.__view.info("  time / {0}: {1:.1f} ms".format(name, times[name] * 1000))
+
+    def __interpret_tokens(self, tokens: list[str]):
+        """
+        Interprets the tokens of a built-in command ('run_batch', 'serve' or 'shell') or of a controller command.
+        :param tokens: The list of tokens to interpret.
+        """
+        if len(tokens).__gt__(0) and tokens[0].__eq__("run_batch"):
+            self.__run_batch(tokens[1:])
+        elif len(tokens).__gt__(0) and tokens[0].__eq__("serve"):
+            self.__serve(tokens[1:])
+        elif len(tokens).__gt__(0) and tokens[0].__eq__("shell"):
+            self.__shell(tokens[1:])
+        else:
+            self.__interpret_command(tokens)
+
+    @staticmethod
+    def __extract_profile_path(tokens: list[str]) -> tuple[Optional[str], list[str]]:
+        """
+        Extracts the profile option ('--profile' or '--profile=<path>') from the beginning of a list of tokens.
+        :param tokens: The list of tokens.
+        :return: The path to the profile (or None without the option) and the tokens following the option.
+        """
+        if len(tokens).__eq__(0) or not (tokens[0].__eq__("--profile") or tokens[0].startswith("--profile=")):
+            return None, tokens
+        path: str = tokens[0][len("--profile="):]
+        return (ConstantHelper.PROFILE_FILE_PATH if StringHelper.is_empty(path) else path), tokens[1:]
+
+    def __profile(self, profile_path: Optional[str], function: Callable[[], None]):
+        """
+        Runs a function, under the profiler if a profile is requested. The profile is written in the pstats format at
+        the given path and as collapsed stacks (for the flame graph tools) next to it, then the functions which took
+        the most cumulative time are printed. The profile is written even if the function fails, and a profile which
+        cannot be written is reported without replacing the error of the function.
+        :param profile_path: The path to the profile or None if the function is not profiled.
+        :param function: The function to run.
+        """
+        if profile_path is None:
+            function()
+            return
+
+        from api_core.profiler import Profiler
+        profiler: Profiler = Profiler(profile_path)
+        try:
+            profiler.run(function)
+        finally:
+            try:
+                profiler.save()
+                self.__view.info("Profile written to '{0}' (collapsed stacks in '{1}'). Top functions by cumulative "
+                                 "time:".format(profiler.path, profiler.collapsed_path))
+            except OSError as e:
+                self.__view.error("The profile cannot be written to '{0}': {1}. Top functions by cumulative time:"
+                                  .format(profiler.path, e.strerror or e))
+            self.__view.info("{0:>12} {1:>12} {2:>14}  {3}".format("cumulative", "own", "calls", "function"))
+            for line in profiler.get_top(ConstantHelper.PROFILE_TOP_SIZE):
+                self.__view.info(line)
+
+    def __interpret_command(self, tokens: list[str]):
+        """
+        Interprets the tokens of a single command.
+        :param tokens: The list of tokens to interpret.
+        """
+        (controller, command, arguments) = self.__extract_token_datas(tokens)
+        self._execute(controller, command, arguments)
+
+    def __run_batch(self, arguments: list[str]):
+        """
+        Runs the commands of a batch, one per line, in this process. Empty lines and comments ('#') are ignored. The
+        answers to the questions asked by a command are read on the lines following it, and so is the document it reads
+        on the standard input, up to a line 'EOF'. The batch stops at the first command in error.
+        :param arguments: The arguments of the 'run_batch' command: the path to the batch file (the standard input by
+        default).
+        """
+        if len(arguments).__gt__(1):
+            raise ApiException("The 'run_batch' command expects at most one argument: the path to the file containing "
+                               "the commands (the commands are read on the standard input otherwise).")
+        if len(arguments).__eq__(1) and not FileFolderHelper.is_file_exists(arguments[0]):
+            raise ApiException("The batch file '{0}' does not exist.".format(arguments[0]))
+
+        stdin: TextIO = sys.stdin
+        reader: BatchReader = BatchReader(stdin if len(arguments).__eq__(0) else open(arguments[0], "r"))
+        sys.stdin = reader
+        self._begin_batch()
+        try:
+            try:
+                self.__run_batch_lines(reader)
+            finally:
+                sys.stdin = stdin
+                if len(arguments).__eq__(1):
+                    reader.close()
+        except BaseException as e:
+            self.__end_stopped_batch(e)
+            raise
+        self._end_batch()
+
+    def __run_batch_lines(self, reader: BatchReader):
+        """
+        Runs the commands of the lines of a batch.
+        :param reader: The reader of the batch, which is the standard input of the commands.
+        """
+        line: str = reader.readline()
+        while line.__ne__(""):
+            number: int = reader.line_number
+            try:
+                tokens: list[str] = shlex.split(line, comments=True)
+                if len(tokens).__gt__(0):
+                    self.__view.info("Batch line {0}: {1}".format(number, " ".join(tokens)), True)
+                    # Each command of the batch may be profiled on its own.
+                    (profile_path, tokens) = Api.__extract_profile_path(tokens)
+                    if len(tokens).__gt__(0) and tokens[0].__eq__("run_batch"):
+                        raise ApiException("A batch cannot run another batch.")
+                    self.__profile(profile_path, lambda: self.__interpret_command(tokens))
+            except ValueError as e:
+                raise ApiException("The line {0} of the batch is malformed: {1}.".format(number, e))
+            except EOFError:
+                raise ApiException("The batch ended while the command of line {0} was waiting for an answer."
+                                   .format(number))
+            except ApiException as e:
+                raise ApiException("The batch stopped at line {0}: {1}".format(number, e), e.manuals)
+            line = reader.readline()
+
+    def __end_stopped_batch(self, error: BaseException):
+        """
+        Ends a batch (or a shell) stopped by an error. A failure at the end of the batch is reported after the error
+        instead of masking it.
+        :param error: The error which stopped the batch.
+        """
+        try:
+            self._end_batch()
+        except ApiException as e:
+            message: str = "The end of the batch failed too: {0}".format(e)
+            if isinstance(error, ApiException):
+                raise ApiException("{0}\n{1}".format(error, message), error.manuals) from e
+            self.__view.error(message)
+
+    def __serve(self, arguments: list[str]):
+        """
+        Runs the commands received on a Unix domain socket in this process until it is interrupted, so that they share
+        the controllers and the parsed documents. The 'main.py' script forwards its command to the daemon when the
+        environment variable named by 'ConstantHelper.DAEMON_SOCKET_VARIABLE' gives the path to the socket.
+        :param arguments: The arguments of the 'serve' command: the path to the socket (the value of the environment
+        variable by default).
+        """
+        from api_core.daemon import Daemon
+        if len(arguments).__gt__(1):
+            raise ApiException("The 'serve' command expects at most one argument: the path to the socket.")
+        socket_path: Optional[str] = arguments[0] if len(arguments).__eq__(1) \
+            else os.environ.get(ConstantHelper.DAEMON_SOCKET_VARIABLE)
+        if StringHelper.is_empty(socket_path):
+            raise ApiException("Please give the path to the socket, as argument of the 'serve' command or in the "
+                               "'{0}' environment variable.".format(ConstantHelper.DAEMON_SOCKET_VARIABLE))
+        elif Daemon.is_running(socket_path):
+            raise ApiException("A daemon is already listening on socket '{0}'.".format(socket_path))
+
+        self.__view.info("Serving the commands received on socket '{0}' (interrupt to stop).".format(socket_path))
+        Daemon(socket_path, self.__run_served).serve()
+        self.__view.success("The daemon listening on socket '{0}' was stopped.".format(socket_path))
+
+    def __run_served(self, tokens: list[str]):
+        """
+        Runs a command received by the daemon.
+        :param tokens: The list of tokens to interpret.
+        """
+        # The command follows the global options.
+        command: list[str] = [token for token in tokens if not token.startswith("--")][:1]
+        if command.__eq__(["serve"]):
+            self.__view.main_title(self._NAME)
+            self.__view.error("The daemon cannot run another daemon.")
+            self.__view.end_title(self._NAME)
+        else:
+            # The global options of the request do not outlive it: the next requests use those of the daemon.
+            mode: OutputMode = View.get_output_mode()
+            stats: bool = StatsHelper.is_enabled()
+            try:
+                self.interpret(tokens)
+            finally:
+                View.set_output_mode(mode)
+                StatsHelper.enable(stats)
+
+    def __shell(self, arguments: list[str]):
+        """
+        Opens an interactive prompt running the commands typed in this process, so that they share the controllers and
+        the parsed documents. The generation of the project files is deferred as in a batch: it happens on the 'sync'
+        command and when the shell is closed.
+        :param arguments: The arguments of the 'shell' command (none).
+        """
+        from api_core.shell import Shell
+        if len(arguments).__gt__(0):
+            raise ApiException("The 'shell' command does not expect any argument.")
+
+        completions: dict[str, list[str]] = {"sync": [], "help": []}
+        controller: Controller
+        for controller in self.__service.get_all():
+            manual: ManualModel
+            for manual in controller.get_man(None):
+                completions[manual.name] = sorted({argument.name for call in manual.calls for argument in call.arguments
+                                                   if argument.name.startswith("--")})
+
+        self.__view.info("Type the commands to run ('help' lists them, 'sync' generates the project files, 'exit' "
+                         "closes the shell).")
+        self._begin_batch()
+        try:
+            Shell("alfresco_helper> ", completions, self.__run_in_shell, self.__view).loop()
+        except BaseException as e:
+            self.__end_stopped_batch(e)
+            raise
+        self._end_batch()
+
+    def __run_in_shell(self, tokens: list[str]):
+        """
+        Runs a command typed in the shell. An error stops the command, not the shell.
+        :param tokens: The list of tokens to interpret.
+        """
+        (profile_path, tokens) = Api.__extract_profile_path(tokens)
+        try:
+            if len(tokens).__eq__(0):
+                raise ApiException("Please enter a command to execute.")
+            elif tokens[0] in ["run_batch", "serve", "shell"]:
+                raise ApiException("The '{0}' command cannot be run from the shell.".format(tokens[0]))
+            elif tokens[0].__eq__("sync"):
+                self._end_batch()
+                self._begin_batch()
+            elif tokens[0].__eq__("help"):
+                for controller in self.__service.get_all():
+                    self.__view.info(" ".join(manual.name for manual in controller.get_man(None)))
+            else:
+                self.__profile(profile_path, lambda: self.__interpret_command(tokens))
+        except ApiException as e:
+            self.__view.exception(e)
+        except EOFError:
+            self.__view.error("The command was waiting for an answer but the standard input is closed.")
+        except KeyboardInterrupt:
+            # The documents of the interrupted command are not written by the next commands.
+            XmlFileService.close_sessions()
+            raise
+
+    def _begin_batch(self):
+        """
+        Called before the first command of a batch.
+        """
+        pass
+
+    def _end_batch(self):
+        """
+        Called after the last command of a batch, even if the batch stopped on an error.
+        """
+        pass
+
     def _execute(self, controller: str, command: str, arguments: list[str]):
         """
-        Execute the command.
+        Execute the command with the handler its controller registered for it.
         :param controller: The name of the controller.
         :param command: The name of the command.
         :param arguments: The list of arguments.
         """
-        pass
+        self.__service.get(controller).execute(command, arguments)
 
     def __extract_token_datas(self, tokens: list[str]) -> tuple[str, str, list[str]]:
         if len(tokens).__lt__(1):
@@ -107,11 +405,7 @@ class Api(ABC):
             # Checking the existence of the controller.
             if not self.__service.exists(controller_name):
                 raise ApiException("'{0}' is not a valid command.".format(" ".join(tokens)))
-            # Verification of the validity of the command.
-            controller: Controller = self.__service.get(controller_name)
-            if not controller.is_command_valid(command, arguments):
-                raise ApiException("The '{1}_{0}' command was not called correctly. Here is the manual for it:"
-                                   .format(controller_name, command), controller.get_man(command))
+            # The arguments are checked against the manual of the command when it is executed.
             return controller_name, command, arguments
         except IndexError:
             raise ApiException("The command is malformed. Normally the command should be composed like this: "
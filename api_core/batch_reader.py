@@ -0,0 +1,62 @@
+from typing import TextIO
+
+
+class BatchReader:
+    """
+    Reader of a batch of commands. While a batch runs, it replaces the standard input so that the answers to the
+    questions asked by the commands are read from the batch too, on the lines following the command. A document read
+    as a whole on the standard input (such as the JSON document of '--json -') is read on the lines following the
+    command, up to a line containing only 'EOF'.
+    """
+
+    END_OF_DOCUMENT: str = "EOF"
+    """
+    The line ending a document read as a whole in the batch.
+    """
+
+    def __init__(self, source: TextIO):
+        """
+        Initialize a new instance of 'BatchReader' class.
+        :param source: The stream containing the commands.
+        """
+        self.__source: TextIO = source
+        self.__line_number: int = 0
+
+    @property
+    def line_number(self) -> int:
+        """
+        Access method to instance property '__line_number'.
+        :return: The number of the last line read.
+        """
+        return self.__line_number
+
+    def readline(self) -> str:
+        """
+        Read the next line of the batch.
+        :return: The line read (with its end of line character) or an empty string at the end of the batch.
+        """
+        line: str = self.__source.readline()
+        if line.__ne__(""):
+            self.__line_number += 1
+        return line
+
+    def read(self) -> str:
+        """
+        Read the lines of the batch up to the line ending the document, which is not part of the document.
+        :return: The document read.
+        """
+        lines: list[str] = []
+        line: str = self.readline()
+        while line.rstrip("\r\n").__ne__(BatchReader.END_OF_DOCUMENT):
+            if line.__eq__(""):
+                raise EOFError("The batch ended before the line '{0}' ending the document."
+                               .format(BatchReader.END_OF_DOCUMENT))
+            lines.append(line)
+            line = self.readline()
+        return "".join(lines)
+
+    def close(self):
+        """
+        Close the stream containing the commands.
+        """
+        self.__source.close()
@@ -0,0 +1,128 @@
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import traceback
+from contextlib import redirect_stdout
+from typing import Callable, Optional, TextIO
+
+from api_core.exception.api_exception import ApiException
+
+
+class Daemon:
+    """
+    Server running the commands received on a Unix domain socket in a single process, so that the commands share the
+    controllers and the parsed documents. Each connection carries one request, a JSON object followed by an end of
+    line: the arguments of the command, the working directory of the client and the text of its standard input. The
+    response is a JSON object followed by an end of line: the output of the command and, if the command failed
+    unexpectedly, the error trace.
+    """
+
+    def __init__(self, socket_path: str, run: Callable[[list[str]], None]):
+        """
+        Initialize a new instance of 'Daemon' class.
+        :param socket_path: The path to the Unix domain socket.
+        :param run: The function running a command from its arguments.
+        """
+        # The working directory changes with the requests.
+        self.__socket_path: str = os.path.abspath(socket_path)
+        self.__run: Callable[[list[str]], None] = run
+
+    def serve(self):
+        """
+        Runs the commands received on the socket, one after the other, until the process is interrupted or terminated.
+        """
+        if os.path.exists(self.__socket_path):
+            if Daemon.is_running(self.__socket_path):
+                raise ApiException("A daemon is already listening on socket '{0}'.".format(self.__socket_path))
+            # The socket was left by a daemon which did not stop properly.
+            os.remove(self.__socket_path)
+
+        server: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # The termination of the process stops the daemon as an interruption does, removing the socket.
+        handler = signal.signal(signal.SIGTERM, Daemon.__terminate)
+        try:
+            server.bind(self.__socket_path)
+            os.chmod(self.__socket_path, 0o600)
+            server.listen()
+            while True:
+                (connection, address) = server.accept()
+                with connection:
+                    self.__handle(connection)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, handler)
+            server.close()
+            if os.path.exists(self.__socket_path):
+                os.remove(self.__socket_path)
+
+    @staticmethod
+    def is_running(socket_path: str) -> bool:
+        """
+        Indicates whether a daemon listens on a socket.
+        :param socket_path: The path to the Unix domain socket.
+        :return: True if a daemon accepts the connections to the socket otherwise False.
+        """
+        client: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(socket_path)
+            return True
+        except OSError:
+            return False
+        finally:
+            client.close()
+
+    def __handle(self, connection: socket.socket):
+        """
+        Runs the command of a request and sends back its response.
+        The command runs in the working directory of the client, which is not restored afterwards: each request gives
+        its own.
+        :param connection: The connection of the client.
+        """
+        output: io.StringIO = io.StringIO()
+        error: Optional[str] = None
+        stdin: TextIO = sys.stdin
+        try:
+            request: dict = json.loads(Daemon.read_line(connection))
+            os.chdir(request["cwd"])
+            sys.stdin = io.StringIO(request.get("input", ""))
+            with redirect_stdout(output):
+                self.__run(request["arguments"])
+        except Exception:
+            error = traceback.format_exc()
+        finally:
+            sys.stdin = stdin
+
+        try:
+            connection.sendall("{0}\n".format(json.dumps({"output": output.getvalue(), "error": error}))
+                               .encode("utf-8"))
+        except OSError:
+            # The client is gone: the next request is waited for.
+            pass
+
+    @staticmethod
+    def read_line(connection: socket.socket) -> str:
+        """
+        Reads a message of the protocol: the data received until the first end of line.
+        :param connection: The connection.
+        :return: The message, without its end of line.
+        """
+        chunks: list[bytes] = []
+        chunk: bytes = connection.recv(65536)
+        while chunk.__ne__(b"") and not chunk.endswith(b"\n"):
+            chunks.append(chunk)
+            chunk = connection.recv(65536)
+        chunks.append(chunk)
+        return b"".join(chunks).decode("utf-8").rstrip("\n")
+
+    @staticmethod
+    def __terminate(signal_number: int, frame):
+        """
+        Stops the daemon when the process is terminated.
+        :param signal_number: The number of the signal received.
+        :param frame: The current stack frame.
+        """
+        raise KeyboardInterrupt()
@@ -0,0 +1,67 @@
+import json
+import os
+import socket
+import stat
+import sys
+from typing import Optional
+
+from api_core.daemon import Daemon
+
+
+class DaemonClient:
+    """
+    Client forwarding a command to a daemon (see 'Daemon') instead of running it in its own process.
+    """
+
+    def __init__(self, socket_path: str):
+        """
+        Initialize a new instance of 'DaemonClient' class.
+        :param socket_path: The path to the Unix domain socket of the daemon.
+        """
+        self.__socket_path: str = socket_path
+
+    def forward(self, arguments: list[str]) -> Optional[int]:
+        """
+        Forwards a command to the daemon and prints its output. The standard input is forwarded too when it is a file
+        or a pipe: the daemon cannot ask questions, the data must be given as options or on the standard input.
+        :param arguments: The arguments of the command.
+        :return: The exit status of the command or None if no daemon listens on the socket.
+        """
+        client: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            try:
+                client.connect(self.__socket_path)
+            except OSError:
+                return None
+
+            request: dict = {"arguments": arguments, "cwd": os.getcwd(),
+                             "input": sys.stdin.read() if DaemonClient.__is_input_given() else ""}
+            client.sendall("{0}\n".format(json.dumps(request)).encode("utf-8"))
+            try:
+                response: dict = json.loads(Daemon.read_line(client))
+            except ValueError:
+                sys.stderr.write("The daemon closed the connection without answering.\n")
+                return 1
+        finally:
+            client.close()
+
+        sys.stdout.write(response["output"])
+        sys.stdout.flush()
+        if response["error"] is not None:
+            sys.stderr.write(response["error"])
+            return 1
+        return 0
+
+    @staticmethod
+    def __is_input_given() -> bool:
+        """
+        Indicates whether the standard input is redirected from a file or a pipe (and not a terminal or a device).
+        :return: True if the standard input is a file or a pipe otherwise False.
+        """
+        if sys.stdin is None:
+            return False
+        try:
+            mode: int = os.fstat(sys.stdin.fileno()).st_mode
+        except (OSError, ValueError):
+            return False
+        return stat.S_ISREG(mode) or stat.S_ISFIFO(mode)
@@ -7,3 +7,34 @@ class ConstantHelper:
     """
     The width of the console view (in characters).
     """
+
+    XML_CACHE_SIZE: int = 64
+    """
+    The maximum number of parsed XML documents kept in memory by the XML file services.
+    """
+
+    MANIFEST_VERSION: int = 2
+    """
+    The version of the project load manifest. It must be incremented whenever its content or the generated files change
+    for the same content model files, so that the projects loaded by a previous version are generated again.
+    """
+
+    INDEX_VERSION: int = 3
+    """
+    The version of the schema of the content model index. An index with another version is built again.
+    """
+
+    DAEMON_SOCKET_VARIABLE: str = "ALFRESCO_HELPER_SOCKET"
+    """
+    The environment variable giving the path to the socket of the daemon the commands are forwarded to.
+    """
+
+    PROFILE_FILE_PATH: str = "alfresco_helper.prof"
+    """
+    The path to the profile written by the '--profile' option when the option does not give one.
+    """
+
+    PROFILE_TOP_SIZE: int = 20
+    """
+    The number of functions listed, by cumulative time, at the end of a profiled command.
+    """
@@ -4,6 +4,7 @@ import os
 import shutil
 
 from api_core.exception.api_exception import ApiException
+from api_core.helper.stats_helper import StatsHelper
 
 
 class FileFolderHelper:
@@ -18,6 +19,7 @@ class FileFolderHelper:
         :param path: The absolute path to the folder.
         :return: The list of folder contents.
         """
+        StatsHelper.count("file helper calls", "list_folder")
         if not FileFolderHelper.is_folder_exists(path):
             raise ApiException("The folder whose contents must be listed ({0}) does not exist.".format(path))
         return os.listdir(path)
@@ -29,10 +31,12 @@ class FileFolderHelper:
         :param filepath: The path to the file.
         :return: The path to the file folder.
         """
+        StatsHelper.count("file helper calls", "extract_folder_from_filepath")
         return filepath.rsplit(os.sep, 1)[0]
 
     @staticmethod
     def extract_filename_from_path(filepath: str) -> str:
+        StatsHelper.count("file helper calls", "extract_filename_from_path")
         return filepath.rsplit(os.sep, 1)[1]
 
     @staticmethod
@@ -42,6 +46,7 @@ class FileFolderHelper:
         :param file_path: The file path to check.
         :return: True if the file exists otherwise false.
                 """
+        StatsHelper.count("file helper calls", "is_file_exists")
         return True if (os.path.exists(file_path) and os.path.isfile(file_path)) else False
 
     @staticmethod
@@ -51,6 +56,7 @@ class FileFolderHelper:
         :param folder_path: The path to the folder to test.
         :return: True if the folder exists otherwise false.
         """
+        StatsHelper.count("file helper calls", "is_folder_exists")
         return True if (os.path.exists(folder_path) and os.path.isdir(folder_path)) else False
 
     @staticmethod
@@ -59,6 +65,7 @@ class FileFolderHelper:
         Create a folder if possible.
         :param folder_path: The path of the folder to create.
         """
+        StatsHelper.count("file helper calls", "create_folder")
         if not FileFolderHelper.is_folder_exists(folder_path):
             os.makedirs(folder_path)
 
@@ -69,9 +76,14 @@ class FileFolderHelper:
         :param file_path_destination: The destination path of the file.
         :param content: The contents of the file.
         """
-        if content is not None:
+        StatsHelper.count("file helper calls", "write_file")
+        # An unchanged file is not written again so that its modification date is kept.
+        if content is not None and content.__ne__(FileFolderHelper.read_file(file_path_destination)):
             with open(file_path_destination, "w") as writer:
                 writer.write(content)
+            StatsHelper.count("bytes written", "text files", len(content))
+            if StatsHelper.is_enabled():
+                StatsHelper.count("file writes", os.path.relpath(file_path_destination))
 
     @staticmethod
     def read_file(file_path_source: str) -> str | None:
@@ -80,12 +92,30 @@ class FileFolderHelper:
         :param file_path_source: The source path of the file.
         :return: The content of the file
         """
+        StatsHelper.count("file helper calls", "read_file")
         if FileFolderHelper.is_file_exists(file_path_source):
             with open(file_path_source, "r") as reader:
                 content = reader.read()
+            StatsHelper.count("bytes read", "text files", len(content))
             return content
         return None
 
+    @staticmethod
+    def get_file_hash(file_path: str) -> str | None:
+        """
+        Compute the SHA-256 hash of the content of a file.
+        :param file_path: The path to the file.
+        :return: The hexadecimal hash of the file or None if the file does not exist.
+        """
+        StatsHelper.count("file helper calls", "get_file_hash")
+        if not FileFolderHelper.is_file_exists(file_path):
+            return None
+        import hashlib
+        with open(file_path, "rb") as reader:
+            content: bytes = reader.read()
+        StatsHelper.count("bytes read", "hashed files", len(content))
+        return hashlib.sha256(content).hexdigest()
+
     @staticmethod
     def is_folder_has_files(folder_path: str) -> bool:
         """
@@ -93,6 +123,7 @@ class FileFolderHelper:
         :param folder_path: The path to the folder to check.
         :return: True if the folder has content otherwise False.
         """
+        StatsHelper.count("file helper calls", "is_folder_has_files")
         if not FileFolderHelper.is_folder_exists(folder_path):
             return False
         return True if len(os.listdir(folder_path)).__gt__(0) else False
@@ -104,6 +135,7 @@ class FileFolderHelper:
         :param folder_path: The path of the folder whose contents we want to retrieve.
         :return: An array containing file names.
         """
+        StatsHelper.count("file helper calls", "get_contents")
         return [] if not FileFolderHelper.is_folder_exists(folder_path) else os.listdir(folder_path)
 
     @staticmethod
@@ -112,6 +144,7 @@ class FileFolderHelper:
         Delete a file.
         :param filepath: The path to the file.
         """
+        StatsHelper.count("file helper calls", "remove_file")
         if FileFolderHelper.is_file_exists(filepath):
             os.remove(filepath)
 
@@ -121,11 +154,13 @@ class FileFolderHelper:
         Delete a folder.
         :param folder_path: The path to the folder.
         """
+        StatsHelper.count("file helper calls", "remove_folder")
         if FileFolderHelper.is_folder_exists(folder_path):
             shutil.rmtree(folder_path)
 
     @staticmethod
     def remove_content(folder_path: str):
+        StatsHelper.count("file helper calls", "remove_content")
         if FileFolderHelper.is_folder_exists(folder_path):
             for content in FileFolderHelper.list_folder(folder_path):
                 path: str = "{1}{0}{2}".format(os.sep, folder_path, content)
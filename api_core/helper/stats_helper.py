@@ -0,0 +1,96 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class StatsHelper:
+    """
+    Helper class for the statistics of a command: counters grouped by category (the XML parses per file, the queries
+    and the writes per XML file service, the bytes read and written, the file helper calls...) and the wall time spent
+    in each phase of the command. Nothing is recorded until the statistics are enabled.
+    """
+
+    __enabled: bool = False
+    """
+    Indicates whether the statistics are recorded.
+    """
+
+    __counters: dict[str, dict[str, int]] = {}
+    """
+    The counters, indexed by category then by name.
+    """
+
+    __times: dict[str, float] = {}
+    """
+    The wall time (in seconds) spent in each phase, indexed by phase name.
+    """
+
+    @staticmethod
+    def enable(enabled: bool = True):
+        """
+        Enables (or disables) the recording of the statistics. The statistics recorded so far are forgotten.
+        :param enabled: Indicates whether the statistics are recorded.
+        """
+        StatsHelper.__enabled = enabled
+        StatsHelper.reset()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        Indicates whether the statistics are recorded.
+        :return: True if the statistics are recorded otherwise False.
+        """
+        return StatsHelper.__enabled
+
+    @staticmethod
+    def reset():
+        """
+        Forgets the statistics recorded so far.
+        """
+        StatsHelper.__counters = {}
+        StatsHelper.__times = {}
+
+    @staticmethod
+    def count(category: str, name: str, amount: int = 1):
+        """
+        Increments a counter.
+        :param category: The category of the counter.
+        :param name: The name of the counter in its category.
+        :param amount: The value added to the counter.
+        """
+        if StatsHelper.__enabled:
+            counters: dict[str, int] = StatsHelper.__counters.setdefault(category, {})
+            counters[name] = counters.get(name, 0) + amount
+
+    @staticmethod
+    @contextmanager
+    def phase(name: str) -> Iterator[None]:
+        """
+        Measures the wall time spent in a phase of the command, added to the time already spent in it. The time of a
+        phase nested in another one is counted in both.
+        :param name: The name of the phase.
+        """
+        if not StatsHelper.__enabled:
+            yield
+            return
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            StatsHelper.__times[name] = StatsHelper.__times.get(name, 0.0) + time.perf_counter() - start
+
+    @staticmethod
+    def get_counters() -> dict[str, dict[str, int]]:
+        """
+        Gets the counters recorded.
+        :return: A copy of the counters, indexed by category then by name.
+        """
+        return {category: dict(counters) for (category, counters) in StatsHelper.__counters.items()}
+
+    @staticmethod
+    def get_times() -> dict[str, float]:
+        """
+        Gets the wall time spent in each phase.
+        :return: A copy of the times (in seconds), indexed by phase name.
+        """
+        return dict(StatsHelper.__times)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Optional
+import json
+import sys
+from typing import Callable, Optional
 
 from api_core.exception.api_exception import ApiException
+from api_core.helper.file_folder_helper import FileFolderHelper
 from api_core.mvc.service.data.manual_model import ManualModel
 from api_core.mvc.service.model.service import Service
 from api_core.mvc.view.view import View
@@ -21,6 +24,9 @@ class Controller:
         self._name: str = name
         self._view: View = view
         self._service: Service = service
+        # The functions running the commands, indexed by command name.
+        self.__handlers: dict[str, Callable[[list[str], dict[str, str | bool]], None]] = {}
+        self._register("man", lambda positionals, options: self.man(*positionals))
 
     @property
     def name(self) -> str:
@@ -47,6 +53,86 @@ class Controller:
         """
         return self._service.is_command_valid(command, arguments)
 
+    def execute(self, command: str, arguments: list[str]):
+        """
+        Runs a command with the handler registered for it, once its arguments are checked against its manual.
+        :param command: The name of the command.
+        :param arguments: The arguments accompanying the command.
+        """
+        (positionals, options) = self.parse_arguments(command, arguments)
+        handler: Optional[Callable[[list[str], dict[str, str | bool]], None]] = self.__handlers.get(command)
+        if handler is None:
+            raise ApiException("The command '{0}_{1}' has been defined but not implemented."
+                               .format(command, self._name))
+        handler(positionals, options)
+
+    def _register(self, command: str, handler: Callable[[list[str], dict[str, str | bool]], None]):
+        """
+        Registers the handler of a command, whose arguments are described by the manual of the command.
+        :param command: The name of the command.
+        :param handler: The function running the command, called with the positional arguments and the options given.
+        """
+        self.__handlers[command] = handler
+
+    def parse_arguments(self, command: str, arguments: list[str]) -> tuple[list[str], dict[str, str | bool]]:
+        """
+        Parse the arguments of a command according to its manual.
+        :param command: The command.
+        :param arguments: The arguments accompanying the command.
+        :return: A tuple composed of the positional arguments and of the options given (indexed by their name).
+        """
+        result: Optional[tuple[list[str], dict[str, str | bool]]] = self._service.parse_arguments(command, arguments)
+        if result is None:
+            raise ApiException("The '{0}_{1}' command was not called correctly. Here is the manual for it:"
+                               .format(command, self._name), self.get_man(command))
+        return result
+
+    @staticmethod
+    def _read_entries(options: dict[str, str | bool], fields: list[str]) -> Optional[list[dict[str, str | bool]]]:
+        """
+        Reads the entries given to a creation command instead of asking them to the user. The entries come from a JSON
+        document (an object or an array of objects) when the '--json' option is given with the path to the document
+        ('-' for the standard input, where a batch ends it with a line 'EOF'), otherwise from the options named after
+        the fields ('--' followed by the field name, with '-' instead of '_').
+        :param options: The options given to the command.
+        :param fields: The names of the fields of an entry.
+        :return: The entries indexed by field (a missing field is empty) or None if the entries must be asked.
+        """
+        if "--json" in options.keys():
+            if len(options.keys()).__gt__(1):
+                raise ApiException("The '--json' option cannot be combined with other options.")
+            try:
+                if options["--json"].__eq__("-"):
+                    document = json.load(sys.stdin)
+                elif FileFolderHelper.is_file_exists(options["--json"]):
+                    with open(options["--json"], "r") as reader:
+                        document = json.load(reader)
+                else:
+                    raise ApiException("The JSON file '{0}' does not exist.".format(options["--json"]))
+            except ValueError as e:
+                raise ApiException("The JSON document is invalid: {0}.".format(e))
+            except OSError as e:
+                raise ApiException("The JSON document cannot be read: {0}.".format(e))
+
+            documents: list = document if isinstance(document, list) else [document]
+            result: list[dict[str, str | bool]] = []
+            for item in documents:
+                if not isinstance(item, dict):
+                    raise ApiException("The JSON document must be an object or an array of objects.")
+                for key in item.keys():
+                    if key not in fields:
+                        raise ApiException("Unknown field '{0}' in the JSON document (expected fields: {1})."
+                                           .format(key, ", ".join(fields)))
+                    if item[key] is not None and not isinstance(item[key], (str, bool)):
+                        raise ApiException("The value of the field '{0}' must be a string or a boolean.".format(key))
+                result.append({field: "" if item.get(field) is None else item.get(field) for field in fields})
+            return result
+
+        entry: dict[str, str | bool] = {}
+        for field in fields:
+            entry[field] = options.get("--{0}".format(field.replace("_", "-")), "")
+        return None if len(options.keys()).__eq__(0) else [entry]
+
     def man(self, command: Optional[str] = None):
         """
         print on the standard output the manual requested.
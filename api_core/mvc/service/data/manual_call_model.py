@@ -17,6 +17,9 @@ class ManualCallModel:
         """
         self.arguments: list[ManualArgumentModel] = []
         self.manual: Optional[IManualModel] = None
+        # The options of the call indexed by name and the number of its positional arguments.
+        self.__options: dict[str, ManualArgumentModel] = {}
+        self.__positional_count: int = 0
 
     def add_argument(self, argument: ManualArgumentModel):
         """
@@ -24,9 +27,45 @@ class ManualCallModel:
         :param argument: The argument to add to the call.
         """
         self.arguments.append(argument)
+        if argument.name.startswith("--"):
+            self.__options[argument.name] = argument
+        else:
+            self.__positional_count += 1
         if self.manual is not None:
             self.manual.add_argument(argument)
 
+    def parse(self, arguments: list[str]) -> Optional[tuple[list[str], dict[str, str | bool]]]:
+        """
+        Parse the arguments of a command according to this call. The arguments of the call whose name starts with '--'
+        are options: they are optional, may be given in any order and take a value, except the options of typology
+        'flag'.
+        :param arguments: The arguments accompanying the command.
+        :return: A tuple composed of the positional arguments and of the options given (indexed by their name, a flag
+        having the value True), or None if the arguments do not match this call.
+        """
+        options: dict[str, ManualArgumentModel] = self.__options
+        positionals: list[str] = []
+        values: dict[str, str | bool] = {}
+        index: int = 0
+        maximum: int = len(arguments)
+        while index.__lt__(maximum):
+            if arguments[index] in options.keys() and arguments[index] not in values.keys():
+                option: ManualArgumentModel = options[arguments[index]]
+                if option.typology.__eq__("flag"):
+                    values[option.name] = True
+                elif index.__lt__(maximum - 1):
+                    index += 1
+                    values[option.name] = arguments[index]
+                else:
+                    return None
+            elif arguments[index].startswith("--"):
+                return None
+            else:
+                positionals.append(arguments[index])
+            index += 1
+
+        return (positionals, values) if len(positionals).__eq__(self.__positional_count) else None
+
     def set_manual(self, manual_model: IManualModel):
         """
         Set the call manual.
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from typing import Optional
+import io
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
 from api_core.exception.api_exception import ApiException
+from api_core.helper.constant_helper import ConstantHelper
+from api_core.helper.stats_helper import StatsHelper
 
 
 class XmlFileService:
@@ -12,6 +18,29 @@ class XmlFileService:
     Service class for managing XML files.
     """
 
+    __cache: OrderedDict[str, tuple[tuple[int, int, int], Element]] = OrderedDict()
+    """
+    Parsed documents shared by all XML file services, indexed by absolute path. Each entry holds the stat signature
+    (mtime, size, inode) of the file at parse time and its root node.
+    """
+
+    __session_depth: int = 0
+    """
+    The number of document sessions currently open.
+    """
+
+    __session_documents: dict[str, tuple[XmlFileService, Element]] = {}
+    """
+    Documents modified during the current session and not yet written, indexed by absolute path, with the service
+    that must write them.
+    """
+
+    __versions: dict[str, int] = {}
+    """
+    The number of changes of each document made through the XML file services (written, kept in a session or dropped
+    from the cache), indexed by absolute path.
+    """
+
     def __init__(self, use_xml_declaration: bool, namespaces: Optional[dict[str, str]]):
         """
         Initialize a new instance of 'XmlFileService' class.
@@ -43,11 +72,170 @@ class XmlFileService:
 
         with open(xml_path, "w") as writer:
             writer.write(buffer)
+        XmlFileService._invalidate(xml_path)
+
+    @staticmethod
+    def clear_cache():
+        """
+        Remove every parsed document from the shared cache.
+        """
+        XmlFileService.__cache.clear()
+
+    @staticmethod
+    def open_session():
+        """
+        Open a document session: until the session is committed, the documents written by the XML file services are
+        kept in memory and each of them is written only once at the end. Sessions can be nested, only the outermost
+        commit writes the files.
+        """
+        XmlFileService.__session_depth += 1
+
+    @staticmethod
+    def commit_session():
+        """
+        Close the current document session and, if it is the outermost one, write every modified document.
+        """
+        if XmlFileService.__session_depth.__eq__(0):
+            raise ApiException("There is no document session to commit.")
+        XmlFileService.__session_depth -= 1
+        if XmlFileService.__session_depth.__gt__(0):
+            return
+
+        documents: dict[str, tuple[XmlFileService, Element]] = XmlFileService.__session_documents
+        XmlFileService.__session_documents = {}
+        for path in documents.keys():
+            (service, root) = documents[path]
+            service.__save(root, path)
+
+    @staticmethod
+    def rollback_session():
+        """
+        Close the current document session after a failure. The modified documents are discarded when the outermost
+        session is rolled back: the caller of an inner session passes the failure on to it.
+        """
+        if XmlFileService.__session_depth.__eq__(0):
+            raise ApiException("There is no document session to roll back.")
+        XmlFileService.__session_depth -= 1
+        if XmlFileService.__session_depth.__eq__(0):
+            XmlFileService.__discard_session_documents()
+
+    @staticmethod
+    def close_sessions():
+        """
+        Close every open document session without writing the modified documents (after an interrupted command).
+        """
+        XmlFileService.__session_depth = 0
+        XmlFileService.__discard_session_documents()
+
+    @staticmethod
+    def __discard_session_documents():
+        """
+        Discard the documents modified during the session.
+        """
+        for path in XmlFileService.__session_documents.keys():
+            # The cached node may have been modified in place.
+            XmlFileService._invalidate(path)
+        XmlFileService.__session_documents = {}
+
+    @staticmethod
+    @contextmanager
+    def session() -> Iterator[None]:
+        """
+        Open a document session for the duration of a 'with' block: the session is committed at the end of the block,
+        or rolled back if the block raises an exception (an interruption included).
+        """
+        XmlFileService.open_session()
+        try:
+            yield
+        except BaseException:
+            XmlFileService.rollback_session()
+            raise
+        XmlFileService.commit_session()
+
+    @staticmethod
+    def in_session() -> bool:
+        """
+        Indicates whether a document session is open.
+        :return: True if a document session is open otherwise False.
+        """
+        return XmlFileService.__session_depth.__gt__(0)
+
+    @staticmethod
+    def get_version(xml_file_path: str) -> int:
+        """
+        Get the version of a document: it changes each time the document is modified through an XML file service, so
+        that the data built from the document can be kept as long as the version does not change.
+        :param xml_file_path: Path to the xml file.
+        :return: The version of the document.
+        """
+        return XmlFileService.__versions.get(os.path.abspath(xml_file_path), 0)
+
+    @staticmethod
+    def _invalidate(xml_file_path: str):
+        """
+        Remove a parsed document from the shared cache.
+        :param xml_file_path: Path to the xml file.
+        """
+        path: str = os.path.abspath(xml_file_path)
+        XmlFileService.__cache.pop(path, None)
+        XmlFileService.__versions[path] = XmlFileService.__versions.get(path, 0) + 1
+
+    def _new_element(self, tag: str) -> Element:
+        """
+        Create a node in the default namespace of the file, as it would be read once the file is parsed.
+        :param tag: The node tag.
+        :return: The new node.
+        """
+        if self.__namespaces is None or "xmlns" not in self.__namespaces.keys():
+            return Element(tag)
+        return Element("{0}{1}".format(self.get_namespace("xmlns"), tag))
 
     def _write(self, root: Element, path: str):
+        """
+        Write an XML document, or keep it in memory until the end of the current document session.
+        :param root: The root node of the document.
+        :param path: Path to the xml file.
+        """
+        if XmlFileService.in_session():
+            absolute_path: str = os.path.abspath(path)
+            XmlFileService.__session_documents[absolute_path] = (self, root)
+            XmlFileService.__versions[absolute_path] = XmlFileService.__versions.get(absolute_path, 0) + 1
+        else:
+            self.__save(root, path)
+
+    def __save(self, root: Element, path: str):
+        """
+        Write an XML document on the disk.
+        :param root: The root node of the document.
+        :param path: Path to the xml file.
+        """
+        # The default namespace used for serialization is global: it must be the one of this file.
+        if self.__namespaces is not None:
+            for item in self.__namespaces.items():
+                ElementTree.register_namespace('', item[1])
         tree = ElementTree.ElementTree(root)
         ElementTree.indent(tree, self.__indent)
-        tree.write(path, encoding="utf-8", xml_declaration=self.__use_xml_declaration)
+        buffer: io.BytesIO = io.BytesIO()
+        tree.write(buffer, encoding="utf-8", xml_declaration=self.__use_xml_declaration)
+
+        # An unchanged document is not written again so that the modification date of the file is kept.
+        content: bytes = buffer.getvalue()
+        unchanged: bool = False
+        if os.path.isfile(path):
+            with open(path, "rb") as reader:
+                existing: bytes = reader.read()
+            StatsHelper.count("bytes read", "XML files", len(existing))
+            unchanged = content.__eq__(existing)
+        if not unchanged:
+            with open(path, "wb") as writer:
+                writer.write(content)
+            StatsHelper.count("XML writes", type(self).__name__)
+            StatsHelper.count("bytes written", "XML files", len(content))
+            StatsHelper.count("file writes", os.path.relpath(path))
+        else:
+            StatsHelper.count("XML unchanged writes", type(self).__name__)
+        # The file is parsed again on its next reading (the cached node may have been modified in place).
+        XmlFileService._invalidate(path)
 
     @staticmethod
     def _extract_xmlns(pom_root: Element) -> str:
@@ -62,12 +250,39 @@ class XmlFileService:
 
     def _get_root(self, xml_file_path: str) -> Element:
         """
-        Get the XML root node.
+        Get the XML root node. The document is only parsed again if the file has changed since the last parsing, so
+        the node returned is shared: any modification made on it must be followed by a call to '_write'.
         :param xml_file_path: Path to the xml file.
         :return: The xml root node.
         """
         if self.__namespaces is not None:
             for item in self.__namespaces.items():
                 ElementTree.register_namespace('', item[1])
+
+        path: str = os.path.abspath(xml_file_path)
+        StatsHelper.count("XML queries", type(self).__name__)
+
+        # Return the document modified during the current session.
+        if path in XmlFileService.__session_documents.keys():
+            return XmlFileService.__session_documents[path][1]
+
+        stat: os.stat_result = os.stat(path)
+        signature: tuple[int, int, int] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        # Return the cached root node if the file has not changed.
+        cached: Optional[tuple[tuple[int, int, int], Element]] = XmlFileService.__cache.get(path)
+        if cached is not None and cached[0].__eq__(signature):
+            XmlFileService.__cache.move_to_end(path)
+            return cached[1]
+
+        # Parse the file and keep its root node, dropping the least recently used document if necessary.
+        root: Element = ElementTree.parse(path).getroot()
+        if StatsHelper.is_enabled():
+            StatsHelper.count("XML parses", os.path.relpath(path))
+            StatsHelper.count("bytes read", "XML files", stat.st_size)
+        XmlFileService.__cache[path] = (signature, root)
+        XmlFileService.__cache.move_to_end(path)
+        while len(XmlFileService.__cache).__gt__(ConstantHelper.XML_CACHE_SIZE):
+            XmlFileService.__cache.popitem(last=False)
         # Return the xml root node.
-        return ElementTree.parse(xml_file_path).getroot()
+        return root
@@ -1,3 +1,5 @@
+from typing import Callable
+
 from api_core.mvc.controller.controller import Controller
 
 
@@ -11,6 +13,8 @@ class ControllerService:
         Initialize a new instance of 'ControllerService' class.
         """
         self.__controllers: dict[str, Controller] = {}
+        # The functions adding the controllers not built yet, indexed by controller name.
+        self.__factories: dict[str, Callable[[], None]] = {}
 
     def exists(self, name: str) -> bool:
         """
@@ -18,7 +22,7 @@ class ControllerService:
         :param name: The name of the controller.
         :return:
         """
-        return name in self.__controllers.keys()
+        return name in self.__controllers.keys() or name in self.__factories.keys()
 
     def add(self, controller: Controller):
         """
@@ -26,6 +30,15 @@ class ControllerService:
         :param controller: The controller to add.
         """
         self.__controllers[controller.name] = controller
+        self.__factories.pop(controller.name, None)
+
+    def register(self, name: str, factory: Callable[[], None]):
+        """
+        Register a controller built on its first use only.
+        :param name: The name of the controller.
+        :param factory: The function adding the controller in the service (with the controllers it depends on).
+        """
+        self.__factories[name] = factory
 
     def get(self, name: str) -> Controller:
         """
@@ -33,4 +46,15 @@ class ControllerService:
         :param name: The name of the controller.
         :return: The controller referenced by name.
         """
+        if name not in self.__controllers.keys() and name in self.__factories.keys():
+            self.__factories[name]()
         return self.__controllers.get(name)
+
+    def get_all(self) -> list[Controller]:
+        """
+        Get the controllers of the service.
+        :return: The controllers, in the order they were added.
+        """
+        for name in list(self.__factories.keys()):
+            self.get(name)
+        return list(self.__controllers.values())
@@ -69,14 +69,26 @@ class ManualService:
         :param arguments: The arguments accompanying the command.
         :return: True if the command exists in the service otherwise False.
         """
+        return self.parse_arguments(command, arguments) is not None
+
+    def parse_arguments(self, command: str, arguments: list[str]) -> tuple[list[str], dict[str, str | bool]] | None:
+        """
+        Parse the arguments of a command according to the first call of its manual they match.
+        :param command: The command.
+        :param arguments: The arguments accompanying the command.
+        :return: A tuple composed of the positional arguments and of the options given, or None if the command does
+        not exist or the arguments do not match any of its calls.
+        """
         (exists, manual) = self.is_command_exists(self.__manual_template.format(command, self.__service_name))
         if not exists:
-            return False
+            return None
         index: int = 0
         maximum: int = len(manual.calls)
-        while index.__lt__(maximum) and len(manual.calls[index].arguments).__ne__(len(arguments)):
+        result: tuple[list[str], dict[str, str | bool]] | None = None
+        while index.__lt__(maximum) and result is None:
+            result = manual.calls[index].parse(arguments)
             index += 1
-        return index.__lt__(maximum)
+        return result
 
     def is_command_exists(self, manuel: str) -> tuple[bool, ManualModel | None]:
         """
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import ContextManager
 
 from api_core.mvc.service.data.manual_model import ManualModel
+from api_core.mvc.service.file.xml_file_service import XmlFileService
 from api_core.mvc.service.model.manual_service import ManualService
 
 
@@ -16,9 +18,21 @@ class Service(ABC):
         Initialize a new instance of 'Service' class.
         :param: The service name.
         """
-        self._ms: ManualService = ManualService(service_name)
-        self.init_manual()
-        self.__man_manual()
+        self.__service_name: str = service_name
+        # The manual, built on its first use.
+        self.__ms: ManualService | None = None
+
+    @property
+    def _ms(self) -> ManualService:
+        """
+        Access method to the manual of the service, which is built on the first access.
+        :return: The manual service.
+        """
+        if self.__ms is None:
+            self.__ms = ManualService(self.__service_name)
+            self.init_manual()
+            self.__man_manual()
+        return self.__ms
 
     @abstractmethod
     def init_manual(self):
@@ -27,6 +41,36 @@ class Service(ABC):
         """
         pass
 
+    @staticmethod
+    def open_session():
+        """
+        Open a document session: the XML files modified until the commit are written only once.
+        """
+        XmlFileService.open_session()
+
+    @staticmethod
+    def commit_session():
+        """
+        Write the XML files modified since the opening of the document session.
+        """
+        XmlFileService.commit_session()
+
+    @staticmethod
+    def rollback_session():
+        """
+        Close the document session after a failure: the changes made to the XML files are discarded by the outermost
+        session.
+        """
+        XmlFileService.rollback_session()
+
+    @staticmethod
+    def session() -> ContextManager[None]:
+        """
+        Open a document session for the duration of a 'with' block, committed at its end or rolled back if it fails.
+        :return: The context manager of the session.
+        """
+        return XmlFileService.session()
+
     def is_command_valid(self, command: str, arguments: list[str]) -> bool:
         """
         Checks if a command is valid.
@@ -36,6 +80,16 @@ class Service(ABC):
         """
         return self._ms.is_command_valid(command, arguments)
 
+    def parse_arguments(self, command: str, arguments: list[str]) -> tuple[list[str], dict[str, str | bool]] | None:
+        """
+        Parse the arguments of a command.
+        :param command: The command.
+        :param arguments: The arguments accompanying the command.
+        :return: A tuple composed of the positional arguments and of the options given, or None if the arguments do
+        not match the manual of the command.
+        """
+        return self._ms.parse_arguments(command, arguments)
+
     def is_command_exists(self, command: str) -> bool:
         """
         Indicates whether the manual for an order exists in the service.
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class OutputMode(Enum):
+    """
+    Enumeration for available output modes: the messages are printed as they come (plain), all at once at the end of
+    the command or before a question (buffered), only for the errors, the warnings, the manuals and the questions
+    (quiet), or as JSON objects, one per line (json).
+    """
+    PLAIN: str = "plain"
+    BUFFERED: str = "buffered"
+    QUIET: str = "quiet"
+    JSON: str = "json"
@@ -1,11 +1,11 @@
+import json
 import sys
-from termcolor import colored, cprint
-
-import colorama as colorama
+from termcolor import colored
 
 from api_core.exception.api_exception import ApiException
 from api_core.helper.string_helper import StringHelper
 from api_core.mvc.view.message_type import MessageType
+from api_core.mvc.view.output_mode import OutputMode
 
 
 class View:
@@ -13,16 +13,62 @@ class View:
     Base class for views.
     """
 
+    __console_initialized: bool = False
+    """
+    Indicates whether the console was initialized for the colored output.
+    """
+
+    __mode: OutputMode = OutputMode.PLAIN
+    """
+    The output mode of every view.
+    """
+
+    __buffer: list[str] = []
+    """
+    The text printed by the views and not written yet on the standard output (buffered mode).
+    """
+
+    __QUIET_TYPES: list[MessageType] = [MessageType.ERROR, MessageType.WARN, MessageType.MANUAL, MessageType.INPUT]
+    """
+    The types of the messages printed in quiet mode.
+    """
+
     def __init__(self, width: int):
         """
         Initialize a new instance of 'View' class.
         :param width: The maximum width of the screen.
         """
-        colorama.init()
         self.__width: int = width
         self.__space: int = MessageType.maximum_space()
         self.__maximum_row_width: int = self.__width - 4
 
+    @staticmethod
+    def get_output_mode() -> OutputMode:
+        """
+        Gets the output mode of every view.
+        :return: The output mode.
+        """
+        return View.__mode
+
+    @staticmethod
+    def set_output_mode(mode: OutputMode):
+        """
+        Sets the output mode of every view. The text buffered so far is written first.
+        :param mode: The output mode.
+        """
+        View.flush()
+        View.__mode = mode
+
+    @staticmethod
+    def flush():
+        """
+        Writes on the standard output the text buffered by the views.
+        """
+        if len(View.__buffer).__gt__(0):
+            sys.stdout.write("".join(View.__buffer))
+            sys.stdout.flush()
+            View.__buffer.clear()
+
     def main_title(self, api_name: str):
         """
         Print the main title of the application to standard output.
@@ -50,6 +96,31 @@ class View:
         client_input: str = input()
         return client_input
 
+    def prompt(self, message: str) -> str:
+        """
+        Print a prompt and allow the user to type a command. The text buffered so far is written first. The prompt is
+        not printed in json mode, whose output only contains JSON objects.
+        :param message: The prompt.
+        :return: The line typed by the user.
+        """
+        View.flush()
+        View.__init_console()
+        try:
+            return input("" if View.__mode is OutputMode.JSON else message)
+        except (EOFError, KeyboardInterrupt):
+            # The prompt is left on a line of its own.
+            self.end_line()
+            raise
+
+    def end_line(self):
+        """
+        Ends the line left unfinished on the output by the user (a prompt closed or a command interrupted), except in
+        json mode.
+        """
+        if View.__mode is not OutputMode.JSON:
+            View.flush()
+            print()
+
     def get_bool_input(self, message: str) -> bool:
         """
         Print a message and allow the user to type a response.
@@ -83,13 +154,15 @@ class View:
         """
         Print a separation line on the output.
         """
-        print(self.__fill_line("-"))
+        if View.__mode in [OutputMode.PLAIN, OutputMode.BUFFERED]:
+            View.__write(self.__fill_line("-"))
 
     def empty(self):
         """
         Print a white line on the standard output.
         """
-        print(self.__fill_line(" "))
+        if View.__mode in [OutputMode.PLAIN, OutputMode.BUFFERED]:
+            View.__write(self.__fill_line(" "))
 
     def info(self, message: str, to_erase: bool = False):
         self.__print_typed_message(MessageType.INFO, message, to_erase)
@@ -145,22 +218,49 @@ class View:
         :param message_type:  The message type.
         :param message: The message to print.
         """
-        message_to_print: str = "[{0}] {1}".format(message_type.value.ljust(self.__space), message)
-
-        for line in self.__split_in_lines(message_to_print):
-            if message_type.value.__eq__("ERROR"):
-                print(colored("| {0} |".format(line.ljust(self.__maximum_row_width)), "light_red"))
-            elif message_type.value.__eq__("SUCCESS"):
-                print(colored("| {0} |".format(line.ljust(self.__maximum_row_width)), "light_green"))
-            elif message_type.value.__eq__("WARNING"):
-                print(colored("| {0} |".format(line.ljust(self.__maximum_row_width)), "light_yellow"))
-            elif message_type.value.__ne__("INPUT"):
-                if to_erase:
-                    print("| {0} |".format(line.ljust(self.__maximum_row_width)), end="\r")
+        if View.__mode is OutputMode.JSON:
+            View.__write(json.dumps({"type": message_type.value.lower(), "message": message}))
+        elif View.__mode is not OutputMode.QUIET or message_type in View.__QUIET_TYPES:
+            message_to_print: str = "[{0}] {1}".format(message_type.value.ljust(self.__space), message)
+            for line in self.__split_in_lines(message_to_print):
+                if message_type.value.__eq__("ERROR"):
+                    View.__write(colored("| {0} |".format(line.ljust(self.__maximum_row_width)), "light_red"))
+                elif message_type.value.__eq__("SUCCESS"):
+                    View.__write(colored("| {0} |".format(line.ljust(self.__maximum_row_width)), "light_green"))
+                elif message_type.value.__eq__("WARNING"):
+                    View.__write(colored("| {0} |".format(line.ljust(self.__maximum_row_width)), "light_yellow"))
+                elif message_type.value.__ne__("INPUT"):
+                    View.__write("| {0} |".format(line.ljust(self.__maximum_row_width)), "\r" if to_erase else "\n")
                 else:
-                    print("| {0} |".format(line.ljust(self.__maximum_row_width)))
-            else:
-                cprint("| {0}: ".format(line), "white", end='')
+                    View.__write(colored("| {0}: ".format(line), "white"), "")
+
+        # The question must be visible before the answer is read.
+        if message_type is MessageType.INPUT:
+            View.flush()
+
+    @staticmethod
+    def __write(text: str, end: str = "\n"):
+        """
+        Prints a text on the standard output, or adds it to the buffer in buffered mode.
+        :param text: The text to print.
+        :param end: The text printed after it.
+        """
+        if View.__mode is OutputMode.BUFFERED:
+            View.__buffer.append("{0}{1}".format(text, end))
+        else:
+            View.__init_console()
+            print(text, end=end)
+
+    @staticmethod
+    def __init_console():
+        """
+        Initializes the console for the colored output before the first message (colorama, which is imported only
+        then since it is slow to load, converts the colors on Windows).
+        """
+        if not View.__console_initialized:
+            import colorama
+            colorama.init()
+            View.__console_initialized = True
 
     def __fill_line(self, character: str) -> str:
         """
@@ -176,28 +276,21 @@ class View:
         :param message: The message to split.
         :return: The message split in a line array.
         """
-        result: [str] = []
         messages: list[str] = message.splitlines()
         if len(message).__le__(self.__maximum_row_width) and len(messages).__lt__(2):
-            result.append(message)
-            return result
+            return [message]
 
         max_line: int = self.__maximum_row_width
         maximum: int = self.__space + 3
+        indentation: str = "".ljust(maximum)
 
-        messages: list[str] = message.splitlines()
-        while len(messages).__gt__(0):
-            token: str = messages.pop(0)
-            if (len(token) + maximum).__gt__(max_line):
-                if len(result).__gt__(0):
-                    result.append("{0}{1}".format("".ljust(maximum), token[:max_line]))
-                else:
-                    result.append(token[:max_line])
-                messages.insert(0, token[max_line:])
-            else:
-                if len(result).__gt__(0):
-                    result.append("{0}{1}".format("".ljust(maximum), token))
-                else:
-                    result.append(token)
-
+        # Each line is cut in pieces of the maximal width, the pieces following the first one being indented.
+        result: list[str] = []
+        for token in messages:
+            start: int = 0
+            while (len(token) - start + maximum).__gt__(max_line):
+                result.append("{0}{1}".format(indentation if len(result).__gt__(0) else "",
+                                              token[start:start + max_line]))
+                start += max_line
+            result.append("{0}{1}".format(indentation if len(result).__gt__(0) else "", token[start:]))
         return result
@@ -0,0 +1,120 @@
+import cProfile
+import os
+import pstats
+from typing import Callable, Optional
+
+
+class Profiler:
+    """
+    Profiler of a command, based on cProfile. The profile is written in the pstats format and as collapsed stacks, one
+    line per stack with its own time in microseconds, the input format of the flame graph tools. cProfile only records
+    the calls between two functions: the stacks are rebuilt from them, the time of a function being shared between its
+    callers in proportion to the time each caller spent in it.
+    """
+
+    COLLAPSED_EXTENSION: str = ".collapsed"
+    """
+    The extension added to the path of the profile to get the path of the collapsed stacks.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize a new instance of 'Profiler' class.
+        :param path: The path to the profile (pstats format).
+        """
+        self.__path: str = path
+        self.__stats: Optional[pstats.Stats] = None
+
+    @property
+    def path(self) -> str:
+        """
+        Access method to instance property '__path'.
+        :return: The value of the '__path' instance property.
+        """
+        return self.__path
+
+    @property
+    def collapsed_path(self) -> str:
+        """
+        Gets the path to the collapsed stacks.
+        :return: The path to the profile followed by the extension of the collapsed stacks.
+        """
+        return "{0}{1}".format(self.__path, Profiler.COLLAPSED_EXTENSION)
+
+    def run(self, function: Callable[[], None]):
+        """
+        Runs a function under the profiler. The calls are recorded even if the function raises an exception.
+        :param function: The function to profile.
+        """
+        profile: cProfile.Profile = cProfile.Profile()
+        profile.enable()
+        try:
+            function()
+        finally:
+            profile.disable()
+            self.__stats = pstats.Stats(profile)
+
+    def save(self):
+        """
+        Writes the profile and the collapsed stacks.
+        """
+        self.__stats.dump_stats(self.__path)
+        lines: list[str] = []
+        stats: dict = self.__stats.stats
+        callees: dict[tuple, list[tuple[tuple, float]]] = {}
+        for (function, (cc, nc, tt, ct, callers)) in stats.items():
+            for (caller, caller_stats) in callers.items():
+                callees.setdefault(caller, []).append((function, caller_stats[3]))
+
+        for (function, (cc, nc, tt, ct, callers)) in stats.items():
+            if len(callers).__eq__(0):
+                self.__collapse(function, ct, [], callees, lines)
+
+        with open(self.collapsed_path, "w") as writer:
+            writer.write("".join(lines))
+
+    def get_top(self, count: int) -> list[str]:
+        """
+        Describes the functions which took the most cumulative time.
+        :param count: The maximum number of functions described.
+        :return: One line per function: its cumulative time, its own time, its number of calls and its location.
+        """
+        stats: dict = self.__stats.stats
+        functions: list[tuple] = sorted(stats.keys(), key=lambda f: stats[f][3], reverse=True)[:count]
+        return ["{0:9.1f} ms {1:9.1f} ms {2:8d} calls  {3}".format(stats[f][3] * 1000, stats[f][2] * 1000, stats[f][1],
+                                                                 pstats.func_std_string(f)) for f in functions]
+
+    def __collapse(self, function: tuple, time: float, stack: list[tuple],
+                   callees: dict[tuple, list[tuple[tuple, float]]], lines: list[str]):
+        """
+        Adds the collapsed stacks of a function and of the functions it called.
+        :param function: The function (file, line, name) as recorded by cProfile.
+        :param time: The time spent in the function under this stack, in seconds.
+        :param stack: The callers of the function, the outermost first.
+        :param callees: The functions called by each function, with the time spent in them under the caller.
+        :param lines: The collapsed stacks.
+        """
+        (cc, nc, tt, ct, callers) = self.__stats.stats[function]
+        if ct.__le__(0):
+            return
+        share: float = time / ct
+        frames: list[tuple] = stack + [function]
+        own: int = round(tt * share * 1000000)
+        if own.__gt__(0):
+            lines.append("{0} {1}\n".format(";".join(Profiler.__get_frame_name(frame) for frame in frames), own))
+        for (callee, callee_time) in callees.get(function, []):
+            # A recursive call is already counted in the time of the outer call.
+            if callee not in frames and (callee_time * share).__ge__(0.000001):
+                self.__collapse(callee, callee_time * share, frames, callees, lines)
+
+    @staticmethod
+    def __get_frame_name(function: tuple) -> str:
+        """
+        Gets the name of a function in the collapsed stacks.
+        :param function: The function (file, line, name) as recorded by cProfile.
+        :return: The file name and the function name, or only the function name for a built-in function.
+        """
+        (filename, line, name) = function
+        if filename.__eq__("~"):
+            return name
+        return "{0}:{1}".format(os.path.basename(filename), name).replace(";", ",")
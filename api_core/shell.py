@@ -0,0 +1,95 @@
+import shlex
+from typing import Callable, Optional
+
+from api_core.mvc.view.view import View
+
+
+class Shell:
+    """
+    Interactive prompt running the commands typed by the user in a single process, so that the commands share the
+    controllers and the parsed documents. The command names and their options are completed with the tabulation key
+    when the 'readline' module is available.
+    """
+
+    EXIT_COMMANDS: list[str] = ["exit", "quit"]
+    """
+    The commands closing the shell.
+    """
+
+    def __init__(self, prompt: str, completions: dict[str, list[str]], run: Callable[[list[str]], None], view: View):
+        """
+        Initialize a new instance of 'Shell' class.
+        :param prompt: The prompt displayed before each command.
+        :param completions: The names of the commands with the options they accept.
+        :param run: The function running a command from its tokens.
+        :param view: The view printing the prompt and the errors of the shell.
+        """
+        self.__view: View = view
+        self.__prompt: str = prompt
+        self.__completions: dict[str, list[str]] = completions
+        self.__run: Callable[[list[str]], None] = run
+        self.__matches: list[str] = []
+
+    def loop(self):
+        """
+        Reads and runs the commands until an exit command or the end of the standard input.
+        """
+        readline = Shell.__import_readline()
+        if readline is not None:
+            readline.set_completer(self.__complete)
+            # The options start with dashes: they must not split the word completed.
+            readline.set_completer_delims(" \t\n")
+            readline.parse_and_bind("tab: complete")
+
+        while True:
+            try:
+                line: str = self.__view.prompt(self.__prompt)
+            except EOFError:
+                return
+            except KeyboardInterrupt:
+                # An interruption discards the line being typed.
+                continue
+
+            try:
+                tokens: list[str] = shlex.split(line, comments=True)
+            except ValueError as e:
+                self.__view.error("The command is malformed: {0}.".format(e))
+                continue
+
+            if len(tokens).__eq__(0):
+                continue
+            elif tokens[0] in Shell.EXIT_COMMANDS:
+                return
+            try:
+                self.__run(tokens)
+            except KeyboardInterrupt:
+                self.__view.end_line()
+
+    def __complete(self, text: str, state: int) -> Optional[str]:
+        """
+        Completes the word typed (readline completer).
+        :param text: The beginning of the word.
+        :param state: The index of the match requested.
+        :return: The match of this index or None if there are no more matches.
+        """
+        if state.__eq__(0):
+            readline = Shell.__import_readline()
+            words: list[str] = readline.get_line_buffer()[:readline.get_begidx()].split()
+            if len(words).__eq__(0):
+                candidates: list[str] = list(self.__completions.keys()) + Shell.EXIT_COMMANDS
+            else:
+                candidates = self.__completions.get(words[0], [])
+            self.__matches = sorted(candidate for candidate in candidates if candidate.startswith(text))
+        return self.__matches[state] if state.__lt__(len(self.__matches)) else None
+
+    @staticmethod
+    def __import_readline():
+        """
+        Imports the 'readline' module, which is not available on every platform.
+        :return: The 'readline' module or None if it is not available.
+        """
+        try:
+            import readline
+            return readline
+        except ImportError:
+            return None
@@ -0,0 +1,59 @@
+import argparse
+import json
+import os
+import sys
+
+from benchmark.baseline_comparator import BaselineComparator
+from benchmark.benchmark_runner import BenchmarkRunner
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m benchmark", description="Benchmarks of the Alfresco helper on synthetic projects.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser: argparse.ArgumentParser = commands.add_parser("run", help="Runs the benchmarks.")
+    compare_parser: argparse.ArgumentParser = commands.add_parser(
+        "compare", help="Runs the benchmarks and compares them with a baseline: the exit code is 1 if a benchmark "
+                        "regressed. The baseline is written if it does not exist.")
+    compare_parser.add_argument("baseline", help="The path to the JSON file of the baseline.")
+    compare_parser.add_argument("--threshold", type=float, default=0.25,
+                                help="The slowdown allowed, as a fraction of the baseline time (0.25 by default).")
+    compare_parser.add_argument("--counts-only", action="store_true",
+                                help="Compares only the parse and write counts, which do not depend on the machine.")
+    compare_parser.add_argument("--update", action="store_true", help="Writes the results as the new baseline.")
+    for subparser in [run_parser, compare_parser]:
+        subparser.add_argument("--tier", action="append", choices=list(BenchmarkRunner.TIERS.keys()),
+                               help="A size tier to run (every tier by default, every tier of the baseline when "
+                                    "comparing).")
+        subparser.add_argument("--repeat", type=int, default=3, help="The number of timed runs of each scenario.")
+    run_parser.add_argument("--output", help="The path to the JSON file the results are written to.")
+    arguments = parser.parse_args()
+
+    runner: BenchmarkRunner = BenchmarkRunner(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                              max(arguments.repeat, 1))
+    baseline: dict | None = None
+    tiers: list[str] = arguments.tier or list(BenchmarkRunner.TIERS.keys())
+    if arguments.command.__eq__("compare") and not arguments.update and os.path.isfile(arguments.baseline):
+        with open(arguments.baseline, "r") as reader:
+            baseline = json.load(reader)
+        if arguments.tier is None:
+            tiers = [tier for tier in baseline["tiers"].keys() if tier in BenchmarkRunner.TIERS.keys()]
+
+    results: dict = runner.run(tiers)
+    print(BenchmarkRunner.format(results))
+
+    output: str | None = arguments.output if arguments.command.__eq__("run") \
+        else (arguments.baseline if baseline is None else None)
+    if output is not None:
+        with open(output, "w") as writer:
+            json.dump(results, writer, indent=2)
+        print("Results written to '{0}'.".format(output))
+
+    if baseline is not None:
+        (report, regressions) = BaselineComparator(arguments.threshold, not arguments.counts_only) \
+            .compare(baseline, results)
+        print("\n".join(report))
+        if len(regressions).__gt__(0):
+            print("{0} regression(s):\n{1}".format(len(regressions), "\n".join(regressions)))
+            sys.exit(1)
+        print("No regression.")
+    sys.exit(0)
@@ -0,0 +1,77 @@
+from typing import Optional
+
+
+class BaselineComparator:
+    """
+    Comparator of benchmark results (see 'BenchmarkRunner.run') with stored baseline results. A scenario regresses
+    when its time exceeds the time of the baseline by more than the threshold, or when it parses or writes more files
+    than the baseline: these counts do not depend on the machine, they are compared without threshold.
+    """
+
+    MINIMUM_TIME_DELTA: float = 0.01
+    """
+    The slowdown (in seconds) below which a scenario does not regress, whatever the threshold: the time of the
+    shortest scenarios varies more than the threshold from one run to the other.
+    """
+
+    def __init__(self, threshold: float, compare_times: bool = True):
+        """
+        Initialize a new instance of 'BaselineComparator' class.
+        :param threshold: The slowdown allowed, as a fraction of the baseline time (0.25 allows 25% slower runs).
+        :param compare_times: Indicates whether the times are compared (the counts are always compared).
+        """
+        self.__threshold: float = threshold
+        self.__compare_times: bool = compare_times
+
+    def compare(self, baseline: dict, results: dict) -> tuple[list[str], list[str]]:
+        """
+        Compares benchmark results with the baseline.
+        :param baseline: The baseline results.
+        :param results: The results to compare.
+        :return: The report (one line per scenario) and the regressions (one line per regression).
+        """
+        report: list[str] = []
+        regressions: list[str] = []
+        for (tier, tier_results) in results["tiers"].items():
+            tier_baseline: Optional[dict] = baseline["tiers"].get(tier)
+            if tier_baseline is None:
+                report.append("{0}: not in the baseline.".format(tier))
+                continue
+            elif tier_baseline["parameters"].__ne__(tier_results["parameters"]):
+                regressions.append("{0}: the parameters of the tier changed, the baseline must be updated."
+                                   .format(tier))
+                continue
+
+            for (scenario, result) in tier_results["scenarios"].items():
+                reference: Optional[dict] = tier_baseline["scenarios"].get(scenario)
+                if reference is None:
+                    report.append("{0} {1}: not in the baseline.".format(tier, scenario))
+                    continue
+
+                ratio: float = result["seconds"] / reference["seconds"] if reference["seconds"].__gt__(0) else 1.0
+                counts: list[str] = [BaselineComparator.__format_count(item[count])
+                                     for count in ["parses", "writes"] for item in [result, reference]]
+                report.append("{0} {1}: {2:.1f} ms (baseline {3:.1f} ms, {4:+.1f}%), parses {5} (baseline {6}), "
+                              "writes {7} (baseline {8})".format(tier, scenario, result["seconds"] * 1000,
+                                                                 reference["seconds"] * 1000, (ratio - 1) * 100,
+                                                                 *counts))
+                if self.__compare_times and ratio.__gt__(1 + self.__threshold) \
+                        and (result["seconds"] - reference["seconds"]).__gt__(BaselineComparator.MINIMUM_TIME_DELTA):
+                    regressions.append("{0} {1}: {2:.1f} ms instead of {3:.1f} ms ({4:+.1f}%, threshold {5:+.1f}%)."
+                                       .format(tier, scenario, result["seconds"] * 1000, reference["seconds"] * 1000,
+                                               (ratio - 1) * 100, self.__threshold * 100))
+                for count in ["parses", "writes"]:
+                    if result[count] is not None and reference[count] is not None \
+                            and result[count].__gt__(reference[count]):
+                        regressions.append("{0} {1}: {2} {3} instead of {4}."
+                                           .format(tier, scenario, result[count], count, reference[count]))
+        return report, regressions
+
+    @staticmethod
+    def __format_count(count: Optional[int]) -> str:
+        """
+        Formats a count of the results.
+        :param count: The count or None if it is not measured.
+        :return: The count or '-'.
+        """
+        return "-" if count is None else str(count)
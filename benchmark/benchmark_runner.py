@@ -0,0 +1,207 @@
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Callable, Optional
+
+from api.alfresco_helper_api import AlfrescoHelperApi
+from api_core.helper.stats_helper import StatsHelper
+from api_core.mvc.service.file.xml_file_service import XmlFileService
+from benchmark.project_generator import ProjectGenerator
+
+
+class BenchmarkRunner:
+    """
+    Runner of the benchmarks: each scenario runs a command of the helper, in this process, on a synthetic project of
+    each size tier. A scenario is run several times, each time on a new project, and its best time is kept; its peak
+    memory is measured by another run, traced by 'tracemalloc' (which slows the run down). The scenarios are
+    'load_project', 'share_config' (the generation of the share config file during 'load_project'), 'new_property' and
+    'extend_aspect'.
+    """
+
+    TIERS: dict[str, dict[str, int]] = {
+        "small": {"models": 2, "aspects": 20, "depth": 4, "fan": 2, "properties": 5},
+        "medium": {"models": 3, "aspects": 25, "depth": 6, "fan": 3, "properties": 6},
+        "large": {"models": 4, "aspects": 40, "depth": 10, "fan": 4, "properties": 6},
+    }
+    """
+    The size tiers: the parameters of the project generator (see 'ProjectGenerator.generate').
+    """
+
+    def __init__(self, api_folder: str, repeat: int = 3):
+        """
+        Initialize a new instance of 'BenchmarkRunner' class.
+        :param api_folder: The path to the API folder (the folder of the 'main.py' script).
+        :param repeat: The number of timed runs of each scenario.
+        """
+        self.__api_folder: str = api_folder
+        self.__repeat: int = repeat
+        self.__generator: ProjectGenerator = ProjectGenerator("{0}{1}api{1}resources{1}template"
+                                                              .format(api_folder, os.sep))
+
+    def run(self, tiers: list[str]) -> dict:
+        """
+        Runs every scenario on each size tier.
+        :param tiers: The names of the size tiers.
+        :return: The results: the parameters of the tiers and, for each tier and scenario, the best time (in seconds),
+        the throughput, the peak memory (in bytes) and the number of XML files parsed and of files written.
+        """
+        results: dict = {"python": sys.version.split()[0], "repeat": self.__repeat, "tiers": {}}
+        # The modules are imported on the first command: it is not measured.
+        self.__in_project({"models": 1, "aspects": 2, "depth": 1, "fan": 1, "properties": 1}, [["load_project"]],
+                          lambda path: None)
+        for tier in tiers:
+            parameters: dict[str, int] = BenchmarkRunner.TIERS[tier]
+            aspects: int = parameters["models"] * parameters["aspects"]
+            scenarios: dict[str, dict] = {}
+
+            load: dict = self.__measure(parameters, [], ["load_project", "--force"])
+            scenarios["load_project"] = BenchmarkRunner.__get_result(load, aspects, "aspects")
+            scenarios["share_config"] = BenchmarkRunner.__get_result(
+                {"seconds": load["share_config_seconds"], "peak_memory": None, "parses": None, "writes": None},
+                aspects * parameters["properties"], "properties")
+
+            # The commands modifying a content model run on a loaded project: they generate its files again.
+            last: str = "aspect{0}".format(parameters["aspects"] - 1)
+            prepare: list[list[str]] = [["load_project"]]
+            new_property: dict = self.__measure(parameters, prepare, [
+                "new_property", "bm0:model0", last, "--name", "benchmarkProperty", "--title", "Benchmark property",
+                "--description", "Property added by the benchmark", "--type", "text", "--mandatory", "n"])
+            scenarios["new_property"] = BenchmarkRunner.__get_result(new_property, 1, "commands")
+            extend_aspect: dict = self.__measure(parameters, prepare, [
+                "extend_aspect", "bm0:model0", last, "aspect{0}".format(parameters["fan"])])
+            scenarios["extend_aspect"] = BenchmarkRunner.__get_result(extend_aspect, 1, "commands")
+
+            results["tiers"][tier] = {"parameters": dict(parameters), "scenarios": scenarios}
+        return results
+
+    @staticmethod
+    def format(results: dict) -> str:
+        """
+        Formats the results as a table.
+        :param results: The results of the benchmarks.
+        :return: One line per tier and scenario.
+        """
+        lines: list[str] = ["{0:<8} {1:<14} {2:>10} {3:>24} {4:>12} {5:>7} {6:>7}".format(
+            "tier", "scenario", "time (ms)", "throughput", "peak (MiB)", "parses", "writes")]
+        for (tier, tier_results) in results["tiers"].items():
+            for (scenario, result) in tier_results["scenarios"].items():
+                memory: str = "-" if result["peak_memory"] is None \
+                    else "{0:.1f}".format(result["peak_memory"] / 1048576)
+                lines.append("{0:<8} {1:<14} {2:>10.1f} {3:>24} {4:>12} {5:>7} {6:>7}".format(
+                    tier, scenario, result["seconds"] * 1000,
+                    "{0:.1f} {1}/s".format(result["throughput"], result["unit"]), memory,
+                    "-" if result["parses"] is None else result["parses"],
+                    "-" if result["writes"] is None else result["writes"]))
+        return "\n".join(lines)
+
+    @staticmethod
+    def __get_result(measure: dict, items: int, unit: str) -> dict:
+        """
+        Gets the result of a scenario.
+        :param measure: The measure of the scenario (see 'BenchmarkRunner.__measure'), whose peak memory and counts
+        are None if they are not measured.
+        :param items: The number of items processed by the scenario.
+        :param unit: The name of the items.
+        :return: The result.
+        """
+        seconds: float = measure["seconds"]
+        return {"seconds": seconds, "throughput": items / seconds if seconds.__gt__(0) else 0.0, "unit": unit,
+                "peak_memory": measure["peak_memory"], "parses": measure["parses"], "writes": measure["writes"]}
+
+    def __measure(self, parameters: dict[str, int], prepare: list[list[str]], command: list[str]) -> dict:
+        """
+        Measures a command.
+        :param parameters: The parameters of the generated project.
+        :param prepare: The commands run (and not measured) before the measured command.
+        :param command: The tokens of the measured command.
+        :return: The measure of the fastest run (see 'BenchmarkRunner.__time') with the peak memory of the command (in
+        bytes).
+        """
+        best: Optional[dict] = None
+        for index in range(self.__repeat):
+            measure: dict = self.__in_project(parameters, prepare, lambda path: self.__time(path, command))
+            if best is None or measure["seconds"].__lt__(best["seconds"]):
+                best = measure
+        best["peak_memory"] = self.__in_project(parameters, prepare, lambda path: self.__trace(path, command))
+        return best
+
+    def __in_project(self, parameters: dict[str, int], prepare: list[list[str]], function: Callable[[str], object]):
+        """
+        Calls a function on a new project, deleted afterwards.
+        :param parameters: The parameters of the generated project.
+        :param prepare: The commands run on the project before the function is called.
+        :param function: The function, called with the path to the project.
+        :return: The result of the function.
+        """
+        path: str = tempfile.mkdtemp(prefix="alfresco_helper_benchmark_")
+        try:
+            self.__generator.generate(path, **parameters)
+            for tokens in prepare:
+                self.__execute(path, tokens)
+            return function(path)
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def __time(self, path: str, command: list[str]) -> dict:
+        """
+        Times a command.
+        :param path: The path to the project.
+        :param command: The tokens of the command.
+        :return: The time of the command and the time spent in the generation of the share config file (in seconds),
+        the number of XML files parsed and the number of files written. The counts do not depend on the machine.
+        """
+        start: float = time.perf_counter()
+        self.__execute(path, command)
+        seconds: float = time.perf_counter() - start
+        times: dict[str, float] = StatsHelper.get_times()
+        counters: dict[str, dict[str, int]] = StatsHelper.get_counters()
+        return {"seconds": seconds,
+                "share_config_seconds": times.get("share config aspects", 0.0) + times.get("share config properties",
+                                                                                           0.0),
+                "parses": sum(counters.get("XML parses", {}).values()),
+                "writes": sum(counters.get("file writes", {}).values())}
+
+    def __trace(self, path: str, command: list[str]) -> int:
+        """
+        Measures the peak memory of a command.
+        :param path: The path to the project.
+        :param command: The tokens of the command.
+        :return: The peak of the memory allocated during the command (in bytes).
+        """
+        tracemalloc.start()
+        try:
+            self.__execute(path, command)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def __execute(self, path: str, command: list[str]):
+        """
+        Executes a command in a project folder, with the statistics enabled. The output is discarded and the standard
+        input is empty: the command cannot ask questions. The parsed documents kept in memory by the previous commands
+        are forgotten, as if each command ran in its own process.
+        :param path: The path to the project.
+        :param command: The tokens of the command.
+        """
+        (cwd, stdin) = (os.getcwd(), sys.stdin)
+        output: io.StringIO = io.StringIO()
+        XmlFileService.clear_cache()
+        os.chdir(path)
+        sys.stdin = io.StringIO("")
+        try:
+            with redirect_stdout(output):
+                AlfrescoHelperApi(self.__api_folder).interpret(["--json", "--stats"] + command)
+        finally:
+            sys.stdin = stdin
+            os.chdir(cwd)
+
+        for line in output.getvalue().splitlines():
+            message: dict = json.loads(line)
+            if message["type"].__eq__("error"):
+                raise RuntimeError("The command '{0}' failed: {1}".format(" ".join(command), message["message"]))
@@ -0,0 +1,124 @@
+import os
+
+from api.mvc.model.data.project_model import ProjectModel
+from api_core.helper.file_folder_helper import FileFolderHelper
+
+
+class ProjectGenerator:
+    """
+    Generator of synthetic AIO projects: the folders of an AIO project (at the paths given by 'ProjectModel'), its
+    'pom.xml' file and content model files with as many aspects and properties as requested. The aspects of a content
+    model form parent chains and, apart from the first ones, they all declare the same mandatory aspects.
+    """
+
+    GROUP_ID: str = "org.benchmark"
+    """
+    The group id of the generated projects.
+    """
+
+    ARTIFACT_ID: str = "bench"
+    """
+    The artifact id of the generated projects.
+    """
+
+    SDK: str = "4.5.0"
+    """
+    The Alfresco SDK version of the generated projects.
+    """
+
+    PROPERTY_TYPES: list[str] = ["text", "int", "long", "float", "double", "date", "datetime", "boolean"]
+    """
+    The types given in turn to the generated properties.
+    """
+
+    def __init__(self, template_folder: str):
+        """
+        Initialize a new instance of 'ProjectGenerator' class.
+        :param template_folder: The path to the template folder of the API (content model files are generated from
+        its template).
+        """
+        self.__template_folder: str = template_folder
+
+    def generate(self, path: str, models: int, aspects: int, depth: int, fan: int, properties: int) -> ProjectModel:
+        """
+        Generates a project.
+        :param path: The path to the project folder, created if it does not exist.
+        :param models: The number of content models.
+        :param aspects: The number of aspects of each content model.
+        :param depth: The length of the parent chains: each aspect extends the previous one, except the first aspect
+        of each chain.
+        :param fan: The number of mandatory aspects of each aspect. The first aspects of each content model are the
+        mandatory aspects of the others.
+        :param properties: The number of properties of each aspect.
+        :return: The data model of the project (without its content models).
+        """
+        project: ProjectModel = ProjectModel(ProjectGenerator.SDK, ProjectGenerator.GROUP_ID,
+                                             ProjectGenerator.ARTIFACT_ID, os.path.abspath(path))
+        for folder in [project.content_model_folder, project.content_model_message_absolute_folder_path,
+                       os.path.dirname(project.bootstrap_filepath), os.path.dirname(project.share_config_filepath),
+                       project.share_messages_folder]:
+            os.makedirs(folder, exist_ok=True)
+
+        FileFolderHelper.write_file(project.pom_filepath, self.__get_pom())
+        for index in range(models):
+            FileFolderHelper.write_file("{1}{0}model{2}-model.xml".format(os.sep, project.content_model_folder, index),
+                                        self.__get_content_model(index, aspects, depth, fan, properties))
+        return project
+
+    @staticmethod
+    def __get_pom() -> str:
+        """
+        Gets the content of the 'pom.xml' file.
+        :return: The content of the file.
+        """
+        return "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n" \
+               "<project xmlns=\"http://maven.apache.org/POM/4.0.0\">\n" \
+               "    <modelVersion>4.0.0</modelVersion>\n" \
+               "    <groupId>{0}</groupId>\n" \
+               "    <artifactId>{1}</artifactId>\n" \
+               "    <properties>\n" \
+               "        <alfresco.sdk.version>{2}</alfresco.sdk.version>\n" \
+               "    </properties>\n" \
+               "</project>\n".format(ProjectGenerator.GROUP_ID, ProjectGenerator.ARTIFACT_ID, ProjectGenerator.SDK)
+
+    def __get_content_model(self, index: int, aspects: int, depth: int, fan: int, properties: int) -> str:
+        """
+        Gets the content of a content model file, from the template of the API.
+        :param index: The index of the content model, which gives its prefix and its name.
+        :param aspects: The number of aspects.
+        :param depth: The length of the parent chains.
+        :param fan: The number of mandatory aspects of each aspect.
+        :param properties: The number of properties of each aspect.
+        :return: The content of the file.
+        """
+        (prefix, name) = ("bm{0}".format(index), "model{0}".format(index))
+        template: str = FileFolderHelper.read_file("{0}{1}content_model_template".format(self.__template_folder,
+                                                                                         os.sep))
+        content: str = template.replace("{prefix}", prefix).replace("{name}", name) \
+            .replace("{upper_case_name}", name.upper())
+
+        lines: list[str] = ["    <aspects>"]
+        for number in range(aspects):
+            lines.append("        <aspect name=\"{0}:aspect{1}\">".format(prefix, number))
+            lines.append("            <title>Aspect {0}</title>".format(number))
+            lines.append("            <description>Aspect {0} of model {1}.</description>".format(number, name))
+            # The mandatory aspects have neither parent nor mandatory aspects.
+            if number.__ge__(fan) and (number - fan) % depth:
+                lines.append("            <parent>{0}:aspect{1}</parent>".format(prefix, number - 1))
+            lines.append("            <properties>")
+            for rank in range(properties):
+                lines.append("                <property name=\"{0}:a{1}p{2}\">".format(prefix, number, rank))
+                lines.append("                    <title>Property {0} of aspect {1}</title>".format(rank, number))
+                lines.append("                    <type>d:{0}</type>".format(
+                    ProjectGenerator.PROPERTY_TYPES[rank % len(ProjectGenerator.PROPERTY_TYPES)]))
+                lines.append("                    <mandatory>{0}</mandatory>".format("true" if rank % 2 else "false"))
+                lines.append("                </property>")
+            lines.append("            </properties>")
+            if number.__ge__(fan) and fan.__gt__(0):
+                lines.append("            <mandatory-aspects>")
+                for mandatory in range(fan):
+                    lines.append("                <aspect>{0}:aspect{1}</aspect>".format(prefix, mandatory))
+                lines.append("            </mandatory-aspects>")
+            lines.append("        </aspect>")
+        lines.append("    </aspects>")
+        return content.replace("</model>", "{0}\n</model>\n".format("\n".join(lines)))
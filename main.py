@@ -1,6 +1,18 @@
+import os
 import sys
 
-from api.alfresco_helper_api import AlfrescoHelperApi
+from api_core.helper.constant_helper import ConstantHelper
 from api_core.helper.file_folder_helper import FileFolderHelper
 
-AlfrescoHelperApi(FileFolderHelper.extract_folder_from_filepath(__file__)).interpret(sys.argv[1:])
+# Worker processes re-import this module: the command must only run in the main process.
+if __name__ == "__main__":
+    # The command is forwarded to the daemon if one is running, which spares the initialization of the API.
+    socket_path = os.environ.get(ConstantHelper.DAEMON_SOCKET_VARIABLE)
+    if socket_path and sys.argv[1:2] != ["serve"]:
+        from api_core.daemon_client import DaemonClient
+        status = DaemonClient(socket_path).forward(sys.argv[1:])
+        if status is not None:
+            sys.exit(status)
+
+    from api.alfresco_helper_api import AlfrescoHelperApi
+    AlfrescoHelperApi(FileFolderHelper.extract_folder_from_filepath(__file__)).interpret(sys.argv[1:])
@@ -0,0 +1,101 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from api_core.batch_reader import BatchReader
+from api_core.exception.api_exception import ApiException
+from api_core.mvc.controller.controller import Controller
+
+
+class ReadEntriesTest(unittest.TestCase):
+    """
+    Checks the reading of the entries given to a creation command as options or as a JSON document.
+    """
+
+    FIELDS: list[str] = ["name", "title", "mandatory"]
+    """
+    The fields of the entries read by the tests.
+    """
+
+    def setUp(self):
+        self.__stdin = sys.stdin
+
+    def tearDown(self):
+        sys.stdin = self.__stdin
+
+    def test_no_option_asks_the_entries(self):
+        self.assertIsNone(Controller._read_entries({}, ReadEntriesTest.FIELDS))
+
+    def test_options(self):
+        entries = Controller._read_entries({"--name": "n", "--mandatory": True}, ReadEntriesTest.FIELDS)
+        self.assertEqual([{"name": "n", "title": "", "mandatory": True}], entries)
+
+    def test_json_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            filepath: str = os.path.join(folder, "entries.json")
+            with open(filepath, "w") as writer:
+                json.dump([{"name": "a"}, {"name": "b", "title": None}], writer)
+            entries = Controller._read_entries({"--json": filepath}, ReadEntriesTest.FIELDS)
+        self.assertEqual([{"name": "a", "title": "", "mandatory": ""}, {"name": "b", "title": "", "mandatory": ""}],
+                         entries)
+
+    def test_json_standard_input(self):
+        sys.stdin = io.StringIO('{"name": "a", "mandatory": false}')
+        entries = Controller._read_entries({"--json": "-"}, ReadEntriesTest.FIELDS)
+        self.assertEqual([{"name": "a", "title": "", "mandatory": False}], entries)
+
+    def test_json_in_batch(self):
+        reader: BatchReader = BatchReader(io.StringIO('[{"name": "a"},\n {"name": "b"}]\nEOF\nnext_command\n'))
+        sys.stdin = reader
+        entries = Controller._read_entries({"--json": "-"}, ReadEntriesTest.FIELDS)
+        self.assertEqual(["a", "b"], [entry["name"] for entry in entries])
+        # The lines following the document are left to the batch.
+        self.assertEqual("next_command\n", reader.readline())
+
+    def test_json_in_batch_without_end(self):
+        sys.stdin = BatchReader(io.StringIO('{"name": "a"}\n'))
+        with self.assertRaises(EOFError):
+            Controller._read_entries({"--json": "-"}, ReadEntriesTest.FIELDS)
+
+    def test_invalid_json(self):
+        sys.stdin = io.StringIO("{")
+        with self.assertRaises(ApiException):
+            Controller._read_entries({"--json": "-"}, ReadEntriesTest.FIELDS)
+
+    def test_undecodable_json_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            filepath: str = os.path.join(folder, "entries.json")
+            with open(filepath, "wb") as writer:
+                writer.write(b"\xff\xfe{")
+            with self.assertRaises(ApiException):
+                Controller._read_entries({"--json": filepath}, ReadEntriesTest.FIELDS)
+
+    def test_missing_json_file(self):
+        with self.assertRaises(ApiException):
+            Controller._read_entries({"--json": "/nonexistent/entries.json"}, ReadEntriesTest.FIELDS)
+
+    def test_json_combined_with_options(self):
+        with self.assertRaises(ApiException):
+            Controller._read_entries({"--json": "-", "--name": "a"}, ReadEntriesTest.FIELDS)
+
+    def test_unknown_field(self):
+        sys.stdin = io.StringIO('{"other": "a"}')
+        with self.assertRaises(ApiException):
+            Controller._read_entries({"--json": "-"}, ReadEntriesTest.FIELDS)
+
+    def test_not_an_object(self):
+        sys.stdin = io.StringIO('["a"]')
+        with self.assertRaises(ApiException):
+            Controller._read_entries({"--json": "-"}, ReadEntriesTest.FIELDS)
+
+    def test_invalid_value(self):
+        sys.stdin = io.StringIO('{"name": 1}')
+        with self.assertRaises(ApiException):
+            Controller._read_entries({"--json": "-"}, ReadEntriesTest.FIELDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+
+from api.mvc.model.data.aspect_model import AspectModel
+from api.mvc.model.data.content_model import ContentModel
+from api.mvc.model.data.data_graph import DataGraph
+from api.mvc.model.data.project_model import ProjectModel
+from api.mvc.model.data.type_model import TypeModel
+
+
+class DataGraphTest(unittest.TestCase):
+    """
+    Checks the links and the violations found by the graph of the data of a content model.
+    """
+
+    def setUp(self):
+        self.__content_model: ContentModel = ContentModel(ProjectModel("4.0.0", "group", "demo", "/project"), "ns",
+                                                          "model", "/project/model.xml")
+        self.__aspects: dict[str, AspectModel] = {}
+        for name in ["a", "b", "c", "d"]:
+            self.__aspects[name] = AspectModel(self.__content_model, name, None, None)
+            self.__content_model.add_aspect(self.__aspects[name])
+        self.__type: TypeModel = TypeModel(self.__content_model, "t", None, None)
+        self.__content_model.add_type(self.__type)
+
+    def test_valid_links(self):
+        self.__aspects["b"].parent = self.__aspects["a"]
+        self.__aspects["c"].add_mandatory_aspect(self.__aspects["b"])
+        self.__type.add_mandatory_aspect(self.__aspects["c"])
+        graph: DataGraph = DataGraph(self.__content_model)
+
+        self.assertEqual([], graph.violations)
+        self.assertTrue(graph.is_ancestor(self.__aspects["b"], self.__aspects["a"]))
+        self.assertFalse(graph.is_ancestor(self.__aspects["a"], self.__aspects["b"]))
+        # The aspects brought by a mandatory aspect include its ancestors and its own mandatory aspects.
+        self.assertTrue(graph.is_mandatory(self.__type, self.__aspects["a"]))
+        self.assertTrue(graph.is_mandatory(self.__type, self.__aspects["c"]))
+        self.assertFalse(graph.is_mandatory(self.__type, self.__aspects["d"]))
+
+    def test_inheritance_cycle(self):
+        self.__aspects["a"].parent = self.__aspects["c"]
+        self.__aspects["b"].parent = self.__aspects["a"]
+        self.__aspects["c"].parent = self.__aspects["b"]
+        self.__aspects["d"].parent = self.__aspects["c"]
+        graph: DataGraph = DataGraph(self.__content_model)
+
+        self.assertEqual(1, len(graph.violations))
+        self.assertIn("appears twice in its ancestors", graph.violations[0])
+        # The data inheriting from the cycle are concerned too, not the others.
+        self.assertEqual(graph.violations, graph.get_violations(self.__aspects["d"]))
+        self.assertEqual([], graph.get_violations(self.__type))
+        self.assertFalse(graph.is_ancestor(self.__aspects["d"], self.__aspects["a"]))
+
+    def test_mandatory_aspects_cycle(self):
+        self.__aspects["a"].add_mandatory_aspect(self.__aspects["b"])
+        self.__aspects["b"].add_mandatory_aspect(self.__aspects["a"])
+        graph: DataGraph = DataGraph(self.__content_model)
+
+        self.assertEqual(1, len(graph.violations))
+        self.assertIn("a -> b -> a", graph.violations[0])
+        self.assertEqual(graph.violations, graph.get_violations(self.__aspects["b"]))
+
+    def test_mandatory_aspect_in_the_ancestors(self):
+        self.__aspects["b"].parent = self.__aspects["a"]
+        self.__aspects["c"].parent = self.__aspects["b"]
+        self.__aspects["c"].add_mandatory_aspect(self.__aspects["a"])
+        graph: DataGraph = DataGraph(self.__content_model)
+
+        self.assertEqual(["The aspect 'a' is declared in the ancestors of the aspect 'c'. It cannot therefore be one "
+                          "of its mandatory aspects (direct or by inheritance)."], graph.violations)
+        self.assertEqual(graph.violations, graph.get_violations(self.__aspects["c"]))
+
+    def test_mandatory_aspect_brought_twice(self):
+        self.__aspects["b"].add_mandatory_aspect(self.__aspects["a"])
+        self.__type.add_mandatory_aspect(self.__aspects["a"])
+        self.__type.add_mandatory_aspect(self.__aspects["b"])
+        graph: DataGraph = DataGraph(self.__content_model)
+
+        self.assertEqual(["Aspect 'a' appears twice in the list of mandatory aspects of type 't' (by inheritance or "
+                          "directly)."], graph.violations)
+        self.assertEqual([], graph.get_violations(self.__aspects["b"]))
+
+    def test_every_violation_is_reported(self):
+        self.__aspects["a"].parent = self.__aspects["b"]
+        self.__aspects["b"].parent = self.__aspects["a"]
+        self.__aspects["c"].add_mandatory_aspect(self.__aspects["d"])
+        self.__type.add_mandatory_aspect(self.__aspects["c"])
+        self.__type.add_mandatory_aspect(self.__aspects["d"])
+
+        self.assertEqual(2, len(DataGraph(self.__content_model).violations))
+
+    def test_added_links_match_a_graph_built_again(self):
+        graph: DataGraph = self.__content_model.graph
+        graph.set_parent(self.__aspects["b"], self.__aspects["a"])
+        graph.add_mandatory(self.__aspects["c"], self.__aspects["b"])
+        self.assertTrue(graph.is_mandatory(self.__aspects["c"], self.__aspects["a"]))
+
+        # A link bringing a violation is recorded as if the graph was built again.
+        graph.add_mandatory(self.__type, self.__aspects["a"])
+        graph.add_mandatory(self.__type, self.__aspects["c"])
+        self.assertEqual(DataGraph(self.__content_model).violations, graph.violations)
+        self.assertEqual(1, len(graph.get_violations(self.__type)))
+
+    def test_added_link_closing_a_cycle(self):
+        graph: DataGraph = self.__content_model.graph
+        graph.add_mandatory(self.__aspects["a"], self.__aspects["b"])
+        graph.add_mandatory(self.__aspects["b"], self.__aspects["c"])
+        graph.add_mandatory(self.__aspects["c"], self.__aspects["a"])
+
+        self.assertEqual(DataGraph(self.__content_model).violations, graph.violations)
+        self.assertFalse(graph.is_mandatory(self.__aspects["a"], self.__aspects["c"]))
+
+    def test_reparented_data_updates_its_descendants(self):
+        graph: DataGraph = self.__content_model.graph
+        graph.set_parent(self.__aspects["c"], self.__aspects["b"])
+        graph.set_parent(self.__aspects["b"], self.__aspects["a"])
+        self.assertTrue(graph.is_ancestor(self.__aspects["c"], self.__aspects["a"]))
+
+        graph.set_parent(self.__aspects["b"], self.__aspects["d"])
+        self.assertFalse(graph.is_ancestor(self.__aspects["c"], self.__aspects["a"]))
+        self.assertTrue(graph.is_ancestor(self.__aspects["c"], self.__aspects["d"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from api_core.helper.constant_helper import ConstantHelper
+
+
+class StartupTest(unittest.TestCase):
+    """
+    Checks that a command only imports the modules it needs, using the import report of 'python -X importtime'.
+    """
+
+    MAIN_FILEPATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+    """
+    The path to the script run by the tests.
+    """
+
+    HEAVY_MODULES: list[str] = ["sqlite3", "concurrent.futures", "multiprocessing", "subprocess", "hashlib",
+                                "api_core.daemon", "api_core.daemon_client", "api_core.shell"]
+    """
+    The modules imported by the few commands using them.
+    """
+
+    def test_help_does_not_build_controllers(self):
+        """
+        A command rejected before its dispatch imports neither the controllers nor the heavy modules.
+        """
+        modules: set[str] = self.__get_imported_modules(["--help"])
+        self.assertIn("api.alfresco_helper_api", modules)
+        self.assertEqual([], sorted(module for module in modules if module.startswith("api.mvc.")))
+        self.assertEqual([], sorted(module for module in modules if module in StartupTest.HEAVY_MODULES))
+
+    def test_manual_does_not_import_heavy_modules(self):
+        """
+        A 'man_*' command builds the controllers but imports none of the heavy modules.
+        """
+        modules: set[str] = self.__get_imported_modules(["man_project"])
+        self.assertEqual([], sorted(module for module in modules if module in StartupTest.HEAVY_MODULES))
+
+    @staticmethod
+    def __get_imported_modules(arguments: list[str]) -> set[str]:
+        """
+        Runs the script in a new interpreter and reads the modules it imported.
+        :param arguments: The arguments of the script.
+        :return: The names of the imported modules.
+        """
+        environment: dict[str, str] = dict(os.environ)
+        # The command must run in the new interpreter, not be forwarded to a daemon.
+        environment.pop(ConstantHelper.DAEMON_SOCKET_VARIABLE, None)
+        with tempfile.TemporaryDirectory() as folder:
+            process: subprocess.CompletedProcess = subprocess.run(
+                [sys.executable, "-X", "importtime", StartupTest.MAIN_FILEPATH] + arguments, cwd=folder,
+                env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+        # Each line of the report ends with the name of a module: 'import time: self [us] | cumulative | name'.
+        return {line.rsplit("|", 1)[1].strip() for line in process.stderr.splitlines()
+                if line.startswith("import time:") and "|" in line}
+
+
+if __name__ == "__main__":
+    unittest.main()
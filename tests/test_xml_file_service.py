@@ -0,0 +1,179 @@
+import os
+import tempfile
+import unittest
+from xml.etree.ElementTree import Element
+
+from api_core.exception.api_exception import ApiException
+from api_core.helper.stats_helper import StatsHelper
+from api_core.mvc.service.file.xml_file_service import XmlFileService
+
+
+class DocumentService(XmlFileService):
+    """
+    XML file service reading and writing documents without namespace.
+    """
+
+    def __init__(self):
+        super().__init__(False, None)
+
+    def read(self, path: str) -> Element:
+        return self._get_root(path)
+
+    def write(self, root: Element, path: str):
+        self._write(root, path)
+
+
+class XmlFileServiceTest(unittest.TestCase):
+    """
+    Checks the document sessions, the cache of the parsed documents and the writing of the XML file services.
+    """
+
+    def setUp(self):
+        self.__folder: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.__path: str = os.path.join(self.__folder.name, "document.xml")
+        with open(self.__path, "w") as writer:
+            writer.write("<root><item>a</item></root>")
+        self.__service: DocumentService = DocumentService()
+        StatsHelper.enable()
+
+    def tearDown(self):
+        XmlFileService.close_sessions()
+        XmlFileService.clear_cache()
+        StatsHelper.enable(False)
+        self.__folder.cleanup()
+
+    def test_nested_session_is_written_by_the_outermost_commit(self):
+        XmlFileService.open_session()
+        XmlFileService.open_session()
+        self.__set_item("b")
+        XmlFileService.commit_session()
+        self.assertTrue(XmlFileService.in_session())
+        self.assertEqual("a", self.__read_file_item())
+
+        XmlFileService.commit_session()
+        self.assertFalse(XmlFileService.in_session())
+        self.assertEqual("b", self.__read_file_item())
+
+    def test_inner_rollback_keeps_the_documents_until_the_outermost_one(self):
+        XmlFileService.open_session()
+        XmlFileService.open_session()
+        self.__set_item("b")
+        XmlFileService.rollback_session()
+        # The caller of the inner session decides: the document is still the one of the session.
+        self.assertTrue(XmlFileService.in_session())
+        self.assertEqual("b", self.__service.read(self.__path).find("item").text)
+
+        XmlFileService.rollback_session()
+        self.assertFalse(XmlFileService.in_session())
+        self.assertEqual("a", self.__read_file_item())
+        # The node modified in place is not returned anymore.
+        self.assertEqual("a", self.__service.read(self.__path).find("item").text)
+
+    def test_session_block_is_rolled_back_on_error(self):
+        with self.assertRaises(ValueError):
+            with XmlFileService.session():
+                self.__set_item("b")
+                raise ValueError("failure")
+        self.assertFalse(XmlFileService.in_session())
+        self.assertEqual("a", self.__service.read(self.__path).find("item").text)
+
+    def test_closed_sessions_are_not_written(self):
+        XmlFileService.open_session()
+        XmlFileService.open_session()
+        self.__set_item("b")
+        XmlFileService.close_sessions()
+        self.assertFalse(XmlFileService.in_session())
+        self.assertEqual("a", self.__read_file_item())
+
+    def test_session_must_be_open(self):
+        with self.assertRaises(ApiException):
+            XmlFileService.commit_session()
+        with self.assertRaises(ApiException):
+            XmlFileService.rollback_session()
+
+    def test_version_changes_with_the_document(self):
+        version: int = XmlFileService.get_version(self.__path)
+        with XmlFileService.session():
+            self.__set_item("b")
+            self.assertNotEqual(version, XmlFileService.get_version(self.__path))
+
+    def test_unchanged_file_is_parsed_once(self):
+        root: Element = self.__service.read(self.__path)
+        self.assertIs(root, self.__service.read(self.__path))
+        self.assertEqual(1, self.__get_parses())
+
+    def test_file_with_another_modification_date_is_parsed_again(self):
+        root: Element = self.__service.read(self.__path)
+        stat: os.stat_result = os.stat(self.__path)
+        os.utime(self.__path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        self.assertIsNot(root, self.__service.read(self.__path))
+        self.assertEqual(2, self.__get_parses())
+
+    def test_file_with_another_size_is_parsed_again(self):
+        root: Element = self.__service.read(self.__path)
+        stat: os.stat_result = os.stat(self.__path)
+        with open(self.__path, "w") as writer:
+            writer.write("<root><item>ab</item></root>")
+        # The modification date is kept: only the size tells the change.
+        os.utime(self.__path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertIsNot(root, self.__service.read(self.__path))
+        self.assertEqual("ab", self.__service.read(self.__path).find("item").text)
+
+    def test_replaced_file_is_parsed_again(self):
+        root: Element = self.__service.read(self.__path)
+        stat: os.stat_result = os.stat(self.__path)
+        other: str = os.path.join(self.__folder.name, "other.xml")
+        with open(other, "w") as writer:
+            writer.write("<root><item>b</item></root>")
+        # The modification date and the size are kept: only the inode tells the change.
+        os.utime(other, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(other, self.__path)
+        self.assertIsNot(root, self.__service.read(self.__path))
+        self.assertEqual("b", self.__service.read(self.__path).find("item").text)
+
+    def test_unchanged_document_is_not_written(self):
+        # The document is written once in the format of the service.
+        self.__service.write(self.__service.read(self.__path), self.__path)
+        stat: os.stat_result = os.stat(self.__path)
+        StatsHelper.reset()
+
+        self.__service.write(self.__service.read(self.__path), self.__path)
+        self.assertEqual(stat.st_mtime_ns, os.stat(self.__path).st_mtime_ns)
+        counters: dict[str, dict[str, int]] = StatsHelper.get_counters()
+        self.assertEqual({"DocumentService": 1}, counters.get("XML unchanged writes"))
+        self.assertNotIn("XML writes", counters.keys())
+
+    def test_changed_document_is_written(self):
+        self.__set_item("b")
+        self.assertEqual("b", self.__read_file_item())
+        self.assertEqual({"DocumentService": 1}, StatsHelper.get_counters().get("XML writes"))
+
+    def __set_item(self, value: str):
+        """
+        Modifies the item of the document through the service.
+        :param value: The new value of the item.
+        """
+        root: Element = self.__service.read(self.__path)
+        root.find("item").text = value
+        self.__service.write(root, self.__path)
+
+    def __read_file_item(self) -> str:
+        """
+        Reads the item of the document on the disk, without the service.
+        :return: The value of the item.
+        """
+        with open(self.__path, "r") as reader:
+            content: str = reader.read()
+        return content[content.index("<item>") + len("<item>"):content.index("</item>")]
+
+    @staticmethod
+    def __get_parses() -> int:
+        """
+        Gets the number of documents parsed since the statistics were enabled.
+        :return: The number of parses.
+        """
+        return sum(StatsHelper.get_counters().get("XML parses", {}).values())
+
+
+if __name__ == "__main__":
+    unittest.main()